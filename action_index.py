@@ -0,0 +1,66 @@
+"""회의록 액션아이템 색인
+
+(페이지 ID, 버전 번호)를 키로 파싱된 액션아이템을 SQLite 파일에 저장합니다.
+일일 DM 스크립트는 페이지 목록과 버전만 가볍게 조회한 뒤, 새로 생겼거나 버전이
+바뀐 페이지의 본문만 다시 받아 파싱하고 나머지는 색인에서 그대로 읽습니다.
+"""
+
+import json
+import threading
+import time
+from typing import Dict, List, Optional
+
+import config
+from sqlite_store import connect
+
+
+# 파싱 규칙이 바뀌면 올려서 기존 색인을 버리고 다시 파싱하게 함
+PARSER_VERSION = 2
+
+
+class ActionItemIndex:
+    """페이지별 파싱 결과 저장소"""
+
+    def __init__(self, path: str = None):
+        self.path = str(path or config.ACTION_INDEX_PATH)
+        self._lock = threading.Lock()
+        self._init_db()
+
+    def _init_db(self):
+        with self._lock, connect(self.path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS pages (
+                    page_id TEXT PRIMARY KEY,
+                    version INTEGER NOT NULL,
+                    items TEXT NOT NULL,
+                    indexed_at REAL NOT NULL
+                )
+            """)
+            if conn.execute("PRAGMA user_version").fetchone()[0] != PARSER_VERSION:
+                conn.execute("DELETE FROM pages")
+                conn.execute(f"PRAGMA user_version = {PARSER_VERSION}")
+
+    def get(self, page_id: str, version: int) -> Optional[List[Dict]]:
+        """해당 버전으로 색인된 액션아이템 반환 (없거나 버전이 다르면 None)"""
+        with self._lock, connect(self.path) as conn:
+            row = conn.execute(
+                "SELECT items FROM pages WHERE page_id = ? AND version = ?", (str(page_id), version)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, page_id: str, version: int, items: List[Dict]):
+        """페이지의 파싱 결과 저장 (이전 버전은 덮어씀)"""
+        with self._lock, connect(self.path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?)",
+                (str(page_id), version, json.dumps(items, ensure_ascii=False), time.time())
+            )
+
+    def prune(self, max_age_days: float):
+        """오래전에 색인된 페이지 제거
+
+        색인 시각은 항상 페이지 작성 시각 이후이므로, 검색 범위(SEARCH_DAYS)보다
+        오래된 항목은 더 이상 검색 결과에 나오지 않는 페이지입니다.
+        """
+        with self._lock, connect(self.path) as conn:
+            conn.execute("DELETE FROM pages WHERE indexed_at < ?", (time.time() - max_age_days * 86400,))
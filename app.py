@@ -4,13 +4,23 @@
 """
 
 import streamlit as st
-import base64
+import re
+import time
 from datetime import datetime
 import requests
 from openai import OpenAI
 import config
-from utils import markdown_to_confluence_storage, extract_action_items_count
+import metrics
+from llm_cache import CachedOpenAI, LLMCache
+from http_client import HttpClient
+from confluence_api import ACTION_ITEMS_PROPERTY_KEY, TitleCache, content_property, cql_quote, iter_cql_search, save_content_property
+from slack_directory import ChannelDirectory, SlackApiError
+from slack_dispatch import SlackDispatcher
+from utils import markdown_to_confluence_storage, read_task_states, normalize_storage, build_action_items_property, extract_action_items_count, format_action_item_line, replace_markdown_section, estimate_tokens, split_notes_into_chunks, next_free_title
+import pipeline
+from pipeline import Stage, run_stages
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 # 페이지 설정
 st.set_page_config(
@@ -22,11 +32,44 @@ st.set_page_config(
 # OpenAI 클라이언트
 @st.cache_resource
 def get_openai_client():
-    return OpenAI(api_key=config.OPENAI_API_KEY)
+    # 동일한 요청은 디스크 캐시에서 응답 (main.py CLI와 캐시 파일 공유)
+    return CachedOpenAI(OpenAI(api_key=config.OPENAI_API_KEY), LLMCache())
 
 client = get_openai_client()
 
 
+# Confluence/Slack HTTP 클라이언트 (keep-alive Session 풀)
+@st.cache_resource
+def get_http_client():
+    return HttpClient()
+
+http = get_http_client()
+
+
+# 공간별 페이지 제목 캐시 (연속 발행 시 재조회 방지)
+@st.cache_resource
+def get_title_cache():
+    return TitleCache()
+
+title_cache = get_title_cache()
+
+
+# Slack 채널 디렉터리 (채널명 → ID 색인, 디스크 캐시)
+@st.cache_resource
+def get_channel_directory():
+    return ChannelDirectory(http)
+
+channel_directory = get_channel_directory()
+
+
+# Slack 발송 (메서드별 속도 제한, 429 재시도)
+@st.cache_resource
+def get_slack_dispatcher():
+    return SlackDispatcher(http)
+
+slack_dispatcher = get_slack_dispatcher()
+
+
 # 설정 저장/로드 함수 (로컬 JSON 파일 사용)
 import os
 from pathlib import Path
@@ -63,8 +106,12 @@ def load_user_config() -> dict:
     }
 
 
-def generate_title(meeting_notes: str, meeting_date: str = "") -> str:
-    """회의 내용에서 제목 자동 생성 (날짜 제외)"""
+@metrics.timed("generate_title")
+def generate_title(meeting_notes: str, meeting_date: str = "", bypass_cache: bool = False, bundle: dict = None) -> str:
+    """회의 내용에서 제목 자동 생성 (날짜 제외)
+    
+    bundle(one-shot 결과)이 주어지면 추가 호출 없이 그 제목을 사용합니다.
+    """
     import re
     from datetime import datetime
     
@@ -90,17 +137,21 @@ def generate_title(meeting_notes: str, meeting_date: str = "") -> str:
             return f"{today} 회의록"
     
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {"role": "system", "content": config.SYSTEM_PROMPT_TITLE},
-                {"role": "user", "content": f"다음 회의 내용의 제목을 생성해주세요:\n\n{meeting_notes[:500]}"}
-            ],
-            temperature=0.3,
-            max_tokens=100
-        )
-        
-        title = response.choices[0].message.content.strip()
+        if bundle is not None:
+            title = bundle.get('title', '').strip()
+        else:
+            response = client.chat.completions.create(
+                model="gpt-4o",
+                messages=[
+                    {"role": "system", "content": config.SYSTEM_PROMPT_TITLE},
+                    {"role": "user", "content": f"다음 회의 내용의 제목을 생성해주세요:\n\n{meeting_notes[:500]}"}
+                ],
+                temperature=0.3,
+                max_tokens=100,
+                bypass_cache=bypass_cache
+            )
+            
+            title = response.choices[0].message.content.strip()
         
         # 혹시 날짜가 포함되어 있으면 제거
         title = re.sub(r'^\d{4}[-년./]\d{1,2}[-월./]\d{1,2}[일]?\s*', '', title)
@@ -125,8 +176,107 @@ def generate_title(meeting_notes: str, meeting_date: str = "") -> str:
             return f"{today} 회의록"
 
 
-def structure_meeting_notes(meeting_title: str, attendees: str, meeting_date: str, meeting_notes: str, action_items_text: str = "") -> str:
-    """회의록을 구조화"""
+def _extract_chunk_points(chunk: str, bypass_cache: bool = False) -> dict:
+    """긴 회의록의 한 조각에서 업데이트·논의·결정·액션아이템 추출 (map 단계)"""
+    response = client.chat.completions.create(
+        model="gpt-4o",
+        messages=[
+            {"role": "system", "content": config.SYSTEM_PROMPT_CHUNK_EXTRACT},
+            {"role": "user", "content": f"다음 회의 내용 일부에서 항목을 추출해주세요:\n\n{chunk}"}
+        ],
+        temperature=0.3,
+        max_tokens=1500,
+        response_format={"type": "json_object"},
+        bypass_cache=bypass_cache
+    )
+    try:
+        result = json.loads(response.choices[0].message.content)
+        return result if isinstance(result, dict) else {}
+    except Exception as e:
+        print(f"조각 추출 실패: {e}")
+        return {}
+
+
+def _dedupe_key(text: str) -> str:
+    return re.sub(r'\s+', ' ', text).strip().lower()
+
+
+def _merge_chunk_points(chunk_results: list) -> dict:
+    """조각별 추출 결과를 합치고 중복 제거 (담당자·마감일이 있는 액션아이템 우선)"""
+    merged = {"updates": [], "discussion_points": [], "decisions": [], "action_items": []}
+    seen = {key: set() for key in ("updates", "discussion_points", "decisions")}
+    action_index = {}
+    
+    for result in chunk_results:
+        for key in seen:
+            for point in result.get(key) or []:
+                if not isinstance(point, str) or not point.strip():
+                    continue
+                dedupe_key = _dedupe_key(point)
+                if dedupe_key not in seen[key]:
+                    seen[key].add(dedupe_key)
+                    merged[key].append(point.strip())
+        
+        for item in result.get('action_items') or []:
+            if not isinstance(item, dict) or not (item.get('task') or '').strip():
+                continue
+            dedupe_key = _dedupe_key(item['task'])
+            existing = action_index.get(dedupe_key)
+            if existing is None:
+                action_index[dedupe_key] = dict(item)
+                merged['action_items'].append(action_index[dedupe_key])
+            else:
+                # 같은 작업이면 비어 있는(TBD) 담당자·마감일만 보완
+                for field in ('assignee', 'due'):
+                    if (existing.get(field) or 'TBD') == 'TBD' and (item.get(field) or 'TBD') != 'TBD':
+                        existing[field] = item[field]
+    
+    merged['action_items'] = _normalize_action_items(merged['action_items'])
+    return merged
+
+
+def map_long_meeting_notes(meeting_notes: str, bypass_cache: bool = False) -> dict:
+    """긴 회의 내용을 섹션·문단 단위로 나눠 병렬 추출한 뒤 병합
+    
+    조각별 요청은 LLM 캐시에 저장되므로 구조화와 액션아이템 추출이 같은 결과를 재사용합니다.
+    """
+    chunks = split_notes_into_chunks(meeting_notes, config.CHUNK_MAX_TOKENS)
+    with ThreadPoolExecutor(max_workers=config.CHUNK_WORKERS) as executor:
+        chunk_results = list(executor.map(metrics.bind(lambda chunk: _extract_chunk_points(chunk, bypass_cache)), chunks))
+    return _merge_chunk_points(chunk_results)
+
+
+def is_long_meeting_notes(meeting_notes: str) -> bool:
+    """map-reduce 처리 대상인지 판단 (토큰 수 기준)"""
+    return estimate_tokens(meeting_notes) > config.LONG_NOTES_TOKEN_THRESHOLD
+
+
+def _condense_meeting_notes(meeting_notes: str, bypass_cache: bool = False) -> str:
+    """긴 회의 내용이면 조각별 추출 결과를 요약 노트로 압축 (reduce 단계 입력)"""
+    if not is_long_meeting_notes(meeting_notes):
+        return meeting_notes
+    
+    merged = map_long_meeting_notes(meeting_notes, bypass_cache)
+    sections = [
+        ("주요 업데이트", merged['updates']),
+        ("논의 내용", merged['discussion_points']),
+        ("결정 사항", merged['decisions']),
+    ]
+    lines = ["(긴 회의 내용을 구간별로 추출해 합친 노트입니다. 중복되는 항목은 하나로 합쳐주세요.)", ""]
+    for heading, points in sections:
+        if points:
+            lines.append(f"## {heading}")
+            lines.extend(f"- {point}" for point in points)
+            lines.append("")
+    if merged['action_items']:
+        lines.append("## 회의 중 언급된 액션아이템")
+        for i, item in enumerate(merged['action_items'], 1):
+            lines.append(f"{i}. 작업: {item['task']} | 담당자: {item['assignee']} | 마감일: {item['due']}")
+    return '\n'.join(lines)
+
+
+def _build_structure_messages(meeting_title: str, attendees: str, meeting_date: str, meeting_notes: str, action_items_text: str = "") -> list:
+    """회의록 구조화 프롬프트 구성"""
     
     # 참석자와 날짜 정보를 회의 내용에 추가
     full_content = f"""회의명: {meeting_title}
@@ -137,86 +287,182 @@ def structure_meeting_notes(meeting_title: str, attendees: str, meeting_date: st
 {meeting_notes}
 {action_items_text}"""
     
+    return [
+        {"role": "system", "content": config.SYSTEM_PROMPT_STRUCTURE},
+        {"role": "user", "content": f"다음 회의 내용을 위 형식으로 정리해주세요:\n\n{full_content}"}
+    ]
+
+
+@metrics.timed("structure_meeting_notes")
+def structure_meeting_notes(meeting_title: str, attendees: str, meeting_date: str, meeting_notes: str, action_items_text: str = "", bypass_cache: bool = False, bundle: dict = None) -> str:
+    """회의록을 구조화 (bundle이 주어지면 one-shot 결과를 그대로 사용)"""
+    if bundle is not None:
+        return bundle['structured_markdown']
+    
+    # 긴 회의 내용은 조각별 추출(map) 후 병합된 노트로 구조화(reduce)
+    meeting_notes = _condense_meeting_notes(meeting_notes, bypass_cache)
+    
     response = client.chat.completions.create(
         model="gpt-4o",  # GPT-4o로 업그레이드!
-        messages=[
-            {"role": "system", "content": config.SYSTEM_PROMPT_STRUCTURE},
-            {"role": "user", "content": f"다음 회의 내용을 위 형식으로 정리해주세요:\n\n{full_content}"}
-        ],
+        messages=_build_structure_messages(meeting_title, attendees, meeting_date, meeting_notes, action_items_text),
         temperature=0.3,
-        max_tokens=3000
+        max_tokens=3000,
+        bypass_cache=bypass_cache
     )
     return response.choices[0].message.content
 
 
-def _get_unique_title(base_title: str, username: str, token: str, space_key: str) -> str:
-    """중복되지 않는 고유한 제목 생성"""
-    import requests
-    import base64
+def stream_structure_meeting_notes(meeting_title: str, attendees: str, meeting_date: str, meeting_notes: str, action_items_text: str = "", bypass_cache: bool = False):
+    """회의록을 구조화 (스트리밍) - 토큰이 도착하는 대로 텍스트 조각을 yield
     
-    auth_string = f"{username}:{token}"
-    auth_bytes = auth_string.encode('ascii')
-    auth_b64 = base64.b64encode(auth_bytes).decode('ascii')
+    조각을 모두 이어 붙이면 structure_meeting_notes()와 같은 최종 문자열이 됩니다.
+    계측 단계는 호출하는 쪽이 소비 루프를 감싸 엽니다 (제너레이터 안에서 열면 yield 사이에
+    호출하는 쪽 코드까지 같은 단계로 기록되고, 중간에 버려질 때 시간이 잘못 기록됨).
+    """
+    meeting_notes = _condense_meeting_notes(meeting_notes, bypass_cache)
     
-    headers = {
-        "Authorization": f"Basic {auth_b64}",
-        "Content-Type": "application/json"
-    }
+    stream = client.chat.completions.create(
+        model="gpt-4o",
+        messages=_build_structure_messages(meeting_title, attendees, meeting_date, meeting_notes, action_items_text),
+        temperature=0.3,
+        max_tokens=3000,
+        stream=True,
+        stream_options={"include_usage": True},
+        bypass_cache=bypass_cache
+    )
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if delta:
+            yield delta
+
+
+@metrics.timed("_get_unique_title")
+def _get_unique_title(base_title: str, username: str, token: str, space_key: str) -> str:
+    """중복되지 않는 고유한 제목 생성
     
-    # 현재 제목으로 검색
-    search_url = f"{config.CONFLUENCE_URL}/wiki/rest/api/content"
-    params = {
-        "title": base_title,
-        "spaceKey": space_key,
-        "expand": "title"
-    }
+    공간에서 base_title로 시작하는 제목을 CQL 한 번(페이지네이션 포함)으로 모두 가져와
+    다음 빈 번호를 로컬에서 계산합니다. 조회 결과는 잠시 캐시합니다.
+    """
+    existing_titles = title_cache.get(space_key, base_title)
     
-    try:
-        response = requests.get(search_url, headers=headers, params=params)
-        if response.status_code == 200:
-            results = response.json()
-            if results.get('results'):
-                # 중복이 있으면 숫자 추가
-                counter = 2
-                while True:
-                    new_title = f"{base_title} ({counter})"
-                    params['title'] = new_title
-                    response = requests.get(search_url, headers=headers, params=params)
-                    if response.status_code == 200:
-                        results = response.json()
-                        if not results.get('results'):
-                            return new_title
-                    counter += 1
-                    if counter > 100:  # 무한 루프 방지
-                        break
-        
-        return base_title
-        
-    except Exception:
-        return base_title
+    if existing_titles is None:
+        cql = f"space = {cql_quote(space_key)} AND type = page AND title ~ {cql_quote(base_title)}"
+        try:
+            existing_titles = {
+                page.get('title', '')
+                for page in iter_cql_search(http.confluence(username, token), cql, limit=200)
+            }
+        except Exception as e:
+            print(f"제목 중복 확인 실패: {e}")
+            metrics.note(ok=False, error=type(e).__name__)
+            return base_title
+        title_cache.put(space_key, base_title, existing_titles)
+    
+    return next_free_title(base_title, existing_titles)
 
 
-def upload_to_confluence(title: str, content: str, meeting_date: str, username: str, token: str, space_key: str, parent_id: str = None) -> dict:
-    """Confluence에 페이지 생성"""
-    auth_string = f"{username}:{token}"
-    auth_bytes = auth_string.encode('ascii')
-    auth_b64 = base64.b64encode(auth_bytes).decode('ascii')
-    
-    # 제목 형식: YYYY-MM-DD 회의명 – 회의록
-    page_title = f"{meeting_date} {title} – 회의록"
+# 변환 단계 계측용 (utils 함수 자체는 계측 없이 유지)
+convert_to_storage = metrics.timed("markdown_to_confluence_storage")(markdown_to_confluence_storage)
+
+
+def build_page_title(title: str, meeting_date: str) -> str:
+    """페이지 제목 생성 (형식: YYYY-MM-DD 회의명 – 회의록)"""
+    return f"{meeting_date} {title} – 회의록"
+
+
+def upload_to_confluence(title: str, content: str, meeting_date: str, username: str, token: str, space_key: str, parent_id: str = None, update_existing: bool = False) -> dict:
+    """Confluence에 페이지 생성
     
-    # 중복 제목 처리
-    page_title = _get_unique_title(page_title, username, token, space_key)
+    update_existing이면 같은 제목의 페이지가 있을 때 새 페이지 대신 그 페이지를 새 버전으로 갱신합니다.
+    """
+    base_title = build_page_title(title, meeting_date)
+    if update_existing:
+        existing = find_confluence_page(base_title, username, token, space_key)
+        if existing:
+            html_content = markdown_to_confluence_storage(content, existing_task_states(existing))
+            return update_confluence_page(existing, html_content, username, token)
+        # 같은 제목이 없으므로 번호를 붙일 필요 없음
+        page_title = base_title
+    else:
+        # 중복 제목 처리
+        page_title = _get_unique_title(base_title, username, token, space_key)
     
     # Confluence Storage Format으로 변환
     html_content = markdown_to_confluence_storage(content)
     
+    return create_confluence_page(page_title, html_content, username, token, space_key, parent_id)
+
+
+@metrics.timed("find_confluence_page")
+def find_confluence_page(page_title: str, username: str, token: str, space_key: str) -> dict:
+    """공간에서 제목이 정확히 같은 페이지 조회 (본문·버전 포함, 없으면 None)"""
     url = f"{config.CONFLUENCE_URL}/wiki/rest/api/content"
-    headers = {
-        "Authorization": f"Basic {auth_b64}",
-        "Content-Type": "application/json"
+    params = {
+        "title": page_title,
+        "spaceKey": space_key,
+        "type": "page",
+        "expand": f"body.storage,version,metadata.properties.{ACTION_ITEMS_PROPERTY_KEY}"
+    }
+    response = http.confluence(username, token).get(url, params=params)
+    metrics.note(http_status=response.status_code)
+    response.raise_for_status()
+    results = response.json().get('results', [])
+    return results[0] if results else None
+
+
+def existing_task_states(page: dict) -> dict:
+    """기존 페이지의 task 완료 상태 (페이지가 없으면 None)"""
+    if not page:
+        return None
+    return read_task_states(page['body']['storage']['value'])
+
+
+@metrics.timed("update_confluence_page")
+def update_confluence_page(page: dict, html_content: str, username: str, token: str) -> dict:
+    """기존 페이지를 새 버전으로 PUT (본문이 같으면 보내지 않음)"""
+    page_url = f"{config.CONFLUENCE_URL}/wiki{page['_links']['webui']}"
+    if normalize_storage(page['body']['storage']['value']) == normalize_storage(html_content):
+        # 이전 버전 기능으로 올린 페이지이거나 체크박스가 바뀌었으면 property만 현재 본문 기준으로 갱신
+        saved = content_property(page, ACTION_ITEMS_PROPERTY_KEY)
+        if not saved or saved.get('page_version') != page['version']['number']:
+            save_action_items_property(page, page['body']['storage']['value'], username, token)
+        return {"success": True, "url": page_url, "data": page, "unchanged": True}
+    
+    url = f"{config.CONFLUENCE_URL}/wiki/rest/api/content/{page['id']}"
+    payload = {
+        "id": page['id'],
+        "type": "page",
+        "title": page['title'],
+        "version": {
+            "number": page['version']['number'] + 1
+        },
+        "body": {
+            "storage": {
+                "value": html_content,
+                "representation": "storage"
+            }
+        }
     }
     
+    response = http.confluence(username, token).put(url, json=payload)
+    metrics.note(http_status=response.status_code)
+    
+    if response.status_code == 200:
+        result = response.json()
+        save_action_items_property(result, html_content, username, token)
+        return {"success": True, "url": f"{config.CONFLUENCE_URL}/wiki{result['_links']['webui']}", "data": result, "unchanged": False}
+    else:
+        # 409: 조회 후 다른 사람이 먼저 수정함
+        return {"success": False, "error": response.text}
+
+
+@metrics.timed("upload_to_confluence")
+def create_confluence_page(page_title: str, html_content: str, username: str, token: str, space_key: str, parent_id: str = None) -> dict:
+    """이미 변환된 Storage Format 본문으로 Confluence 페이지 POST"""
+    url = f"{config.CONFLUENCE_URL}/wiki/rest/api/content"
+    
     payload = {
         "type": "page",
         "title": page_title,
@@ -235,18 +481,41 @@ def upload_to_confluence(title: str, content: str, meeting_date: str, username:
     if parent_id and parent_id.strip():
         payload["ancestors"] = [{"id": parent_id.strip()}]
     
-    response = requests.post(url, json=payload, headers=headers)
+    response = http.confluence(username, token).post(url, json=payload)
+    metrics.note(http_status=response.status_code)
     
     if response.status_code in [200, 201]:
         result = response.json()
         page_url = f"{config.CONFLUENCE_URL}/wiki{result['_links']['webui']}"
+        # 연속 발행 시 방금 만든 제목도 중복으로 인식하도록 캐시에 반영
+        title_cache.add(space_key, page_title)
+        save_action_items_property(result, html_content, username, token)
         return {"success": True, "url": page_url, "data": result}
     else:
         return {"success": False, "error": response.text}
 
 
-def create_slack_summary(structured_content: str) -> str:
-    """Slack용 요약 생성"""
+@metrics.timed("save_action_items_property")
+def save_action_items_property(page: dict, html_content: str, username: str, token: str):
+    """발행한 본문의 task 목록을 페이지 content property로 저장
+    
+    일일 DM이 본문 대신 이 property만 읽도록 하기 위한 것으로, 실패해도 발행은
+    성공으로 둡니다 (DM은 본문 파싱으로 대신함).
+    """
+    value = build_action_items_property(html_content, page['version']['number'])
+    try:
+        save_content_property(http.confluence(username, token), page['id'], ACTION_ITEMS_PROPERTY_KEY, value)
+    except Exception as e:
+        print(f"액션아이템 property 저장 실패: {e}")
+        metrics.note(ok=False, error=type(e).__name__)
+
+
+@metrics.timed("create_slack_summary")
+def create_slack_summary(structured_content: str, bypass_cache: bool = False, bundle: dict = None) -> str:
+    """Slack용 요약 생성 (bundle이 주어지면 one-shot 결과를 그대로 사용)"""
+    if bundle is not None:
+        return bundle['slack_summary']
+    
     response = client.chat.completions.create(
         model="gpt-4o",
         messages=[
@@ -254,13 +523,22 @@ def create_slack_summary(structured_content: str) -> str:
             {"role": "user", "content": f"다음 회의록을 요약해주세요:\n\n{structured_content}"}
         ],
         temperature=0.3,
-        max_tokens=1000
+        max_tokens=1000,
+        bypass_cache=bypass_cache
     )
     return response.choices[0].message.content
 
 
-def extract_action_items_from_notes(meeting_notes: str) -> list:
-    """회의 내용에서 액션아이템 자동 추출"""
+@metrics.timed("extract_action_items_from_notes")
+def extract_action_items_from_notes(meeting_notes: str, bypass_cache: bool = False, bundle: dict = None) -> list:
+    """회의 내용에서 액션아이템 자동 추출 (bundle이 주어지면 one-shot 결과를 그대로 사용)"""
+    if bundle is not None:
+        return _normalize_action_items([dict(item) for item in bundle.get('action_items', [])])
+    
+    # 긴 회의 내용은 조각별로 병렬 추출 후 병합·중복 제거
+    if is_long_meeting_notes(meeting_notes):
+        return map_long_meeting_notes(meeting_notes, bypass_cache)['action_items']
+    
     prompt = """다음 회의 내용에서 **모든 실행 가능한 작업(액션아이템)**을 적극적으로 추출해주세요.
 
 **액션아이템 정의:**
@@ -308,7 +586,8 @@ def extract_action_items_from_notes(meeting_notes: str) -> list:
             {"role": "user", "content": prompt + meeting_notes}
         ],
         temperature=0.4,
-        max_tokens=2000
+        max_tokens=2000,
+        bypass_cache=bypass_cache
     )
     
     import json
@@ -325,13 +604,7 @@ def extract_action_items_from_notes(meeting_notes: str) -> list:
         result = json.loads(content)
         
         if isinstance(result, list):
-            # TBD 값 정규화
-            for item in result:
-                if not item.get('assignee') or item['assignee'].strip() == '':
-                    item['assignee'] = 'TBD'
-                if not item.get('due') or item['due'].strip() == '':
-                    item['due'] = 'TBD'
-            return result
+            return _normalize_action_items(result)
         return []
     except Exception as e:
         print(f"액션아이템 추출 실패: {e}")
@@ -339,21 +612,90 @@ def extract_action_items_from_notes(meeting_notes: str) -> list:
         return []
 
 
+def _normalize_action_items(items: list) -> list:
+    """TBD 값 정규화"""
+    for item in items:
+        if not item.get('assignee') or item['assignee'].strip() == '':
+            item['assignee'] = 'TBD'
+        if not item.get('due') or item['due'].strip() == '':
+            item['due'] = 'TBD'
+    return items
+
+
+def bundle_inputs_key(meeting_title: str, attendees: str, meeting_date: str, meeting_notes: str) -> tuple:
+    """one-shot 결과를 만든 입력 (입력이 바뀌었는지 비교용)"""
+    return (meeting_title, attendees, meeting_date, meeting_notes)
+
+
+@metrics.timed("generate_meeting_bundle")
+def generate_meeting_bundle(meeting_title: str, attendees: str, meeting_date: str, meeting_notes: str, bypass_cache: bool = False) -> dict:
+    """one-shot 모드: 제목·구조화 회의록·액션아이템·Slack 요약을 한 번의 호출로 생성
+    
+    회의 내용을 한 번만 전송하므로 입력 토큰과 대기 시간이 호출 수만큼 줄어듭니다.
+    결과는 generate_title / structure_meeting_notes / extract_action_items_from_notes /
+    create_slack_summary에 bundle 인자로 넘겨 사용합니다.
+    """
+    full_content = f"""회의명: {meeting_title or '(회의 내용으로 제목을 생성해 title과 회의명에 함께 사용)'}
+일시: {meeting_date}
+참석자: {attendees}
+
+회의 내용:
+{meeting_notes}"""
+    
+    response = client.chat.completions.create(
+        model="gpt-4o",
+        messages=[
+            {"role": "system", "content": config.SYSTEM_PROMPT_BUNDLE},
+            {"role": "user", "content": f"다음 회의 내용을 정리해주세요:\n\n{full_content}"}
+        ],
+        temperature=0.3,
+        max_tokens=4000,
+        response_format={
+            "type": "json_schema",
+            "json_schema": {"name": "meeting_bundle", "strict": True, "schema": config.MEETING_BUNDLE_SCHEMA}
+        },
+        bypass_cache=bypass_cache
+    )
+    return json.loads(response.choices[0].message.content)
+
+
+def _action_item_fields(action_items: list) -> list:
+    """편집 여부 비교용 (빈 항목 제외, 작업·담당자·마감일·상태)"""
+    return [
+        (item.get('task', '').strip(), item.get('assignee', '').strip(), item.get('due', '').strip().replace('/', '-'), item.get('status', 'incomplete'))
+        for item in action_items if item.get('task', '').strip()
+    ]
+
+
+def apply_action_items_to_bundle(bundle: dict, action_items: list):
+    """사용자가 편집한 액션아이템을 one-shot 결과에 반영
+    
+    회의록의 '# 액션아이템' 섹션과 Slack 요약의 건수를 다시 계산합니다.
+    항목이 생성 결과와 같으면(사용자가 고치지 않았으면) 모델이 쓴 섹션을 그대로 둡니다.
+    섹션을 찾지 못하면 None을 반환하며, 이때는 기존 다중 호출 경로로 진행합니다.
+    """
+    if _action_item_fields(action_items) == _action_item_fields(_normalize_action_items([dict(item) for item in bundle.get('action_items', [])])):
+        return bundle
+    items_markdown = '\n'.join(format_action_item_line(item) for item in action_items if item.get('task', '').strip())
+    structured_markdown = replace_markdown_section(bundle['structured_markdown'], '액션아이템', items_markdown)
+    if structured_markdown is None:
+        return None
+    
+    complete, incomplete = extract_action_items_count(structured_markdown)
+    slack_summary = re.sub(
+        r'총\s*\d+\s*건\s*\(완료\s*\d+\s*건,\s*미완료\s*\d+\s*건\)',
+        f'총 {complete + incomplete}건 (완료 {complete}건, 미완료 {incomplete}건)',
+        bundle['slack_summary']
+    )
+    return dict(bundle, structured_markdown=structured_markdown, slack_summary=slack_summary, action_items=action_items)
+
+
 def validate_confluence_settings(username: str, token: str, space_key: str) -> dict:
     """Confluence 설정 유효성 검증"""
     try:
-        auth_string = f"{username}:{token}"
-        auth_bytes = auth_string.encode('ascii')
-        auth_b64 = base64.b64encode(auth_bytes).decode('ascii')
-        
-        headers = {
-            "Authorization": f"Basic {auth_b64}",
-            "Content-Type": "application/json"
-        }
-        
         # 공간 정보 조회로 접근 가능 여부 확인
         url = f"{config.CONFLUENCE_URL}/wiki/rest/api/space/{space_key}"
-        response = requests.get(url, headers=headers, timeout=10)
+        response = http.confluence(username, token).get(url, timeout=10)
         
         if response.status_code == 200:
             space_data = response.json()
@@ -374,38 +716,9 @@ def validate_confluence_settings(username: str, token: str, space_key: str) -> d
 
 
 def validate_slack_channel(channel: str) -> dict:
-    """Slack 채널 유효성 검증"""
+    """Slack 채널 유효성 검증 (채널 디렉터리 색인 사용)"""
     try:
-        # # 제거 (API는 #없이 사용)
-        channel_clean = channel.lstrip('#')
-        
-        url = "https://slack.com/api/conversations.info"
-        headers = {
-            "Authorization": f"Bearer {config.SLACK_BOT_TOKEN}",
-            "Content-Type": "application/json"
-        }
-        
-        # 채널 ID로 조회 (채널명 입력 시 검색)
-        # 먼저 채널 목록에서 이름으로 찾기
-        list_url = "https://slack.com/api/conversations.list"
-        list_params = {"types": "public_channel,private_channel", "limit": 1000}
-        list_response = requests.get(list_url, headers=headers, params=list_params, timeout=10)
-        list_result = list_response.json()
-        
-        if not list_result.get("ok"):
-            error = list_result.get('error', 'unknown_error')
-            if error == "invalid_auth":
-                return {"success": False, "error": "Slack Bot Token이 유효하지 않습니다"}
-            return {"success": False, "error": f"Slack API 오류: {error}"}
-        
-        # 채널 이름으로 검색
-        channels = list_result.get('channels', [])
-        matching_channel = None
-        
-        for ch in channels:
-            if ch.get('name') == channel_clean or ch.get('id') == channel_clean:
-                matching_channel = ch
-                break
+        matching_channel = channel_directory.lookup(channel)
         
         if matching_channel:
             channel_name = matching_channel.get('name')
@@ -417,35 +730,29 @@ def validate_slack_channel(channel: str) -> dict:
                     "error": f"채널 '#{channel_name}'을 찾았지만 Bot이 멤버가 아닙니다.\n채널에서 `/invite @회의록봇` 명령을 실행해주세요"
                 }
             
-            return {"success": True, "channel_name": channel_name}
+            return {"success": True, "channel_name": channel_name, "channel_id": matching_channel['id']}
         else:
             return {"success": False, "error": f"채널 '{channel}'을 찾을 수 없습니다. 채널명을 확인해주세요"}
             
+    except SlackApiError as e:
+        if e.error == "invalid_auth":
+            return {"success": False, "error": "Slack Bot Token이 유효하지 않습니다"}
+        return {"success": False, "error": f"Slack API 오류: {e.error}"}
     except requests.exceptions.Timeout:
         return {"success": False, "error": "연결 시간 초과: Slack 서버 응답이 없습니다"}
     except Exception as e:
         return {"success": False, "error": f"오류 발생: {str(e)}"}
 
 
+@metrics.timed("send_to_slack")
 def send_to_slack(summary: str, channel: str, confluence_url: str = None) -> dict:
     """Slack 채널에 메시지 전송"""
     message = summary
     if confluence_url:
         message += f"\n\n---\n📄 *전체 회의록:* {confluence_url}"
     
-    url = "https://slack.com/api/chat.postMessage"
-    headers = {
-        "Authorization": f"Bearer {config.SLACK_BOT_TOKEN}",
-        "Content-Type": "application/json"
-    }
-    
-    payload = {
-        "channel": channel.lstrip('#'),  # # 제거
-        "text": message
-    }
-    
-    response = requests.post(url, json=payload, headers=headers)
-    result = response.json()
+    # 채널명 → 채널 ID, 속도 제한·재시도는 dispatcher가 처리
+    result = slack_dispatcher.post_message(channel_directory.resolve_id(channel), message)
     
     if result.get("ok"):
         return {"success": True}
@@ -525,6 +832,12 @@ with st.form("meeting_form"):
         help="자유롭게 작성하세요. AI가 자동으로 구조화합니다."
     )
     
+    one_shot = st.checkbox(
+        "⚡ 빠른 모드 (one-shot): 제목·회의록·액션아이템·요약을 AI 호출 한 번으로 생성",
+        value=False,
+        help="회의 내용을 한 번만 전송해 시간과 비용을 줄입니다. 실패하면 기존 방식으로 자동 전환됩니다."
+    )
+    
     submitted = st.form_submit_button("다음 단계: 액션아이템 설정", use_container_width=True, type="primary")
 
 # 폼 제출 처리
@@ -549,10 +862,28 @@ if submitted:
         st.session_state.meeting_notes = meeting_notes
         st.session_state.form_submitted = True
         
+        # one-shot 결과는 만들 때의 입력과 함께 저장해, 입력이 바뀌면 다시 만들거나 버림
+        bundle_inputs = bundle_inputs_key(st.session_state.meeting_title, attendees_input, meeting_date_input, meeting_notes)
+        bypass_cache = st.session_state.get("bypass_llm_cache", False)
+        bundle = st.session_state.get('meeting_bundle')
+        if not one_shot:
+            bundle = None
+        elif bundle is None or st.session_state.get('meeting_bundle_inputs') != bundle_inputs:
+            bundle = None
+            with st.spinner("⚡ AI가 회의록 전체를 한 번에 작성하는 중..."):
+                try:
+                    bundle = generate_meeting_bundle(st.session_state.meeting_title, attendees_input, meeting_date_input, meeting_notes, bypass_cache=bypass_cache)
+                except Exception as e:
+                    # 실패 시 기존 다중 호출 방식으로 진행
+                    print(f"one-shot 생성 실패: {e}")
+                    st.warning("⚠️ 빠른 모드 생성에 실패하여 기존 방식으로 진행합니다.")
+        st.session_state.meeting_bundle = bundle
+        st.session_state.meeting_bundle_inputs = bundle_inputs
+        
         # 액션아이템 자동 추출 (첫 제출 시)
         if not st.session_state.auto_extracted:
             with st.spinner("🤖 AI가 액션아이템을 자동으로 추출하는 중..."):
-                extracted = extract_action_items_from_notes(meeting_notes)
+                extracted = extract_action_items_from_notes(meeting_notes, bypass_cache=bypass_cache, bundle=bundle)
                 st.session_state.action_items = extracted
                 st.session_state.auto_extracted = True
             st.rerun()
@@ -600,18 +931,26 @@ if st.session_state.get('form_submitted', False):
                         st.session_state.action_items.pop(i)
                         st.rerun()
                 
-                # 업데이트
-                st.session_state.action_items[i] = {
-                    "task": new_task,
-                    "assignee": new_assignee,
-                    "due": new_due.strftime('%Y-%m-%d')
-                }
+                # 업데이트 (one-shot 결과의 완료 상태 등 편집하지 않는 필드는 유지)
+                st.session_state.action_items[i] = dict(
+                    item,
+                    task=new_task,
+                    assignee=new_assignee,
+                    due=new_due.strftime('%Y-%m-%d')
+                )
     
     st.markdown("---")
     
     # 최종 생성 버튼과 처리
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
+        stream_output = st.checkbox("⚡ 회의록을 실시간으로 보기 (스트리밍)", value=True, key="stream_output")
+        update_existing = st.checkbox(
+            "♻️ 같은 제목의 기존 페이지 업데이트",
+            value=False,
+            key="update_existing",
+            help="수정한 회의록을 다시 발행할 때 \"(2)\" 페이지를 새로 만들지 않고 기존 페이지를 새 버전으로 갱신합니다. 페이지에서 체크한 완료 상태는 유지됩니다."
+        )
         generate_button = st.button("🚀 회의록 wiki문서 생성 및 Slack전송", use_container_width=True, type="primary")
     
     # 버튼 클릭 시 처리 (버튼 바로 아래에 표시)
@@ -622,6 +961,15 @@ if st.session_state.get('form_submitted', False):
         attendees = st.session_state.attendees
         meeting_notes = st.session_state.meeting_notes
         action_items = st.session_state.action_items
+        bypass_cache = st.session_state.get("bypass_llm_cache", False)
+        
+        # one-shot 결과가 있으면 편집된 액션아이템을 반영해 사용 (반영할 수 없으면 기존 방식)
+        # 지금 입력과 다른 입력으로 만든 결과면 쓰지 않음
+        bundle = st.session_state.get('meeting_bundle')
+        if st.session_state.get('meeting_bundle_inputs') != bundle_inputs_key(meeting_title, attendees, meeting_date, meeting_notes):
+            bundle = None
+        if bundle:
+            bundle = apply_action_items_to_bundle(bundle, action_items)
         
         # 설정 검증
         if not st.session_state.user_confluence_token or not st.session_state.user_confluence_space:
@@ -641,7 +989,7 @@ if st.session_state.get('form_submitted', False):
             if auto_title:
                 status_text.text("🤖 회의 제목 생성 중...")
                 progress_bar.progress(10)
-                meeting_title = generate_title(meeting_notes, meeting_date)
+                meeting_title = generate_title(meeting_notes, meeting_date, bypass_cache=bypass_cache, bundle=bundle)
                 st.info(f"✨ 생성된 제목: **{meeting_title}**")
                 progress_bar.progress(20)
             
@@ -657,11 +1005,41 @@ if st.session_state.get('form_submitted', False):
             # 1. 구조화
             status_text.text("📝 회의록 구조화 중...")
             progress_bar.progress(40)
-            structured_content = structure_meeting_notes(meeting_title, attendees, meeting_date, meeting_notes, action_items_text)
-            
-            # 🔍 디버그: GPT 출력 확인
-            st.write("### 🔍 디버그: GPT가 생성한 원본")
-            st.code(structured_content, language="markdown")
+            if bundle:
+                structured_content = structure_meeting_notes(meeting_title, attendees, meeting_date, meeting_notes, action_items_text, bundle=bundle)
+                
+                # 🔍 디버그: GPT 출력 확인
+                st.write("### 🔍 디버그: GPT가 생성한 원본 (one-shot)")
+                st.code(structured_content, language="markdown")
+            elif stream_output:
+                # 토큰이 도착하는 대로 회의록을 렌더링하고 체크박스 개수를 갱신
+                st.write("### 📝 회의록 작성 중...")
+                checkbox_text = st.empty()
+                preview = st.empty()
+                structured_content = ""
+                last_render = 0.0
+                # 스트림을 다 읽을 때까지를 한 단계로 계측 (중간에 재실행되면 실패로 기록)
+                with metrics.stage("structure_meeting_notes"):
+                    for delta in stream_structure_meeting_notes(meeting_title, attendees, meeting_date, meeting_notes, action_items_text, bypass_cache=bypass_cache):
+                        structured_content += delta
+                        # 매 토큰마다 다시 그리면 브라우저가 버벅이므로 줄바꿈 또는 0.1초 간격으로만 갱신
+                        now = time.monotonic()
+                        if '\n' in delta or now - last_render >= 0.1:
+                            complete_count, incomplete_count = extract_action_items_count(structured_content)
+                            checkbox_text.caption(f"☑️ 체크박스: 미완료 {incomplete_count}개, 완료 {complete_count}개")
+                            preview.markdown(structured_content + " ▌")
+                            # 출력 길이에 비례해 40% → 50% 구간 진행
+                            progress_bar.progress(40 + min(10, len(structured_content) * 10 // 3000))
+                            last_render = now
+                complete_count, incomplete_count = extract_action_items_count(structured_content)
+                checkbox_text.caption(f"☑️ 체크박스: 미완료 {incomplete_count}개, 완료 {complete_count}개")
+                preview.markdown(structured_content)
+            else:
+                structured_content = structure_meeting_notes(meeting_title, attendees, meeting_date, meeting_notes, action_items_text, bypass_cache=bypass_cache)
+                
+                # 🔍 디버그: GPT 출력 확인
+                st.write("### 🔍 디버그: GPT가 생성한 원본")
+                st.code(structured_content, language="markdown")
             
             # 체크박스 패턴 확인
             import re
@@ -673,35 +1051,75 @@ if st.session_state.get('form_submitted', False):
             if checkbox_complete:
                 st.write("**완료 항목 예시:**", checkbox_complete[0] if checkbox_complete else "없음")
             
-            # 🔍 디버그: 변환된 HTML 확인
-            from utils import markdown_to_confluence_storage
-            html_preview = markdown_to_confluence_storage(structured_content)
-            st.write("### 🔍 디버그: Confluence Storage Format 변환 결과")
-            st.code(html_preview, language="html")
+            # 2. 발행 단계 병렬 실행
+            # 요약 생성·본문 변환·제목 중복 확인은 서로 독립적이므로 동시에 실행하고,
+            # 페이지 생성은 (제목, 본문), Slack 전송은 (요약, 페이지 URL)이 준비된 뒤에만 실행
+            username = st.session_state.user_confluence_username
+            token = st.session_state.user_confluence_token
+            space_key = st.session_state.user_confluence_space
+            parent_id = st.session_state.user_confluence_parent_id
+            slack_channel = st.session_state.user_slack_channel
             
-            # 2. Confluence 업로드
-            status_text.text("📤 Confluence 업로드 중...")
-            progress_bar.progress(60)
-            confluence_result = upload_to_confluence(
-                meeting_title, 
-                structured_content, 
-                meeting_date,
-                st.session_state.user_confluence_username,
-                st.session_state.user_confluence_token,
-                st.session_state.user_confluence_space,
-                st.session_state.user_confluence_parent_id
-            )
+            def _send_slack(summary, page_result):
+                confluence_url = page_result.get('url') if page_result.get('success') else None
+                return send_to_slack(summary, slack_channel, confluence_url)
+            
+            base_title = build_page_title(meeting_title, meeting_date)
+            
+            def _save_page(existing, html):
+                if existing:
+                    return update_confluence_page(existing, html, username, token)
+                return create_confluence_page(base_title, html, username, token, space_key, parent_id)
+            
+            if update_existing:
+                # 기존 페이지의 완료 상태를 반영해 변환한 뒤, 있으면 갱신하고 없으면 새로 생성
+                page_stages = [
+                    Stage("existing", lambda: find_confluence_page(base_title, username, token, space_key), label="🔎 기존 페이지 조회"),
+                    Stage("convert", lambda existing: convert_to_storage(structured_content, existing_task_states(existing)),
+                          deps=("existing",), label="🔄 Storage Format 변환"),
+                    Stage("page", _save_page, deps=("existing", "convert"), label="📤 Confluence 업데이트"),
+                ]
+            else:
+                page_stages = [
+                    Stage("convert", lambda: convert_to_storage(structured_content), label="🔄 Storage Format 변환"),
+                    Stage("title", lambda: _get_unique_title(base_title, username, token, space_key), label="🔎 제목 중복 확인"),
+                    Stage("page", lambda page_title, html: create_confluence_page(page_title, html, username, token, space_key, parent_id),
+                          deps=("title", "convert"), label="📤 Confluence 업로드"),
+                ]
+            publish_stages = [
+                Stage("summary", lambda: create_slack_summary(structured_content, bypass_cache=bypass_cache, bundle=bundle), label="📊 Slack 요약 생성"),
+                *page_stages,
+                Stage("slack", _send_slack, deps=("summary", "page"), label="💬 Slack 전송"),
+            ]
+            stage_labels = {stage.name: stage.label for stage in publish_stages}
+            stage_icons = {
+                pipeline.PENDING: "⏳", pipeline.RUNNING: "🔄", pipeline.DONE: "✅",
+                pipeline.FAILED: "❌", pipeline.SKIPPED: "⏭️"
+            }
+            stage_panel = st.empty()
+            
+            def _on_stage_update(name, status, statuses, elapsed):
+                finished = sum(1 for state in statuses.values() if state not in (pipeline.PENDING, pipeline.RUNNING))
+                progress_bar.progress(50 + int(50 * finished / len(statuses)))
+                status_text.text(f"{stage_labels[name]}: {status}")
+                lines = []
+                for stage_name, state in statuses.items():
+                    line = f"{stage_icons[state]} {stage_labels[stage_name]}"
+                    if stage_name in elapsed:
+                        line += f" ({elapsed[stage_name]:.1f}초)"
+                    lines.append(f"- {line}")
+                stage_panel.markdown("\n".join(lines))
+            
+            progress_bar.progress(50)
+            stage_results = run_stages(publish_stages, on_update=_on_stage_update)
             
-            # 3. Slack 요약
-            status_text.text("📊 Slack 요약 생성 중...")
-            progress_bar.progress(80)
-            slack_summary = create_slack_summary(structured_content)
+            confluence_result = stage_results["page"]
+            slack_summary = stage_results["summary"]
+            slack_result = stage_results["slack"]
             
-            # 4. Slack 전송
-            status_text.text("💬 Slack 전송 중...")
-            progress_bar.progress(90)
-            confluence_url = confluence_result.get('url') if confluence_result.get('success') else None
-            slack_result = send_to_slack(slack_summary, st.session_state.user_slack_channel, confluence_url)
+            # 🔍 디버그: 변환된 HTML 확인 (업로드된 본문과 동일)
+            st.write("### 🔍 디버그: Confluence Storage Format 변환 결과")
+            st.code(stage_results["convert"], language="html")
             
             progress_bar.progress(100)
             status_text.empty()
@@ -731,7 +1149,10 @@ if st.session_state.get('form_submitted', False):
             
             with col1:
                 st.subheader("📄 Confluence")
-                if confluence_result.get('success'):
+                if confluence_result.get('unchanged'):
+                    st.info("ℹ️ 변경 사항이 없어 기존 페이지를 그대로 두었습니다")
+                    st.markdown(f"### [📖 회의록 보기]({confluence_result['url']})")
+                elif confluence_result.get('success'):
                     st.success("✅ 업로드 완료")
                     
                     # 깔끔한 회의록 보기 링크
@@ -925,14 +1346,19 @@ with st.sidebar:
             with st.spinner("🔍 설정을 검증하는 중..."):
                 validation_success = True
                 
-                # 1. Confluence 검증
-                st.info("📍 Confluence 공간 확인 중...")
-                confluence_result = validate_confluence_settings(
-                    user_confluence_username,
-                    user_confluence_token,
-                    user_confluence_space
-                )
+                # Confluence와 Slack 검증은 서로 독립적이므로 동시에 실행
+                st.info("📍 Confluence 공간과 💬 Slack 채널을 확인 중...")
+                validation_results = run_stages([
+                    Stage("confluence", lambda: validate_confluence_settings(
+                        user_confluence_username,
+                        user_confluence_token,
+                        user_confluence_space
+                    )),
+                    Stage("slack", lambda: validate_slack_channel(user_slack_channel)),
+                ])
                 
+                # 1. Confluence 검증
+                confluence_result = validation_results["confluence"]
                 if confluence_result['success']:
                     st.success(f"✅ Confluence: '{confluence_result['space_name']}' 공간에 접근 가능합니다")
                 else:
@@ -940,9 +1366,7 @@ with st.sidebar:
                     validation_success = False
                 
                 # 2. Slack 검증
-                st.info("💬 Slack 채널 확인 중...")
-                slack_result = validate_slack_channel(user_slack_channel)
-                
+                slack_result = validation_results["slack"]
                 if slack_result['success']:
                     st.success(f"✅ Slack: '#{slack_result['channel_name']}' 채널 사용 가능합니다")
                 else:
@@ -975,6 +1399,44 @@ with st.sidebar:
                 else:
                     st.warning("⚠️ 위 오류를 수정 후 다시 시도해주세요")
     
+    # AI 응답 캐시
+    st.markdown("---")
+    st.markdown("### 🧠 AI 응답 캐시")
+    st.checkbox(
+        "🔄 캐시 무시하고 새로 생성",
+        key="bypass_llm_cache",
+        help="같은 내용으로 다시 요청해도 저장된 답변 대신 AI가 새로 작성합니다"
+    )
+    cache_stats = client.cache.stats()
+    st.caption(
+        f"적중 {cache_stats['hits']}회 · 미스 {cache_stats['misses']}회 · "
+        f"{cache_stats['entries']}건 ({cache_stats['bytes'] / 1024:.0f}KB)"
+    )
+    
+    # 단계별 소요 시간
+    with st.expander("📈 단계별 소요 시간 (p50/p95)"):
+        stage_summary = metrics.summarize(metrics.load_records())
+        if stage_summary:
+            st.dataframe(
+                [
+                    {
+                        "단계": name,
+                        "횟수": row["count"],
+                        "p50 (초)": round(row["p50_ms"] / 1000, 2),
+                        "p95 (초)": round(row["p95_ms"] / 1000, 2),
+                        "평균 입력 토큰": row["avg_prompt_tokens"],
+                        "평균 출력 토큰": row["avg_completion_tokens"],
+                        "오류": row["errors"]
+                    }
+                    for name, row in stage_summary.items()
+                ],
+                hide_index=True,
+                use_container_width=True
+            )
+            st.caption(f"기록 파일: `{config.METRICS_PATH}`")
+        else:
+            st.caption("아직 기록이 없습니다. 회의록을 한 번 생성하면 표시됩니다.")
+    
     # 설정 상태 표시
     st.markdown("---")
     with st.expander("📊 설정 상태"):
@@ -0,0 +1,100 @@
+"""parse_action_items 마이크로 벤치마크
+
+큰 합성 회의록 페이지(storage 형식)로 이전 정규식 방식과 현재 파서를 비교합니다.
+
+사용법:
+    python benchmarks/bench_parse_action_items.py [--tasks 2000] [--repeat 5]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import parse_action_items  # noqa: E402
+
+
+def legacy_parse_action_items(page_content: str, page_url: str, page_title: str) -> list:
+    """비교용: 단일 <span> 본문만 처리하던 이전 구현"""
+    action_items = []
+    task_pattern = r'<ac:task><ac:task-id>(.*?)</ac:task-id><ac:task-status>(.*?)</ac:task-status><ac:task-body><span[^>]*>(.*?)</span></ac:task-body></ac:task>'
+    tasks = re.findall(task_pattern, page_content, re.DOTALL)
+
+    for task_id, status, content in tasks:
+        if status.strip() != 'incomplete':
+            continue
+        assignee_match = re.search(r'@([^\s—]+)', content)
+        assignee = assignee_match.group(1) if assignee_match else 'TBD'
+        due_date = None
+        due_match = re.search(r'<time datetime="([^"]+)"', content)
+        if due_match:
+            due_date = due_match.group(1)
+        else:
+            due_text_match = re.search(r'Due:\s*(\d{4}-\d{2}-\d{2})', content)
+            if due_text_match:
+                due_date = due_text_match.group(1)
+        task_text = re.sub(r'<[^>]+>', '', content)
+        task_text = re.sub(r'—\s*@.*?—.*', '', task_text).strip()
+        if task_text and due_date and due_date != 'TBD':
+            action_items.append({
+                'task': task_text,
+                'assignee': assignee,
+                'due_date': due_date,
+                'page_url': page_url,
+                'page_title': page_title
+            })
+    return action_items
+
+
+def build_page(task_count: int, seed: int = 0) -> str:
+    """논의 내용 문단과 task-list가 섞인 합성 storage 본문"""
+    rng = random.Random(seed)
+    names = ['김철수', '이영희', '박민수', '최지우']
+    parts = ['<h1>회의 개요</h1><ul><li>회의명: 주간 동기화</li></ul>']
+    for i in range(task_count):
+        if i % 20 == 0:
+            parts.append('<h2>주요 논의 내용</h2>')
+            parts.append('<p>' + '결제 모듈 개선 방향과 일정에 대해 논의했습니다. ' * rng.randint(5, 15) + '</p>')
+            parts.append('<ac:task-list>')
+        status = 'complete' if rng.random() < 0.6 else 'incomplete'
+        due = f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        parts.append(
+            f'<ac:task><ac:task-id>{i}</ac:task-id><ac:task-status>{status}</ac:task-status>'
+            f'<ac:task-body><span class="placeholder-inline-tasks">작업 {i} 정리 및 공유 — '
+            f'@{rng.choice(names)} — <time datetime="{due}"></time></span></ac:task-body></ac:task>'
+        )
+        if i % 20 == 19:
+            parts.append('</ac:task-list>')
+    parts.append('</ac:task-list>')
+    return ''.join(parts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tasks', type=int, default=2000, help='페이지당 task 수')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 측정 횟수')
+    args = parser.parse_args()
+
+    page = build_page(args.tasks)
+    url, title = 'https://example.atlassian.net/wiki/x', '주간 회의록'
+
+    # 기존 형식에서는 두 구현의 결과가 같아야 함
+    assert parse_action_items(page, url, title) == legacy_parse_action_items(page, url, title)
+
+    print(f"📄 페이지 크기: {len(page.encode('utf-8')) / 1024:.0f} KB, task {args.tasks}개")
+    results = {}
+    for name, func in (('legacy', legacy_parse_action_items), ('current', parse_action_items)):
+        timer = timeit.Timer(lambda: func(page, url, title))
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat=args.repeat, number=number)) / number
+        results[name] = best
+        print(f"  {name:8s} {best * 1000:8.2f} ms/page")
+    print(f"⚡ {results['legacy'] / results['current']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+"""종단 간 파이프라인 벤치마크 (fake_services 대역 서버 사용)
+
+실제 API 없이 다음 세 경로의 처리량과 p95 지연을 측정합니다.
+- cli: main.py 배치 모드 (구조화 → 업로드 → 요약 → Slack)
+- publish: app.py 발행 함수 (업로드 → Slack 요약 → Slack 전송)
+- dm: send_daily_dm.main (사용자 × 회의록 페이지)
+
+사용법:
+    python benchmarks/bench_pipeline.py --scenarios dm --users 200 --pages 500
+    python benchmarks/bench_pipeline.py --output after.json --baseline before.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_services import SAMPLE_MINUTES, FakeServices  # noqa: E402
+
+
+def percentile(values, pct):
+    # metrics.percentile과 같은 nearest-rank (config import 전에도 쓰기 위해 따로 둠)
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-pct * len(ordered) // 100))
+    return ordered[int(min(rank, len(ordered))) - 1]
+
+
+def summarize(name: str, latencies_ms: list, elapsed: float, unit: str, **extra) -> dict:
+    return {
+        "scenario": name,
+        "count": len(latencies_ms),
+        "elapsed_s": round(elapsed, 3),
+        f"{unit}_per_s": round(len(latencies_ms) / elapsed, 2) if elapsed > 0 else 0.0,
+        "p50_ms": round(percentile(latencies_ms, 50), 1),
+        "p95_ms": round(percentile(latencies_ms, 95), 1),
+        **extra
+    }
+
+
+@contextlib.contextmanager
+def quiet():
+    """파이프라인 함수들의 진행 출력 숨기기"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def bench_cli(services: FakeServices, items: int, openai_concurrency: int, confluence_concurrency: int) -> dict:
+    import main
+
+    workdir = tempfile.mkdtemp(prefix="bench_cli_")
+    for i in range(items):
+        with open(os.path.join(workdir, f"meeting_{i:04d}.md"), 'w', encoding='utf-8') as f:
+            f.write(f"참석자: 김철수, 이영희\n\n## 논의 {i}\n- 결제 모듈 개선 방향 논의 {i}\n")
+    results_path = os.path.join(workdir, "results.jsonl")
+
+    start = time.perf_counter()
+    with quiet():
+        main.run_batch(workdir, results_path, openai_concurrency, confluence_concurrency, send_slack=True)
+    elapsed = time.perf_counter() - start
+
+    latencies, failed = [], 0
+    with open(results_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            entry = json.loads(line)
+            if entry['status'] != 'success':
+                failed += 1
+            latencies.append(sum(entry['timings_ms'].values()))
+    return summarize("cli", latencies, elapsed, "items", failed=failed)
+
+
+def bench_publish(services: FakeServices, items: int, workers: int) -> dict:
+    import logging
+    logging.disable(logging.WARNING)  # Streamlit bare mode 경고
+    with quiet():
+        import app
+
+    services.add_channels(1000)
+    today = time.strftime('%Y-%m-%d')
+
+    def publish(i: int) -> float:
+        start = time.perf_counter()
+        page = app.upload_to_confluence(f"벤치 회의 {i}", SAMPLE_MINUTES, today, "bench@example.com", "token", "BENCH")
+        summary = app.create_slack_summary(SAMPLE_MINUTES, bypass_cache=True)
+        app.send_to_slack(summary, "channel-998", page.get('url'))
+        if not page.get('success'):
+            raise RuntimeError(page.get('error'))
+        return (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    latencies, failed = [], 0
+    with quiet(), ThreadPoolExecutor(max_workers=workers) as executor:
+        for future in [executor.submit(publish, i) for i in range(items)]:
+            try:
+                latencies.append(future.result())
+            except Exception:
+                failed += 1
+    elapsed = time.perf_counter() - start
+    return summarize("publish", latencies, elapsed, "items", failed=failed)
+
+
+def bench_dm(services: FakeServices, users: int, spaces: int, pages: int, workers: int, with_property: bool) -> dict:
+    from confluence_api import ACTION_ITEMS_PROPERTY_KEY
+
+    names = [f"사용자{i}" for i in range(users)]
+    for s in range(spaces):
+        space_names = names[s::spaces] or names[:1]
+        services.add_meeting_pages(f"SP{s}", pages, assignees=space_names,
+                                   property_key=ACTION_ITEMS_PROPERTY_KEY if with_property else None)
+
+    # send_daily_dm은 import 시 daily_dm_config를 읽으므로 합성 설정을 먼저 등록
+    dm_config = types.ModuleType("daily_dm_config")
+    dm_config.USERS = [
+        {
+            "name": names[i],
+            "slack_id": f"U{i:06d}",
+            "confluence_username": f"user{i % spaces}@example.com",
+            "confluence_token": "token",
+            "confluence_space": f"SP{i % spaces}",
+            "confluence_parent_id": "",
+        }
+        for i in range(users)
+    ]
+    dm_config.SEND_TIME_KST = "09:00"
+    dm_config.SEARCH_DAYS = 60
+    dm_config.MAX_WORKERS = workers
+    sys.modules["daily_dm_config"] = dm_config
+    import send_daily_dm
+
+    latencies = []
+    process_user = send_daily_dm.process_user
+
+    def timed_process_user(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return process_user(*args, **kwargs)
+        finally:
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    send_daily_dm.process_user = timed_process_user
+    start = time.perf_counter()
+    try:
+        with quiet():
+            send_daily_dm.main()
+    finally:
+        send_daily_dm.process_user = process_user
+    elapsed = time.perf_counter() - start
+    return summarize("dm", latencies, elapsed, "users", pages=spaces * pages, dms=sum(1 for post in services.posts if post['channel'].startswith('U')),
+                     confluence_requests=sum(v for k, v in services.counts.items() if k.startswith('content.')))
+
+
+def compare(report: dict, baseline: dict):
+    """기준 결과 대비 변화율 출력"""
+    base = {r["scenario"]: r for r in baseline.get("results", [])}
+    for result in report["results"]:
+        before = base.get(result["scenario"])
+        if not before:
+            continue
+        for key in ("elapsed_s", "p95_ms"):
+            if before.get(key):
+                change = (result[key] - before[key]) / before[key] * 100
+                print(f"  {result['scenario']:8s} {key:10s} {before[key]:>10} → {result[key]:>10} ({change:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="fake_services 기반 종단 간 벤치마크")
+    parser.add_argument('--scenarios', default='cli,publish,dm', help="쉼표로 구분 (cli, publish, dm)")
+    parser.add_argument('--items', type=int, default=100, help="cli/publish 처리 건수")
+    parser.add_argument('--users', type=int, default=200, help="dm 사용자 수")
+    parser.add_argument('--spaces', type=int, default=20, help="dm 공간 수 (사용자는 공간에 고르게 배정)")
+    parser.add_argument('--pages', type=int, default=500, help="dm 공간당 회의록 페이지 수")
+    parser.add_argument('--with-property', action='store_true', help="dm 회의록 페이지에 액션아이템 content property 포함")
+    parser.add_argument('--workers', type=int, default=8, help="동시 처리 수")
+    parser.add_argument('--latency-ms', type=float, default=20, help="대역 서버 응답 지연")
+    parser.add_argument('--jitter-ms', type=float, default=10, help="응답 지연 편차 (0~N ms)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="5xx 응답 비율 (0~1)")
+    parser.add_argument('--slack-rps', type=float, default=50, help="대역 서버 chat.postMessage 초당 허용 수 (0이면 무제한)")
+    parser.add_argument('--output', help="결과 JSON 저장 경로")
+    parser.add_argument('--baseline', help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    rate_limits = {"chat.postMessage": args.slack_rps} if args.slack_rps else {}
+    services = FakeServices(args.latency_ms, args.jitter_ms, args.error_rate, rate_limits)
+    services.start()
+
+    # config는 import 시 환경변수를 읽으므로 앱 모듈 import 전에 설정
+    home = tempfile.mkdtemp(prefix="bench_home_")
+    os.environ.update(services.env())
+    os.environ.update({
+        "HOME": home,
+        "LLM_CACHE_PATH": os.path.join(home, "llm_cache.sqlite3"),
+        "METRICS_PATH": os.path.join(home, "metrics.jsonl"),
+        "ACTION_INDEX_PATH": os.path.join(home, "action_index.sqlite3"),
+        "DM_JOURNAL_DIR": os.path.join(home, "dm_journal"),
+        "SLACK_CHANNEL_CACHE_PATH": os.path.join(home, "slack_channels.json"),
+        "CONFLUENCE_SPACE_KEY": "BENCH",
+        "CONFLUENCE_USERNAME": "bench@example.com",
+        "CONFLUENCE_API_TOKEN": "token",
+        "SLACK_CHANNEL_ID": "C000000",
+        "SLACK_RATE_PER_SECOND": str(args.slack_rps or 1000),
+        "SLACK_RATE_BURST": str(int(args.slack_rps or 1000)),
+    })
+
+    scenarios = [s.strip() for s in args.scenarios.split(',') if s.strip()]
+    results = []
+    for scenario in scenarios:
+        print(f"▶ {scenario} 실행 중...", flush=True)
+        if scenario == 'cli':
+            results.append(bench_cli(services, args.items, args.workers, max(1, args.workers // 2)))
+        elif scenario == 'publish':
+            results.append(bench_publish(services, args.items, args.workers))
+        elif scenario == 'dm':
+            results.append(bench_dm(services, args.users, args.spaces, args.pages, args.workers, args.with_property))
+        else:
+            parser.error(f"알 수 없는 시나리오: {scenario}")
+    services.stop()
+
+    report = {
+        "created_at": time.strftime('%Y-%m-%dT%H:%M:%S'),
+        "settings": vars(args),
+        "results": results,
+        "server_counts": services.counts
+    }
+    print()
+    for result in results:
+        print(json.dumps(result, ensure_ascii=False))
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            print("\n📊 기준 대비")
+            compare(report, json.load(f))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""utils 변환·파싱 함수 마이크로 벤치마크
+
+합성 회의록(마크다운 10 ~ 10,000줄, 체크박스 비율별, 한글 본문)과 storage 형식 페이지로
+다음 함수의 실행 시간과 메모리 할당(tracemalloc)을 측정합니다.
+- markdown_to_confluence_storage
+- convert_due_date_to_time_tag
+- extract_action_items_count
+- parse_action_items
+
+결과를 JSON으로 저장해 커밋 간에 비교할 수 있습니다.
+
+사용법:
+    python benchmarks/bench_utils.py --output before.json
+    python benchmarks/bench_utils.py --output after.json --baseline before.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_parse_action_items import build_page  # noqa: E402
+from utils import (  # noqa: E402
+    convert_due_date_to_time_tag,
+    extract_action_items_count,
+    markdown_to_confluence_storage,
+    parse_action_items,
+)
+
+NAMES = ['김철수', '이영희', '박민수', '최지우']
+TOPICS = ['결제 모듈 개선', '배포 일정 조율', '장애 회고', '신규 온보딩 흐름', '데이터 파이프라인 이전']
+
+
+def build_minutes(line_count: int, checkbox_ratio: float, seed: int = 0) -> str:
+    """헤더·문단·목록·체크박스가 섞인 합성 회의록 마크다운
+
+    checkbox_ratio는 헤더를 뺀 줄 중 체크박스 줄의 비율입니다.
+    """
+    rng = random.Random(seed)
+    lines = ['# 회의 개요', '- 회의명: 주간 동기화', '- 참석자: ' + ', '.join(NAMES)]
+    while len(lines) < line_count:
+        if len(lines) % 25 == 3:
+            lines.append(f"## {rng.choice(TOPICS)}")
+            continue
+        if rng.random() < checkbox_ratio:
+            mark = 'x' if rng.random() < 0.4 else ' '
+            due = f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}" if rng.random() < 0.8 else 'TBD'
+            lines.append(f"- [{mark}] {rng.choice(TOPICS)} 후속 작업 {len(lines)} — @{rng.choice(NAMES)} — Due: {due}")
+        elif rng.random() < 0.5:
+            lines.append(f"- {rng.choice(TOPICS)} 관련 **결정**: `v{rng.randint(1, 9)}` 기준으로 진행")
+        else:
+            lines.append(f"{rng.choice(TOPICS)}에 대해 논의했습니다. " * rng.randint(1, 4))
+    return '\n'.join(lines[:line_count])
+
+
+def measure(func, arg, repeat: int) -> dict:
+    """한 번 호출당 최소 시간(ms)과 tracemalloc 기준 최대 사용량·할당 수"""
+    timer = timeit.Timer(lambda: func(arg))
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        func(arg)
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    allocations = sum(stat.count_diff for stat in after.compare_to(before, 'filename') if stat.count_diff > 0)
+    return {"ms": round(best * 1000, 4), "peak_kb": round(peak / 1024, 1), "allocations": allocations}
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, timeout=5).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ''
+
+
+def run_cases(line_counts, ratios, repeat: int) -> list:
+    url, title = 'https://example.atlassian.net/wiki/x', '주간 회의록'
+    results = []
+    for line_count in line_counts:
+        for ratio in ratios:
+            minutes = build_minutes(line_count, ratio)
+            checkbox_lines = [line for line in minutes.split('\n') if line.startswith('- [')]
+            page = build_page(max(1, len(checkbox_lines)))
+            cases = [
+                ('markdown_to_confluence_storage', markdown_to_confluence_storage, minutes),
+                ('convert_due_date_to_time_tag', lambda lines: [convert_due_date_to_time_tag(line) for line in lines], checkbox_lines),
+                ('extract_action_items_count', extract_action_items_count, minutes),
+                ('parse_action_items', lambda body: parse_action_items(body, url, title), page),
+            ]
+            for name, func, arg in cases:
+                size = len(arg.encode('utf-8')) if isinstance(arg, str) else sum(len(line.encode('utf-8')) for line in arg)
+                result = {"function": name, "lines": line_count, "checkbox_ratio": ratio, "input_kb": round(size / 1024, 1)}
+                result.update(measure(func, arg, repeat))
+                results.append(result)
+                print(f"  {name:32s} {line_count:>6}줄 체크박스 {ratio:>4.0%}  "
+                      f"{result['ms']:>10.3f} ms  최대 {result['peak_kb']:>9.1f} KB", flush=True)
+    return results
+
+
+def compare(results: list, baseline: dict):
+    """기준 결과 대비 시간·메모리 변화율 출력"""
+    key = lambda r: (r["function"], r["lines"], r["checkbox_ratio"])  # noqa: E731
+    base = {key(r): r for r in baseline.get("results", [])}
+    for result in results:
+        before = base.get(key(result))
+        if not before:
+            continue
+        changes = []
+        for field in ("ms", "peak_kb"):
+            if before.get(field):
+                changes.append(f"{field} {(result[field] - before[field]) / before[field] * 100:+.1f}%")
+        print(f"  {result['function']:32s} {result['lines']:>6}줄 {result['checkbox_ratio']:>4.0%}  " + ', '.join(changes))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="utils 변환·파싱 함수 마이크로 벤치마크")
+    parser.add_argument('--lines', default='10,100,1000,10000', help="회의록 줄 수 (쉼표로 구분)")
+    parser.add_argument('--ratios', default='0.05,0.3,0.8', help="체크박스 줄 비율 (쉼표로 구분)")
+    parser.add_argument('--repeat', type=int, default=5, help="반복 측정 횟수 (최솟값 사용)")
+    parser.add_argument('--output', help="결과 JSON 저장 경로")
+    parser.add_argument('--baseline', help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    line_counts = [int(n) for n in args.lines.split(',') if n.strip()]
+    ratios = [float(r) for r in args.ratios.split(',') if r.strip()]
+
+    results = run_cases(line_counts, ratios, args.repeat)
+    report = {
+        "created_at": time.strftime('%Y-%m-%dT%H:%M:%S'),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "settings": vars(args),
+        "results": results
+    }
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            print("\n📊 기준 대비")
+            compare(results, json.load(f))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
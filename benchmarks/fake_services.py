@@ -0,0 +1,461 @@
+"""OpenAI / Confluence / Slack 대역 서버
+
+벤치마크와 회귀 측정용으로 실제 API 대신 띄우는 로컬 HTTP 서버입니다.
+응답 지연, 엔드포인트별 초당 요청 수 제한(429 + Retry-After), 오류(5xx) 주입을 설정할 수 있습니다.
+
+지원 엔드포인트:
+- POST /v1/chat/completions (stream, response_format 포함)
+- GET/POST /wiki/rest/api/content, GET/PUT /wiki/rest/api/content/{id}, GET /wiki/rest/api/content/search,
+  POST /wiki/rest/api/content/{id}/property, GET/PUT /wiki/rest/api/content/{id}/property/{key},
+  GET /wiki/rest/api/space/{key}
+- GET /api/conversations.list, GET /api/conversations.info, POST /api/chat.postMessage
+
+사용 예:
+    services = FakeServices(latency_ms=20, rate_limits={"chat.postMessage": 50})
+    services.add_meeting_pages("TEAM", 500, assignees=["김철수", "이영희"])
+    base_url = services.start()
+    os.environ.update(services.env())   # config import 전에
+    ...
+    services.stop()
+"""
+
+import json
+import random
+import re
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+from urllib.parse import parse_qs, urlencode, urlparse
+
+
+SAMPLE_MINUTES = """# 회의 개요
+- 회의명: 주간 동기화
+- 일시: 2025-01-15
+- 참석자: 김철수, 이영희
+
+# 주요 논의 내용
+- 결제 모듈 개선 방향 논의
+
+# 결정 사항
+- 다음 주까지 설계 문서 확정
+
+# 액션아이템
+- [ ] 설계 문서 작성 — @김철수 — Due: 2025-10-27
+- [x] PRD 초안 공유 — @이영희 — Due: 2025-10-20
+"""
+
+SAMPLE_SUMMARY = "🤖 *회의록 자동 요약*\n📋 *액션아이템*\n총 2건 (완료 1건, 미완료 1건)"
+
+
+class _RateLimiter:
+    """엔드포인트별 초당 요청 수 제한 (대기하지 않고 허용 여부만 판단)"""
+
+    def __init__(self, per_second: float):
+        self.rate = per_second
+        self.tokens = per_second
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+class FakeServices:
+    """세 서비스를 한 포트에서 흉내 내는 서버와 그 데이터"""
+
+    def __init__(self, latency_ms: float = 0, jitter_ms: float = 0, error_rate: float = 0.0,
+                 rate_limits: Dict[str, float] = None, seed: int = 0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limits = {name: _RateLimiter(rps) for name, rps in (rate_limits or {}).items()}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.pages: Dict[str, dict] = {}
+        self.channels: List[dict] = []
+        self.posts: List[dict] = []
+        self.counts: Dict[str, int] = {}
+        self._next_page_id = 100000
+        self._server = None
+        self.base_url = None
+
+    # 데이터 준비
+    def _new_page_id(self) -> str:
+        with self._lock:
+            self._next_page_id += 1
+            return str(self._next_page_id)
+
+    def add_page(self, space_key: str, title: str, body: str, parent_id: str = None) -> dict:
+        page_id = self._new_page_id()
+        page = {
+            "id": page_id,
+            "type": "page",
+            "title": title,
+            "space": {"key": space_key},
+            "ancestors": [{"id": parent_id}] if parent_id else [],
+            "version": {"number": 1},
+            "body": {"storage": {"value": body, "representation": "storage"}},
+            "created": date.today().isoformat(),
+            "_links": {"webui": f"/spaces/{space_key}/pages/{page_id}"},
+            "_properties": {}
+        }
+        with self._lock:
+            self.pages[page_id] = page
+        return page
+
+    def add_meeting_pages(self, space_key: str, count: int, tasks_per_page: int = 6,
+                          assignees: List[str] = None, parent_id: str = None, property_key: str = None):
+        """오늘 기준 기한 지남/오늘/D-3 항목이 섞인 회의록 페이지 생성
+
+        property_key가 주어지면 발행 시처럼 액션아이템 content property도 붙입니다.
+        """
+        assignees = assignees or ["김철수", "이영희", "박민수"]
+        today = date.today()
+        for p in range(count):
+            tasks = []
+            records = []
+            for t in range(tasks_per_page):
+                status = "complete" if (p + t) % 3 == 0 else "incomplete"
+                due = today + timedelta(days=(p + t) % 7 - 3)
+                assignee = assignees[(p + t) % len(assignees)]
+                tasks.append(
+                    f'<ac:task><ac:task-id>{p}-{t}</ac:task-id><ac:task-status>{status}</ac:task-status>'
+                    f'<ac:task-body><span class="placeholder-inline-tasks">작업 {p}-{t} 진행 — @{assignee} — '
+                    f'<time datetime="{due.isoformat()}"></time></span></ac:task-body></ac:task>'
+                )
+                records.append({"id": f"{p}-{t}", "text": f"작업 {p}-{t} 진행", "assignee": assignee,
+                                "due": due.isoformat(), "status": status})
+            body = '<h1>회의 개요</h1><p>주간 동기화 회의</p><h1>액션아이템</h1><ac:task-list>' + ''.join(tasks) + '</ac:task-list>'
+            page = self.add_page(space_key, f"{today.isoformat()} {space_key} 주간 회의 {p} – 회의록", body, parent_id)
+            if property_key:
+                page['_properties'][property_key] = {
+                    "key": property_key, "value": {"page_version": 1, "tasks": records}, "version": {"number": 1}
+                }
+
+    def add_channels(self, count: int, member_every: int = 2):
+        for i in range(count):
+            self.channels.append({"id": f"C{i:06d}", "name": f"channel-{i}", "is_member": i % member_every == 0})
+
+    # 서버
+    def start(self, port: int = 0) -> str:
+        """백그라운드 스레드에서 서버 시작 후 base URL 반환 (port=0이면 빈 포트)"""
+        services = self
+
+        class Handler(_Handler):
+            pass
+        Handler.services = services
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        return self.base_url
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def env(self) -> Dict[str, str]:
+        """앱이 이 서버를 보도록 하는 환경변수 (config import 전에 적용)"""
+        return {
+            "OPENAI_API_KEY": "fake-key",
+            "OPENAI_BASE_URL": f"{self.base_url}/v1",
+            "CONFLUENCE_URL": self.base_url,
+            "SLACK_API_URL": f"{self.base_url}/api",
+            "SLACK_BOT_TOKEN": "xoxb-fake"
+        }
+
+    # 요청 처리 보조
+    def count(self, name: str):
+        with self._lock:
+            self.counts[name] = self.counts.get(name, 0) + 1
+
+    def delay(self):
+        if self.latency_ms or self.jitter_ms:
+            with self._lock:
+                jitter = self._random.uniform(0, self.jitter_ms)
+            time.sleep((self.latency_ms + jitter) / 1000)
+
+    def inject_error(self) -> bool:
+        if not self.error_rate:
+            return False
+        with self._lock:
+            return self._random.random() < self.error_rate
+
+
+class _Handler(BaseHTTPRequestHandler):
+    services: FakeServices = None
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def log_message(self, *args):
+        pass
+
+    # 응답
+    def _send(self, code: int, obj, headers: dict = None):
+        body = json.dumps(obj, ensure_ascii=False).encode('utf-8')
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _body(self) -> dict:
+        length = int(self.headers.get('Content-Length') or 0)
+        return json.loads(self.rfile.read(length) or b'{}') if length else {}
+
+    def _dispatch(self, method: str):
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        body = self._body() if method in ('POST', 'PUT') else {}
+        services = self.services
+
+        route = self._route(method, url.path)
+        if route is None:
+            return self._send(404, {"message": f"no route for {method} {url.path}"})
+        name, handler = route
+        services.count(name)
+        services.delay()
+
+        limiter = services.rate_limits.get(name)
+        if limiter is not None and not limiter.try_acquire():
+            services.count(f"{name}:429")
+            return self._send(429, {"ok": False, "error": "ratelimited"}, {"Retry-After": "1"})
+        if services.inject_error():
+            services.count(f"{name}:500")
+            return self._send(500, {"ok": False, "error": "internal_error"})
+        return handler(url.path, query, body)
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_PUT(self):
+        self._dispatch('PUT')
+
+    def _route(self, method: str, path: str):
+        if path == '/v1/chat/completions' and method == 'POST':
+            return 'chat.completions', self._chat_completions
+        if path == '/wiki/rest/api/content/search':
+            return 'content.search', self._content_search
+        if path == '/wiki/rest/api/content':
+            return ('content.create', self._content_create) if method == 'POST' else ('content.list', self._content_list)
+        if re.fullmatch(r'/wiki/rest/api/content/\d+/property', path) and method == 'POST':
+            return 'property.create', self._property_create
+        if re.fullmatch(r'/wiki/rest/api/content/\d+/property/[^/]+', path):
+            return ('property.update', self._property_update) if method == 'PUT' else ('property.get', self._property_get)
+        if re.fullmatch(r'/wiki/rest/api/content/\d+', path):
+            return ('content.update', self._content_update) if method == 'PUT' else ('content.get', self._content_get)
+        if path.startswith('/wiki/rest/api/space/'):
+            return 'space.get', lambda *_: self._send(200, {"key": path.rsplit('/', 1)[-1], "name": "Space"})
+        if path == '/api/conversations.list':
+            return 'conversations.list', self._conversations_list
+        if path == '/api/conversations.info':
+            return 'conversations.info', self._conversations_info
+        if path == '/api/chat.postMessage' and method == 'POST':
+            return 'chat.postMessage', self._post_message
+        return None
+
+    # OpenAI
+    def _completion_text(self, body: dict) -> str:
+        system = body['messages'][0]['content'] if body.get('messages') else ''
+        response_format = (body.get('response_format') or {}).get('type')
+        if response_format == 'json_schema':
+            return json.dumps({
+                "title": "주간 동기화",
+                "structured_markdown": SAMPLE_MINUTES,
+                "action_items": [{"task": "설계 문서 작성", "assignee": "김철수", "due": "2025-10-27", "status": "incomplete"}],
+                "slack_summary": SAMPLE_SUMMARY
+            }, ensure_ascii=False)
+        if response_format == 'json_object':
+            return json.dumps({
+                "updates": [], "discussion_points": ["결제 모듈 개선"], "decisions": [],
+                "action_items": [{"task": "설계 문서 작성", "assignee": "김철수", "due": "TBD"}]
+            }, ensure_ascii=False)
+        if '요약' in system[:40]:
+            return SAMPLE_SUMMARY
+        if '제목' in system[:30]:
+            return "주간 동기화"
+        if 'JSON' in system:
+            return '[{"task": "설계 문서 작성", "assignee": "김철수", "due": "2025-10-27"}]'
+        return SAMPLE_MINUTES
+
+    def _chat_completions(self, path, query, body):
+        content = self._completion_text(body)
+        usage = {"prompt_tokens": len(json.dumps(body.get('messages', []))) // 4,
+                 "completion_tokens": len(content) // 2}
+        usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+
+        if not body.get('stream'):
+            return self._send(200, {
+                "id": "chatcmpl-fake", "object": "chat.completion", "created": int(time.time()),
+                "model": body.get('model', 'fake'),
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+                "usage": usage
+            })
+
+        chunks = [content[i:i + 40] for i in range(0, len(content), 40)]
+        events = []
+        for piece in chunks:
+            events.append({"choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}]})
+        events.append({"choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]})
+        if (body.get('stream_options') or {}).get('include_usage'):
+            events.append({"choices": [], "usage": usage})
+        payload = b''.join(
+            f"data: {json.dumps(dict(event, id='chatcmpl-fake', object='chat.completion.chunk', created=0, model='fake'))}\n\n".encode('utf-8')
+            for event in events
+        ) + b"data: [DONE]\n\n"
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    # Confluence
+    def _page_view(self, page: dict, expand: str) -> dict:
+        view = {k: v for k, v in page.items() if k not in ('body', '_properties')}
+        if 'body.storage' in (expand or ''):
+            view['body'] = page['body']
+        # expand=metadata.properties.<key>
+        keys = re.findall(r'metadata\.properties\.([^,]+)', expand or '')
+        properties = {key: page['_properties'][key] for key in keys if key in page['_properties']}
+        if properties:
+            view['metadata'] = {"properties": properties}
+        return view
+
+    def _content_search(self, path, query, body):
+        cql = query.get('cql', '')
+        limit = int(query.get('limit', 25))
+        start = int(query.get('start', 0))
+        space = re.search(r'space\s*=\s*"([^"]*)"', cql)
+        title = re.search(r'title\s*~\s*"((?:[^"\\]|\\.)*)"', cql)
+        ancestor = re.search(r'ancestor\s*=\s*"?(\d+)"?', cql)
+        title_text = title.group(1).replace('\\"', '"').replace('\\\\', '\\') if title else None
+
+        with self.services._lock:
+            pages = list(self.services.pages.values())
+        matched = [
+            page for page in pages
+            if (not space or page['space']['key'] == space.group(1))
+            and (title_text is None or title_text in page['title'])
+            and (not ancestor or any(a['id'] == ancestor.group(1) for a in page['ancestors']))
+        ]
+        selected = matched[start:start + limit]
+        links = {"base": f"{self.services.base_url}/wiki"}
+        if start + limit < len(matched):
+            next_query = {"cql": cql, "limit": limit, "start": start + limit}
+            if query.get('expand'):
+                next_query["expand"] = query['expand']
+            links["next"] = "/rest/api/content/search?" + urlencode(next_query)
+        self._send(200, {
+            "results": [self._page_view(page, query.get('expand')) for page in selected],
+            "start": start, "limit": limit, "size": len(selected), "_links": links
+        })
+
+    def _content_list(self, path, query, body):
+        with self.services._lock:
+            pages = [p for p in self.services.pages.values()
+                     if p['title'] == query.get('title') and p['space']['key'] == query.get('spaceKey')]
+        self._send(200, {"results": [self._page_view(p, query.get('expand')) for p in pages], "size": len(pages)})
+
+    def _content_get(self, path, query, body):
+        page = self.services.pages.get(path.rsplit('/', 1)[-1])
+        if page is None:
+            return self._send(404, {"message": "not found"})
+        self._send(200, self._page_view(page, query.get('expand')))
+
+    def _content_create(self, path, query, body):
+        space_key = (body.get('space') or {}).get('key', '')
+        title = body.get('title', '')
+        with self.services._lock:
+            duplicate = any(p['title'] == title and p['space']['key'] == space_key for p in self.services.pages.values())
+        if duplicate:
+            return self._send(400, {"message": "A page with this title already exists"})
+        ancestors = body.get('ancestors') or []
+        page = self.services.add_page(
+            space_key, title, body['body']['storage']['value'], ancestors[0]['id'] if ancestors else None
+        )
+        self._send(200, self._page_view(page, 'body.storage'))
+
+    def _content_update(self, path, query, body):
+        page_id = path.rsplit('/', 1)[-1]
+        with self.services._lock:
+            page = self.services.pages.get(page_id)
+            if page is None:
+                return self._send(404, {"message": "not found"})
+            # 실제 API처럼 현재 버전 + 1만 허용
+            number = (body.get('version') or {}).get('number')
+            if number != page['version']['number'] + 1:
+                return self._send(409, {"message": f"Version must be {page['version']['number'] + 1}"})
+            page['version'] = {"number": number}
+            page['title'] = body.get('title', page['title'])
+            page['body'] = {"storage": {"value": body['body']['storage']['value'], "representation": "storage"}}
+        self._send(200, self._page_view(page, 'body.storage'))
+
+    def _property_target(self, path: str):
+        parts = path.split('/')
+        page = self.services.pages.get(parts[5])
+        return page, (parts[7] if len(parts) > 7 else None)
+
+    def _property_create(self, path, query, body):
+        page, _ = self._property_target(path)
+        if page is None:
+            return self._send(404, {"message": "not found"})
+        key = body.get('key')
+        with self.services._lock:
+            if key in page['_properties']:
+                return self._send(409, {"message": f"property {key} already exists"})
+            page['_properties'][key] = {"key": key, "value": body.get('value'), "version": {"number": 1}}
+        self._send(200, page['_properties'][key])
+
+    def _property_get(self, path, query, body):
+        page, key = self._property_target(path)
+        if page is None or key not in page['_properties']:
+            return self._send(404, {"message": "not found"})
+        self._send(200, page['_properties'][key])
+
+    def _property_update(self, path, query, body):
+        page, key = self._property_target(path)
+        if page is None or key not in page['_properties']:
+            return self._send(404, {"message": "not found"})
+        with self.services._lock:
+            current = page['_properties'][key]
+            number = (body.get('version') or {}).get('number')
+            if number != current['version']['number'] + 1:
+                return self._send(409, {"message": f"Version must be {current['version']['number'] + 1}"})
+            page['_properties'][key] = {"key": key, "value": body.get('value'), "version": {"number": number}}
+        self._send(200, page['_properties'][key])
+
+    # Slack
+    def _conversations_list(self, path, query, body):
+        limit = int(query.get('limit', 100))
+        cursor = int(query.get('cursor') or 0)
+        selected = self.services.channels[cursor:cursor + limit]
+        next_cursor = str(cursor + limit) if cursor + limit < len(self.services.channels) else ''
+        self._send(200, {"ok": True, "channels": selected, "response_metadata": {"next_cursor": next_cursor}})
+
+    def _conversations_info(self, path, query, body):
+        for channel in self.services.channels:
+            if channel['id'] == query.get('channel'):
+                return self._send(200, {"ok": True, "channel": channel})
+        self._send(200, {"ok": False, "error": "channel_not_found"})
+
+    def _post_message(self, path, query, body):
+        ts = f"{time.time():.6f}"
+        with self.services._lock:
+            self.services.posts.append({"channel": body.get('channel'), "text": body.get('text', ''), "ts": ts})
+        self._send(200, {"ok": True, "channel": body.get('channel'), "ts": ts})
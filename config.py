@@ -1,4 +1,5 @@
 import os
+from pathlib import Path
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -9,9 +10,52 @@ OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
 # Confluence
 CONFLUENCE_URL = os.getenv('CONFLUENCE_URL', 'https://woowahanbros.atlassian.net')
 # Note: Username, Token, Space Key는 이제 사용자가 UI에서 입력
+# 아래 값은 CLI(main.py)에서만 사용
+CONFLUENCE_USERNAME = os.getenv('CONFLUENCE_USERNAME')
+CONFLUENCE_API_TOKEN = os.getenv('CONFLUENCE_API_TOKEN')
+CONFLUENCE_SPACE_KEY = os.getenv('CONFLUENCE_SPACE_KEY')
 
 # Slack
 SLACK_BOT_TOKEN = os.getenv('SLACK_BOT_TOKEN')  # 공용 Bot Token (Secrets에만)
+SLACK_API_URL = os.getenv('SLACK_API_URL', 'https://slack.com/api')
+SLACK_CHANNEL_ID = os.getenv('SLACK_CHANNEL_ID')  # CLI(main.py)에서만 사용
+SLACK_CHANNEL_CACHE_PATH = os.getenv('SLACK_CHANNEL_CACHE_PATH', str(Path.home() / '.meeting_automation_slack_channels.json'))
+SLACK_CHANNEL_CACHE_TTL_SECONDS = int(os.getenv('SLACK_CHANNEL_CACHE_TTL_SECONDS', '3600'))
+# Slack 발송 속도 제한 (메서드별 토큰 버킷, 429 재시도)
+SLACK_RATE_PER_SECOND = float(os.getenv('SLACK_RATE_PER_SECOND', '4'))
+SLACK_RATE_BURST = int(os.getenv('SLACK_RATE_BURST', '10'))
+SLACK_MAX_RETRIES = int(os.getenv('SLACK_MAX_RETRIES', '5'))
+SLACK_RETRY_QUEUE_SIZE = int(os.getenv('SLACK_RETRY_QUEUE_SIZE', '100'))  # 재시도 대기 중인 메시지 수 상한
+
+# HTTP 연결 (Confluence/Slack 공용 Session 풀)
+HTTP_CONNECT_TIMEOUT = float(os.getenv('HTTP_CONNECT_TIMEOUT', '5'))
+HTTP_READ_TIMEOUT = float(os.getenv('HTTP_READ_TIMEOUT', '30'))
+HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', '10'))
+
+# 페이지 제목 중복 확인 캐시 (초)
+TITLE_CACHE_TTL_SECONDS = int(os.getenv('TITLE_CACHE_TTL_SECONDS', '300'))
+
+# LLM 응답 캐시 (웹 UI와 CLI가 공유)
+LLM_CACHE_PATH = os.getenv('LLM_CACHE_PATH', str(Path.home() / '.meeting_automation_llm_cache.sqlite3'))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv('LLM_CACHE_MAX_ENTRIES', '500'))
+LLM_CACHE_MAX_MB = int(os.getenv('LLM_CACHE_MAX_MB', '50'))
+LLM_CACHE_TTL_DAYS = int(os.getenv('LLM_CACHE_TTL_DAYS', '30'))
+
+# 일일 DM 액션아이템 색인 (페이지 ID·버전별 파싱 결과)
+ACTION_INDEX_PATH = os.getenv('ACTION_INDEX_PATH', str(Path.home() / '.meeting_automation_action_index.sqlite3'))
+
+# 일일 DM 실행 기록 (날짜별 JSONL, 같은 날 재실행 시 끝난 사용자 건너뜀)
+DM_JOURNAL_DIR = os.getenv('DM_JOURNAL_DIR', str(Path.home() / '.meeting_automation_dm_journal'))
+DM_JOURNAL_KEEP_DAYS = int(os.getenv('DM_JOURNAL_KEEP_DAYS', '14'))
+
+# 단계별 계측 기록 (JSONL)
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'true').lower() != 'false'
+METRICS_PATH = os.getenv('METRICS_PATH', str(Path.home() / '.meeting_automation_metrics.jsonl'))
+
+# 긴 회의록 map-reduce 처리
+LONG_NOTES_TOKEN_THRESHOLD = int(os.getenv('LONG_NOTES_TOKEN_THRESHOLD', '6000'))  # 이 이상이면 분할 처리
+CHUNK_MAX_TOKENS = int(os.getenv('CHUNK_MAX_TOKENS', '3000'))
+CHUNK_WORKERS = int(os.getenv('CHUNK_WORKERS', '4'))
 
 # 시스템 프롬프트
 SYSTEM_PROMPT_TITLE = """당신은 회의 제목을 생성하는 전문가입니다.
@@ -77,3 +121,66 @@ SYSTEM_PROMPT_SUMMARY = """당신은 회의록을 Slack용으로 간결하게 
 간결하고 명확하게 작성하세요.
 """
 
+
+SYSTEM_PROMPT_CHUNK_EXTRACT = """당신은 긴 회의록의 일부분에서 핵심 내용을 뽑아내는 전문가입니다.
+
+주어진 부분에서만 다음 항목을 추출해 JSON 객체로 반환하세요:
+{
+  "updates": ["정책/일정/담당부서 변경 등 주요 업데이트"],
+  "discussion_points": ["핵심 논의 내용"],
+  "decisions": ["명확한 결정 사항"],
+  "action_items": [{"task": "구체적인 작업 내용", "assignee": "담당자명 또는 TBD", "due": "YYYY-MM-DD 또는 TBD"}]
+}
+
+규칙:
+- 해당 내용이 없으면 빈 배열
+- 암묵적인 작업도 액션아이템으로 추출 (예: "수정이 필요하다")
+- 담당자/마감일이 없으면 "TBD"
+- JSON만 반환"""
+
+# one-shot 모드: 제목·구조화 회의록·액션아이템·Slack 요약을 한 번의 호출로 생성
+SYSTEM_PROMPT_BUNDLE = f"""당신은 배민 팀의 회의록 작성 전문 AI입니다.
+회의 내용을 한 번 읽고 아래 네 가지 결과를 JSON 하나로 반환합니다.
+
+## 1. title
+{SYSTEM_PROMPT_TITLE}
+(사용자가 회의명을 제공했다면 그대로 사용하세요)
+
+## 2. structured_markdown
+{SYSTEM_PROMPT_STRUCTURE}
+
+## 3. action_items
+structured_markdown의 "# 액션아이템" 섹션과 **같은 항목**을 배열로 반환하세요.
+- 암묵적인 작업도 적극적으로 추출하세요 (예: "수정이 필요하다" → 액션아이템)
+- 담당자가 없으면 "TBD", 마감일이 없으면 "TBD"
+- 마감일은 YYYY-MM-DD 형식
+- status: 회의록 체크박스와 같게, 이미 완료된 작업("- [x]")은 "complete", 나머지는 "incomplete"
+
+## 4. slack_summary
+{SYSTEM_PROMPT_SUMMARY}
+"""
+
+MEETING_BUNDLE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "structured_markdown": {"type": "string"},
+        "action_items": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "task": {"type": "string"},
+                    "assignee": {"type": "string"},
+                    "due": {"type": "string"},
+                    "status": {"type": "string", "enum": ["incomplete", "complete"]}
+                },
+                "required": ["task", "assignee", "due", "status"],
+                "additionalProperties": False
+            }
+        },
+        "slack_summary": {"type": "string"}
+    },
+    "required": ["title", "structured_markdown", "action_items", "slack_summary"],
+    "additionalProperties": False
+}
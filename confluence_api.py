@@ -0,0 +1,108 @@
+"""Confluence REST API 공용 함수"""
+
+import threading
+import time
+from typing import Dict, Iterator, Optional, Set
+
+import config
+import metrics
+
+
+# 회의록 페이지의 액션아이템 content property 키
+ACTION_ITEMS_PROPERTY_KEY = "meeting-action-items"
+
+
+def cql_quote(value: str) -> str:
+    """CQL 문자열 리터럴로 감싸기 (따옴표·역슬래시 이스케이프)"""
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def _next_url(data: dict) -> Optional[str]:
+    """검색 응답의 _links.next를 절대 URL로 변환 (없으면 None)"""
+    links = data.get('_links') or {}
+    next_link = links.get('next')
+    if not next_link:
+        return None
+    if next_link.startswith('http'):
+        return next_link
+    base = links.get('base') or f"{config.CONFLUENCE_URL}/wiki"
+    return base + next_link
+
+
+def iter_cql_search(session, cql: str, expand: str = None, limit: int = 100) -> Iterator[dict]:
+    """CQL 검색 결과를 _links.next를 따라가며 한 건씩 반환
+
+    한 번에 한 페이지 분량만 메모리에 올립니다.
+    HTTP 오류는 requests.HTTPError로 전파됩니다. 응답 상태는 현재 계측 단계에 기록합니다.
+    """
+    url = f"{config.CONFLUENCE_URL}/wiki/rest/api/content/search"
+    params = {"cql": cql, "limit": limit}
+    if expand:
+        params["expand"] = expand
+
+    while url:
+        response = session.get(url, params=params)
+        metrics.note(http_status=response.status_code)
+        response.raise_for_status()
+        data = response.json()
+        for result in data.get('results', []):
+            yield result
+        url = _next_url(data)
+        params = None  # next 링크에 쿼리가 모두 포함되어 있음
+
+
+def save_content_property(session, page_id: str, key: str, value) -> dict:
+    """페이지 content property 저장 (이미 있으면 새 버전으로 갱신)
+
+    HTTP 오류는 requests.HTTPError로 전파됩니다. 마지막 응답 상태는 현재 계측 단계에 기록합니다.
+    """
+    url = f"{config.CONFLUENCE_URL}/wiki/rest/api/content/{page_id}/property"
+    response = session.post(url, json={"key": key, "value": value})
+    if response.status_code in (400, 409):
+        # 이미 있는 키: 현재 버전을 읽어 다음 버전으로 PUT (없는 키면 처음 오류를 그대로 전파)
+        current = session.get(f"{url}/{key}")
+        if current.status_code == 200:
+            response = session.put(f"{url}/{key}", json={
+                "key": key,
+                "value": value,
+                "version": {"number": current.json()['version']['number'] + 1}
+            })
+    metrics.note(http_status=response.status_code)
+    response.raise_for_status()
+    return response.json()
+
+
+def content_property(page: dict, key: str):
+    """expand=metadata.properties.<key>로 받은 페이지의 property 값 (없으면 None)"""
+    prop = ((page.get('metadata') or {}).get('properties') or {}).get(key)
+    return prop.get('value') if prop else None
+
+
+class TitleCache:
+    """공간별 페이지 제목 캐시 (짧은 TTL)
+
+    연달아 발행할 때 같은 제목 목록을 다시 조회하지 않도록 사용합니다.
+    """
+
+    def __init__(self, ttl_seconds: float = None):
+        self.ttl = ttl_seconds if ttl_seconds is not None else config.TITLE_CACHE_TTL_SECONDS
+        self._entries: Dict[tuple, tuple] = {}
+        self._lock = threading.Lock()
+
+    def get(self, space_key: str, base_title: str) -> Optional[Set[str]]:
+        with self._lock:
+            entry = self._entries.get((space_key, base_title))
+            if entry is None or time.monotonic() - entry[0] > self.ttl:
+                return None
+            return set(entry[1])
+
+    def put(self, space_key: str, base_title: str, titles: Set[str]):
+        with self._lock:
+            self._entries[(space_key, base_title)] = (time.monotonic(), set(titles))
+
+    def add(self, space_key: str, title: str):
+        """새로 만든 페이지 제목을 해당 공간의 캐시 항목에 반영"""
+        with self._lock:
+            for (space, base_title), (_, titles) in self._entries.items():
+                if space == space_key and title.startswith(base_title):
+                    titles.add(title)
@@ -16,6 +16,7 @@ USERS = [
         "confluence_token": "ATATT3xFfGF0...",  # Confluence API Token (앱 사이드바 참고)
         "confluence_space": "~seonju",  # 검색할 공간 키
         "confluence_parent_id": "",  # 상위 페이지 ID (선택, 비워두면 공간 전체)
+        "assignee_names": ["고선주"],  # 회의록에 @로 적히는 담당자 이름 (선택, 비워두면 name 사용)
     },
     # 다른 사용자 추가 시:
     # {
@@ -25,13 +26,24 @@ USERS = [
     #     "confluence_token": "ATATT3xFfGF0...",
     #     "confluence_space": "TEAM-B",
     #     "confluence_parent_id": "123456789",
+    #     "assignee_names": ["김팀장", "김OO"],
     # },
 ]
 
 # DM 발송 시간 (한국 시간 기준, HH:MM 형식)
 SEND_TIME_KST = "09:00"
 
+# 분산 발송 (선택) - 설정하면 이 시각부터 SEND_TIME_KST 전까지 사용자를 나눠서 발송
+DELIVERY_WINDOW_START_KST = ""  # 예: "08:45" (비워두면 SEND_TIME_KST에 한 번에 발송)
+DELIVERY_SHARDS = 15  # 구간을 나눌 칸 수 (사용자는 slack_id 해시로 고정 배정)
+PREFETCH_LEAD_SECONDS = 120  # 각 칸의 발송 시각보다 먼저 Confluence 조회를 시작할 시간
+
 # 검색 범위 (일) - 최근 N일 이내 작성된 회의록만 검색
 SEARCH_DAYS = 60
 
-
+# 동시 처리 설정
+MAX_WORKERS = 8  # 동시에 처리할 사용자 수
+CONFLUENCE_CONCURRENCY = 4  # Confluence 동시 요청 수 상한
+SLACK_CONCURRENCY = 2  # Slack 동시 요청 수 상한
+USER_TIMEOUT_SECONDS = 120  # 사용자 한 명 처리 시간 상한 (넘기면 해당 사용자만 건너뜀, 발송 시작부터 끝나지 않은 회의록 수집도 중단)
+CONFLUENCE_MAX_RPS = 5  # Confluence 초당 요청 수 상한 (0이면 제한 없음)
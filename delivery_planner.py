@@ -0,0 +1,47 @@
+"""일일 DM 발송 계획
+
+사용자를 slack_id 해시로 샤드에 나누고, 발송 구간(예: 08:45~09:00)에 샤드별
+발송 시각을 고르게 배치합니다. 각 샤드의 Confluence 조회는 발송 시각보다
+prefetch_lead 초 먼저 시작해, 발송 시각에는 DM만 보내면 되도록 합니다.
+"""
+
+import hashlib
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+
+@dataclass
+class Slot:
+    """샤드 하나의 조회 시작 시각과 발송 시각"""
+    shard: int
+    prefetch_at: datetime
+    send_at: datetime
+    users: List[Dict] = field(default_factory=list)
+
+
+def shard_of(slack_id: str, shard_count: int) -> int:
+    """slack_id의 고정 샤드 번호 (실행마다, 프로세스마다 같음)"""
+    digest = hashlib.sha256(slack_id.encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') % shard_count
+
+
+def plan_slots(users: List[Dict], window_start: datetime, window_end: datetime,
+               shard_count: int, prefetch_lead: float = 0) -> List[Slot]:
+    """발송 구간을 shard_count칸으로 나눠 샤드별 발송 계획 생성
+
+    샤드 i는 window_start + i × (구간 길이 / shard_count)에 발송하므로 마지막 샤드도
+    window_end보다 한 칸 먼저 시작합니다. 사용자가 없는 샤드는 제외합니다.
+    """
+    if window_end <= window_start:
+        raise ValueError(f"발송 구간이 올바르지 않습니다: {window_start:%H:%M} ~ {window_end:%H:%M}")
+    shard_count = max(1, shard_count)
+    width = (window_end - window_start) / shard_count
+
+    slots = []
+    for shard in range(shard_count):
+        send_at = window_start + width * shard
+        slots.append(Slot(shard, send_at - timedelta(seconds=prefetch_lead), send_at))
+    for user in users:
+        slots[shard_of(user['slack_id'], shard_count)].users.append(user)
+    return [slot for slot in slots if slot.users]
@@ -0,0 +1,96 @@
+"""일일 DM 실행 기록 (체크포인트)
+
+실행 날짜(KST)별 JSONL 파일에 사용자마다 단계(sending, sent, no_items, failed, timed_out)와
+Slack 메시지 ts를 한 줄씩 남깁니다. 같은 날 다시 실행하면 이미 끝난 사용자는 건너뛰어
+남은 사용자만 처리하고, 중복 DM을 보내지 않습니다.
+"""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict
+
+import config
+
+
+# 한국 시간 (서머타임 없음). 발송 시각이 KST로 정해지므로 실행 날짜도 KST 기준으로 나눔
+# (호스트 시간대를 쓰면 UTC 서버에서 09:00 KST 발송이 자정 전후로 갈려 같은 날 재실행이 다른 파일을 엶)
+KST = timezone(timedelta(hours=9), 'KST')
+
+# 다시 실행해도 건너뛰는 단계
+# sending: 전송 직전에 남기며, sent 없이 끝났으면 전송 여부를 알 수 없으므로 다시 보내지 않음
+# no_items: 회의록 수집이 끝까지 성공한 경우에만 남음 (검색·조회 실패는 failed로 남아 재시도됨)
+DONE_STAGES = ("sent", "no_items", "sending")
+
+
+class RunJournal:
+    """실행 날짜 하나의 체크포인트 기록 (run_date 생략 시 오늘, KST 기준)"""
+
+    def __init__(self, run_date: str = None, directory: str = None):
+        self.run_date = run_date or datetime.now(KST).strftime('%Y-%m-%d')
+        self.directory = Path(directory or config.DM_JOURNAL_DIR)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.path = self.directory / f"{self.run_date}.jsonl"
+        self._lock = threading.Lock()
+        self._end_partial_line()
+
+    def _end_partial_line(self):
+        # 기록 도중 죽어서 마지막 줄이 잘렸으면 다음 기록이 거기에 붙지 않도록 줄바꿈 추가
+        try:
+            with open(self.path, 'rb+') as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() == 0:
+                    return
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    f.write(b'\n')
+        except FileNotFoundError:
+            pass
+
+    def record(self, user: Dict, stage: str, ts: str = None, **fields):
+        """사용자 단계 기록 (프로세스가 죽어도 남도록 바로 디스크에 씀)"""
+        line = json.dumps({
+            "run_date": self.run_date,
+            "slack_id": user['slack_id'],
+            "name": user['name'],
+            "stage": stage,
+            "ts": ts,
+            "at": datetime.now().isoformat(timespec='seconds'),
+            **fields
+        }, ensure_ascii=False)
+        with self._lock, open(self.path, 'a', encoding='utf-8') as f:
+            f.write(line + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def last_stages(self) -> Dict[str, dict]:
+        """slack_id → 마지막 기록"""
+        last = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # 기록 도중 죽어서 잘린 줄
+                    last[entry['slack_id']] = entry
+        except FileNotFoundError:
+            pass
+        return last
+
+    def finished(self) -> Dict[str, dict]:
+        """오늘 이미 끝난 사용자 (slack_id → 마지막 기록)"""
+        return {slack_id: entry for slack_id, entry in self.last_stages().items() if entry['stage'] in DONE_STAGES}
+
+    def prune(self, keep_days: int):
+        """keep_days일보다 오래된 기록 파일 삭제"""
+        cutoff = time.time() - keep_days * 86400
+        for path in self.directory.glob('*.jsonl'):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                continue
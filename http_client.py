@@ -0,0 +1,176 @@
+"""Confluence / Slack 공용 HTTP 클라이언트
+
+호스트·자격증명별로 keep-alive requests.Session을 재사용해 요청마다 TLS 연결을
+새로 맺지 않도록 하고, 타임아웃을 지정하지 않은 요청에는 기본 타임아웃을 적용합니다.
+
+웹 UI는 st.cache_resource로 HttpClient 하나를 공유하고,
+CLI와 일일 DM 스크립트는 default_client()를 사용합니다.
+"""
+
+import base64
+import hashlib
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import config
+
+
+def basic_auth_header(username: str, token: str) -> str:
+    """Confluence Basic 인증 헤더 값"""
+    auth_b64 = base64.b64encode(f"{username}:{token}".encode('ascii')).decode('ascii')
+    return f"Basic {auth_b64}"
+
+
+def _credential_key(*parts: str) -> str:
+    # 세션 캐시 키에 토큰 원문을 남기지 않도록 해시 사용
+    return hashlib.sha256(":".join(p or "" for p in parts).encode('utf-8')).hexdigest()
+
+
+class TokenBucket:
+    """초당 rate개, 최대 capacity개까지 모아 쓸 수 있는 토큰 버킷"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """토큰 하나를 얻을 때까지 대기"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Retry-After 동안 토큰 지급 중단 (모아둔 토큰도 비움)"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0
+            self._updated = self._paused_until
+
+
+class TimeoutSession(requests.Session):
+    """timeout 인자가 없으면 기본값을 넣어주는 Session
+
+    limiter(세마포어)가 지정되면 같은 호스트로 동시에 보내는 요청 수를,
+    rate_limiter(토큰 버킷)가 지정되면 초당 요청 수를 제한합니다.
+    """
+
+    def __init__(self, timeout, limiter: threading.Semaphore = None, rate_limiter: TokenBucket = None):
+        super().__init__()
+        self.timeout = timeout
+        self.limiter = limiter
+        self.rate_limiter = rate_limiter
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        if self.limiter is None:
+            return super().request(method, url, **kwargs)
+        with self.limiter:
+            return super().request(method, url, **kwargs)
+
+
+class HttpClient:
+    """호스트·자격증명별 Session 풀"""
+
+    def __init__(self, timeout: tuple = None, pool_size: int = None):
+        self.timeout = timeout or (config.HTTP_CONNECT_TIMEOUT, config.HTTP_READ_TIMEOUT)
+        self.pool_size = pool_size or config.HTTP_POOL_SIZE
+        self._sessions = {}
+        self._host_limiters = {}
+        self._rate_limiters = {}
+        self._lock = threading.Lock()
+
+    def limit_host(self, base_url: str, max_concurrent: int):
+        """호스트별 동시 요청 수 제한 (None 또는 0이면 제한 없음)
+
+        이미 만들어진 Session에도 적용됩니다.
+        """
+        host = urlparse(base_url).netloc
+        limiter = threading.BoundedSemaphore(max_concurrent) if max_concurrent else None
+        with self._lock:
+            self._host_limiters[host] = limiter
+            for (session_host, _), session in self._sessions.items():
+                if session_host == host:
+                    session.limiter = limiter
+
+    def limit_rate(self, base_url: str, per_second: float, burst: int = 1):
+        """호스트별 초당 요청 수 제한 (None 또는 0이면 제한 없음)
+
+        같은 호스트의 모든 Session(자격증명)이 버킷 하나를 나눠 씁니다.
+        """
+        host = urlparse(base_url).netloc
+        bucket = TokenBucket(per_second, burst) if per_second else None
+        with self._lock:
+            self._rate_limiters[host] = bucket
+            for (session_host, _), session in self._sessions.items():
+                if session_host == host:
+                    session.rate_limiter = bucket
+
+    def _session(self, base_url: str, credential: str, headers: dict) -> requests.Session:
+        host = urlparse(base_url).netloc
+        key = (host, credential)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = TimeoutSession(self.timeout, self._host_limiters.get(host), self._rate_limiters.get(host))
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update(headers)
+                self._sessions[key] = session
+            return session
+
+    def confluence(self, username: str, token: str) -> requests.Session:
+        """Confluence용 Session (Basic 인증 헤더 포함)"""
+        return self._session(
+            config.CONFLUENCE_URL,
+            _credential_key(username, token),
+            {"Authorization": basic_auth_header(username, token), "Content-Type": "application/json"}
+        )
+
+    def slack(self, bot_token: str = None) -> requests.Session:
+        """Slack Web API용 Session (Bearer 토큰 포함)"""
+        bot_token = bot_token or config.SLACK_BOT_TOKEN
+        return self._session(
+            config.SLACK_API_URL,
+            _credential_key(bot_token),
+            {"Authorization": f"Bearer {bot_token}", "Content-Type": "application/json"}
+        )
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+_default_client = None
+_default_lock = threading.Lock()
+
+
+def default_client() -> HttpClient:
+    """프로세스 전역 HttpClient (Streamlit 밖에서 사용)"""
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = HttpClient()
+        return _default_client
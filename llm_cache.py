@@ -0,0 +1,206 @@
+"""LLM 응답 캐시
+
+(model, 시스템 프롬프트, 사용자 프롬프트, temperature, max_tokens) 해시를 키로
+chat.completions 응답을 SQLite 파일에 저장합니다.
+웹 UI(app.py)와 CLI(main.py)가 같은 캐시 파일을 공유합니다.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import config
+import metrics
+from sqlite_store import connect
+
+
+# 응답 내용이 아니라 전달 방식만 바꾸는 요청 파라미터 (캐시 키에서 제외)
+_STREAMING_PARAMS = ('stream', 'stream_options')
+
+
+class LLMCache:
+    """크기·나이 기반 LRU 제거를 지원하는 디스크 캐시"""
+
+    def __init__(self, path: str = None, max_entries: int = None, max_bytes: int = None, max_age_days: float = None):
+        self.path = str(path or config.LLM_CACHE_PATH)
+        self.max_entries = max_entries if max_entries is not None else config.LLM_CACHE_MAX_ENTRIES
+        self.max_bytes = max_bytes if max_bytes is not None else config.LLM_CACHE_MAX_MB * 1024 * 1024
+        self.max_age = (max_age_days if max_age_days is not None else config.LLM_CACHE_TTL_DAYS) * 86400
+        self._lock = threading.Lock()
+        self._init_db()
+
+    def _init_db(self):
+        with self._lock, connect(self.path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            conn.execute("INSERT OR IGNORE INTO counters VALUES ('hits', 0), ('misses', 0)")
+
+    @staticmethod
+    def make_key(request: dict) -> str:
+        """요청 파라미터로 캐시 키 생성 (스트리밍 관련 옵션은 결과에 영향이 없으므로 제외)"""
+        material = {k: v for k, v in request.items() if k not in _STREAMING_PARAMS}
+        encoded = json.dumps(material, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+    def get(self, key: str):
+        """캐시된 응답 반환 (없거나 만료되었으면 None)"""
+        now = time.time()
+        with self._lock, connect(self.path) as conn:
+            row = conn.execute("SELECT payload, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row and now - row[1] <= self.max_age:
+                conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+                conn.execute("UPDATE counters SET value = value + 1 WHERE name = 'hits'")
+                return json.loads(row[0])
+            if row:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            conn.execute("UPDATE counters SET value = value + 1 WHERE name = 'misses'")
+            return None
+
+    def put(self, key: str, payload: dict):
+        """응답 저장 후 한도를 넘으면 오래 사용되지 않은 항목부터 제거"""
+        encoded = json.dumps(payload, ensure_ascii=False)
+        now = time.time()
+        with self._lock, connect(self.path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, encoded, len(encoded.encode('utf-8')), now, now)
+            )
+            self._evict(conn, now)
+
+    def _evict(self, conn, now: float):
+        conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.max_age,))
+        count, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+        stale_keys = []
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY last_access ASC"):
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            stale_keys.append((key,))
+            count -= 1
+            total -= size
+        conn.executemany("DELETE FROM responses WHERE key = ?", stale_keys)
+
+    def stats(self) -> dict:
+        """적중/미스 횟수와 현재 캐시 크기"""
+        with self._lock, connect(self.path) as conn:
+            counters = dict(conn.execute("SELECT name, value FROM counters"))
+            entries, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return {
+            "hits": counters.get('hits', 0),
+            "misses": counters.get('misses', 0),
+            "entries": entries,
+            "bytes": total
+        }
+
+    def clear(self):
+        """캐시 비우기 (카운터 포함)"""
+        with self._lock, connect(self.path) as conn:
+            conn.execute("DELETE FROM responses")
+            conn.execute("UPDATE counters SET value = 0")
+
+
+def _response_from_payload(payload: dict):
+    """캐시된 내용을 OpenAI 응답과 같은 모양의 객체로 변환"""
+    usage = payload.get('usage') or {}
+    return SimpleNamespace(
+        choices=[SimpleNamespace(
+            message=SimpleNamespace(role="assistant", content=payload['content']),
+            finish_reason=payload.get('finish_reason')
+        )],
+        usage=SimpleNamespace(
+            prompt_tokens=usage.get('prompt_tokens', 0),
+            completion_tokens=usage.get('completion_tokens', 0),
+            total_tokens=usage.get('total_tokens', 0)
+        ),
+        cached=True
+    )
+
+
+def _stream_from_payload(payload: dict):
+    """캐시된 내용을 스트리밍 청크 한 개로 반환"""
+    yield SimpleNamespace(choices=[SimpleNamespace(
+        delta=SimpleNamespace(content=payload['content']),
+        finish_reason=payload.get('finish_reason')
+    )])
+
+
+def _usage_dict(usage) -> dict:
+    if usage is None:
+        return {}
+    return {
+        "prompt_tokens": getattr(usage, 'prompt_tokens', 0),
+        "completion_tokens": getattr(usage, 'completion_tokens', 0),
+        "total_tokens": getattr(usage, 'total_tokens', 0)
+    }
+
+
+class _CachedCompletions:
+    def __init__(self, completions, cache: LLMCache):
+        self._completions = completions
+        self._cache = cache
+
+    def create(self, bypass_cache: bool = False, **kwargs):
+        """chat.completions.create와 같은 인자를 받습니다
+
+        bypass_cache=True이면 캐시를 조회하지 않고 새로 생성한 뒤 그 결과로 캐시를 갱신합니다.
+        """
+        key = self._cache.make_key(kwargs)
+        if not bypass_cache:
+            payload = self._cache.get(key)
+            if payload is not None:
+                metrics.note_usage(None, cached=True)
+                return _stream_from_payload(payload) if kwargs.get('stream') else _response_from_payload(payload)
+
+        if kwargs.get('stream'):
+            return self._stream_and_store(key, kwargs)
+
+        response = self._completions.create(**kwargs)
+        metrics.note_usage(getattr(response, 'usage', None))
+        choice = response.choices[0]
+        # 잘린 응답(finish_reason=length 등)은 저장하지 않음
+        if choice.finish_reason == 'stop':
+            self._cache.put(key, {
+                "content": choice.message.content,
+                "finish_reason": choice.finish_reason,
+                "usage": _usage_dict(getattr(response, 'usage', None))
+            })
+        return response
+
+    def _stream_and_store(self, key: str, kwargs: dict):
+        parts = []
+        finish_reason = None
+        for chunk in self._completions.create(**kwargs):
+            # stream_options.include_usage 요청 시 마지막 청크에 사용량이 담겨 옴
+            if getattr(chunk, 'usage', None):
+                metrics.note_usage(chunk.usage)
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                finish_reason = chunk.choices[0].finish_reason or finish_reason
+            yield chunk
+        if finish_reason == 'stop':
+            self._cache.put(key, {"content": "".join(parts), "finish_reason": finish_reason, "usage": {}})
+
+
+class CachedOpenAI:
+    """OpenAI 클라이언트 래퍼 - chat.completions.create 호출만 캐시하고 나머지는 그대로 위임"""
+
+    def __init__(self, client, cache: LLMCache = None):
+        self._client = client
+        self.cache = cache or LLMCache()
+        self.chat = SimpleNamespace(completions=_CachedCompletions(client.chat.completions, self.cache))
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
@@ -7,17 +7,26 @@
 4. Slack 요약 전송
 """
 
+import argparse
+import json
 import sys
-import base64
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-import requests
+from pathlib import Path
 from openai import OpenAI
 import config
+import metrics
+from llm_cache import CachedOpenAI
+from http_client import default_client
+from slack_dispatch import default_dispatcher
 
-# OpenAI 클라이언트
-client = OpenAI(api_key=config.OPENAI_API_KEY)
+# OpenAI 클라이언트 (웹 UI와 같은 응답 캐시 사용)
+client = CachedOpenAI(OpenAI(api_key=config.OPENAI_API_KEY))
 
 
+@metrics.timed("structure_meeting_notes")
 def structure_meeting_notes(meeting_title: str, meeting_notes: str) -> str:
     """회의록을 구조화"""
     print("📝 회의록 구조화 중...")
@@ -37,28 +46,25 @@ def structure_meeting_notes(meeting_title: str, meeting_notes: str) -> str:
     return structured_content
 
 
-def upload_to_confluence(title: str, content: str) -> dict:
-    """Confluence에 페이지 생성"""
-    print("📤 Confluence 업로드 중...")
+@metrics.timed("upload_to_confluence")
+def upload_to_confluence(title: str, content: str, item_id: str = None) -> dict:
+    """Confluence에 페이지 생성
     
-    # 인증 헤더
-    auth_string = f"{config.CONFLUENCE_USERNAME}:{config.CONFLUENCE_API_TOKEN}"
-    auth_bytes = auth_string.encode('ascii')
-    auth_b64 = base64.b64encode(auth_bytes).decode('ascii')
+    item_id를 주면 제목에 붙여, 같은 제목의 배치 항목이 같은 초에 올라가도 겹치지 않게 합니다.
+    """
+    print("📤 Confluence 업로드 중...")
     
     # 타임스탬프 추가 (중복 방지)
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     page_title = f"{title} – 회의록 ({timestamp})"
+    if item_id:
+        page_title = f"{title} – 회의록 ({timestamp}, {item_id})"
     
     # Confluence Storage Format으로 변환 (간단 버전)
     html_content = f"<h1>회의록</h1><pre>{content}</pre>"
     
     # API 요청
     url = f"{config.CONFLUENCE_URL}/wiki/rest/api/content"
-    headers = {
-        "Authorization": f"Basic {auth_b64}",
-        "Content-Type": "application/json"
-    }
     
     payload = {
         "type": "page",
@@ -74,7 +80,9 @@ def upload_to_confluence(title: str, content: str) -> dict:
         }
     }
     
-    response = requests.post(url, json=payload, headers=headers)
+    session = default_client().confluence(config.CONFLUENCE_USERNAME, config.CONFLUENCE_API_TOKEN)
+    response = session.post(url, json=payload)
+    metrics.note(http_status=response.status_code)
     
     if response.status_code in [200, 201]:
         result = response.json()
@@ -87,6 +95,7 @@ def upload_to_confluence(title: str, content: str) -> dict:
         return {"success": False, "error": response.text}
 
 
+@metrics.timed("create_slack_summary")
 def create_slack_summary(structured_content: str) -> str:
     """Slack용 요약 생성"""
     print("📊 Slack 요약 생성 중...")
@@ -106,6 +115,7 @@ def create_slack_summary(structured_content: str) -> str:
     return summary
 
 
+@metrics.timed("send_to_slack")
 def send_to_slack(summary: str, confluence_url: str = None) -> dict:
     """Slack 채널에 메시지 전송"""
     print("💬 Slack 전송 중...")
@@ -115,20 +125,8 @@ def send_to_slack(summary: str, confluence_url: str = None) -> dict:
     if confluence_url:
         message += f"\n\n---\n📄 *전체 회의록:* {confluence_url}"
     
-    # Slack API 요청
-    url = "https://slack.com/api/chat.postMessage"
-    headers = {
-        "Authorization": f"Bearer {config.SLACK_BOT_TOKEN}",
-        "Content-Type": "application/json"
-    }
-    
-    payload = {
-        "channel": config.SLACK_CHANNEL_ID,
-        "text": message
-    }
-    
-    response = requests.post(url, json=payload, headers=headers)
-    result = response.json()
+    # Slack API 요청 (속도 제한·재시도는 dispatcher가 처리)
+    result = default_dispatcher().post_message(config.SLACK_CHANNEL_ID, message)
     
     if result.get("ok"):
         print("✅ Slack 전송 완료")
@@ -207,7 +205,152 @@ def main():
         sys.exit(1)
 
 
+def load_batch_items(source: str) -> list:
+    """배치 입력 읽기
+    
+    - 디렉터리: 안의 .md/.txt 파일 (파일 이름이 회의 제목)
+    - JSONL: 한 줄에 {"id", "title", "notes"} 또는 {"id", "title", "path"} (id 생략 시 title)
+    """
+    path = Path(source)
+    items = []
+    if path.is_dir():
+        for file in sorted(path.rglob('*')):
+            if file.is_file() and file.suffix.lower() in ('.md', '.txt'):
+                items.append({"id": str(file.relative_to(path)), "title": file.stem, "path": str(file)})
+        return items
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if 'notes' not in entry and 'path' not in entry:
+                raise ValueError(f"{path}:{line_no}: notes 또는 path가 필요합니다")
+            if entry.get('path'):
+                # 상대 경로는 manifest 위치 기준
+                entry['path'] = str((path.parent / entry['path']).resolve())
+            entry.setdefault('title', Path(entry.get('path', '')).stem or f"회의록 {line_no}")
+            entry.setdefault('id', entry['title'])
+            items.append(entry)
+    return items
+
+
+def load_previous_results(results_path: str) -> dict:
+    """결과 manifest에서 항목 id별 마지막 기록"""
+    latest = {}
+    try:
+        with open(results_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                latest[entry['id']] = entry
+    except FileNotFoundError:
+        pass
+    return latest
+
+
+def process_batch_item(item: dict, openai_slots: threading.Semaphore, send_slack: bool, uploaded_url: str = None) -> dict:
+    """항목 하나 처리 (구조화 → 업로드 → 요약 → Slack) 후 결과 기록용 dict 반환
+    
+    OpenAI 호출은 openai_slots로, Confluence 요청은 HttpClient의 호스트별 제한으로 동시 실행 수를 맞춥니다.
+    uploaded_url이 있으면(이전 실행에서 업로드까지 성공) 업로드를 건너뛰고 요약·Slack만 다시 시도합니다.
+    구조화 결과는 응답 캐시에서 다시 읽습니다.
+    뒤 단계가 실패해도 url은 결과에 남겨 다음 실행에서 같은 페이지를 다시 만들지 않게 합니다.
+    """
+    result = {"id": item['id'], "title": item['title'], "status": "failed", "url": uploaded_url, "timings_ms": {}}
+    timings = result["timings_ms"]
+    
+    def timed_step(name, func, *args):
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            timings[name] = round((time.perf_counter() - start) * 1000, 1)
+    
+    try:
+        notes = item.get('notes')
+        if notes is None:
+            notes = Path(item['path']).read_text(encoding='utf-8')
+        
+        with openai_slots:
+            structured_content = timed_step("structure", structure_meeting_notes, item['title'], notes)
+        
+        if not result["url"]:
+            confluence_result = timed_step("upload", upload_to_confluence, item['title'], structured_content, item['id'])
+            if not confluence_result.get('success'):
+                raise RuntimeError(f"Confluence 업로드 실패: {confluence_result.get('error', '')[:200]}")
+            result["url"] = confluence_result['url']
+        
+        if send_slack:
+            with openai_slots:
+                slack_summary = timed_step("summary", create_slack_summary, structured_content)
+            slack_result = timed_step("slack", send_to_slack, slack_summary, result["url"])
+            if not slack_result.get('success'):
+                raise RuntimeError(f"Slack 전송 실패: {slack_result.get('error')}")
+        
+        result["status"] = "success"
+    except Exception as e:
+        result["error"] = str(e)
+    
+    result["finished_at"] = datetime.now().isoformat(timespec='seconds')
+    return result
+
+
+def run_batch(source: str, results_path: str, openai_concurrency: int, confluence_concurrency: int, send_slack: bool):
+    """디렉터리 또는 JSONL manifest의 회의록을 동시에 처리
+    
+    항목이 끝날 때마다 results_path(JSONL)에 결과를 추가하며,
+    다시 실행하면 이미 성공한 항목은 건너뛰고, 업로드까지 된 항목은 요약·Slack만 다시 시도합니다.
+    """
+    items = load_batch_items(source)
+    previous = load_previous_results(results_path)
+    pending = [item for item in items if previous.get(item['id'], {}).get('status') != 'success']
+    print(f"🚀 배치 처리 시작: {len(items)}건 중 {len(pending)}건 처리 (이미 성공 {len(items) - len(pending)}건 건너뜀)\n")
+    
+    default_client().limit_host(config.CONFLUENCE_URL, confluence_concurrency)
+    openai_slots = threading.BoundedSemaphore(openai_concurrency)
+    
+    started = time.perf_counter()
+    done = failed = 0
+    with ThreadPoolExecutor(max_workers=openai_concurrency + confluence_concurrency) as executor, \
+            open(results_path, 'a', encoding='utf-8') as results_file:
+        futures = [executor.submit(process_batch_item, item, openai_slots, send_slack,
+                                   previous.get(item['id'], {}).get('url')) for item in pending]
+        for future in as_completed(futures):
+            result = future.result()
+            results_file.write(json.dumps(result, ensure_ascii=False) + '\n')
+            results_file.flush()
+            done += 1
+            if result["status"] == "success":
+                print(f"[{done}/{len(pending)}] ✅ {result['id']} → {result['url']}", flush=True)
+            else:
+                failed += 1
+                print(f"[{done}/{len(pending)}] ❌ {result['id']}: {result.get('error')}", flush=True)
+    
+    elapsed = time.perf_counter() - started
+    rate = done / elapsed * 60 if elapsed > 0 else 0
+    print(f"\n📊 {done}건 처리 (실패 {failed}건), {elapsed:.1f}초, 분당 {rate:.1f}건")
+    print(f"📄 결과: {results_path}")
+    return failed
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="회의록 자동화 (인자 없이 실행하면 샘플 회의록 1건 처리)")
+    parser.add_argument('--batch', metavar='PATH', help="회의록 디렉터리(.md/.txt) 또는 JSONL manifest")
+    parser.add_argument('--results', default='batch_results.jsonl', help="결과 manifest 경로 (기본: batch_results.jsonl)")
+    parser.add_argument('--openai-concurrency', type=int, default=4, help="OpenAI 동시 호출 수 (기본: 4)")
+    parser.add_argument('--confluence-concurrency', type=int, default=2, help="Confluence 동시 요청 수 (기본: 2)")
+    parser.add_argument('--slack', action='store_true', help="항목마다 Slack 요약도 전송 (기본: 업로드만)")
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
+    args = parse_args()
+    if args.batch:
+        failed = run_batch(args.batch, args.results, args.openai_concurrency, args.confluence_concurrency, args.slack)
+        sys.exit(1 if failed else 0)
     main()
 
 
@@ -0,0 +1,166 @@
+"""파이프라인 단계별 계측
+
+단계마다 소요 시간, 프롬프트/완료 토큰, HTTP 상태, 재시도 횟수를 기록해
+로컬 JSONL 파일에 한 줄씩 추가합니다.
+
+사용 예:
+    @metrics.timed("upload_to_confluence")
+    def upload_to_confluence(...):
+        response = requests.post(...)
+        metrics.note(http_status=response.status_code)
+"""
+
+import contextvars
+import functools
+import json
+import math
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List
+
+import config
+
+
+_current_record = contextvars.ContextVar('metrics_record', default=None)
+_lock = threading.Lock()
+
+
+def _append(record: dict):
+    if not config.METRICS_ENABLED:
+        return
+    line = json.dumps(record, ensure_ascii=False)
+    try:
+        with _lock, open(config.METRICS_PATH, 'a', encoding='utf-8') as f:
+            f.write(line + '\n')
+    except OSError as e:
+        print(f"⚠️  계측 기록 실패: {e}")
+
+
+@contextmanager
+def stage(name: str):
+    """단계 하나를 계측 (예외가 나도 기록 후 그대로 전파)
+
+    Streamlit의 재실행·중단(BaseException 계열)으로 도중에 끝난 경우도 실패로 기록합니다.
+    """
+    record = {
+        "stage": name,
+        "started_at": datetime.now().isoformat(timespec='seconds'),
+        "elapsed_ms": 0.0,
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "http_status": None,
+        "retries": 0,
+        "cached": False,
+        "ok": True
+    }
+    token = _current_record.set(record)
+    start = time.perf_counter()
+    try:
+        yield record
+    except BaseException as e:
+        record["ok"] = False
+        record["error"] = type(e).__name__
+        raise
+    finally:
+        record["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        _current_record.reset(token)
+        _append(record)
+
+
+def timed(name: str):
+    """함수 전체를 하나의 단계로 계측하는 데코레이터"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def bind(func):
+    """현재 단계 컨텍스트를 다른 스레드에서도 쓰도록 함수에 묶기
+
+    ThreadPoolExecutor 작업은 컨텍스트를 물려받지 않으므로, 하위 호출의 토큰을
+    바깥 단계에 합산하려면 제출 전에 감싸야 합니다.
+    """
+    context = contextvars.copy_context()
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return context.copy().run(func, *args, **kwargs)
+    return wrapper
+
+
+def note(http_status: int = None, retries: int = 0, cached: bool = None, **fields):
+    """현재 단계 기록에 값 추가 (계측 중이 아니면 무시)"""
+    record = _current_record.get()
+    if record is None:
+        return
+    with _lock:
+        if http_status is not None:
+            record["http_status"] = http_status
+        if retries:
+            record["retries"] += retries
+        if cached is not None:
+            record["cached"] = cached
+        record.update(fields)
+
+
+def note_usage(usage, cached: bool = False):
+    """OpenAI usage 객체의 토큰 수를 현재 단계에 합산"""
+    record = _current_record.get()
+    if record is None:
+        return
+    with _lock:
+        if usage is not None:
+            record["prompt_tokens"] += getattr(usage, 'prompt_tokens', 0) or 0
+            record["completion_tokens"] += getattr(usage, 'completion_tokens', 0) or 0
+        record["cached"] = record["cached"] or cached
+
+
+def load_records(path: str = None, limit: int = 5000) -> List[dict]:
+    """JSONL에서 최근 기록 읽기"""
+    records = []
+    try:
+        with open(path or config.METRICS_PATH, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+    except FileNotFoundError:
+        return []
+    return records[-limit:] if limit else records
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """nearest-rank 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(records: List[dict]) -> Dict[str, dict]:
+    """단계별 p50/p95 소요 시간과 평균 토큰 수"""
+    by_stage = {}
+    for record in records:
+        by_stage.setdefault(record.get("stage", "?"), []).append(record)
+
+    summary = {}
+    for name, items in by_stage.items():
+        elapsed = [r.get("elapsed_ms", 0.0) for r in items]
+        summary[name] = {
+            "count": len(items),
+            "p50_ms": percentile(elapsed, 50),
+            "p95_ms": percentile(elapsed, 95),
+            "avg_prompt_tokens": round(sum(r.get("prompt_tokens", 0) for r in items) / len(items)),
+            "avg_completion_tokens": round(sum(r.get("completion_tokens", 0) for r in items) / len(items)),
+            "errors": sum(1 for r in items if not r.get("ok", True)),
+            "retries": sum(r.get("retries", 0) for r in items)
+        }
+    return summary
@@ -0,0 +1,122 @@
+"""파이프라인 단계 병렬 실행기
+
+서로 의존하지 않는 단계는 동시에 실행하고, 실제 의존성이 있는 곳에서만 합류합니다.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Sequence
+
+
+# 단계 상태
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+SKIPPED = 'skipped'
+
+
+@dataclass
+class Stage:
+    """실행 단계 정의
+
+    func는 deps에 나열된 단계들의 결과를 순서대로 인자로 받습니다.
+    """
+    name: str
+    func: Callable
+    deps: Sequence[str] = ()
+    label: str = ""
+
+
+def _check_graph(stages: List[Stage]):
+    """의존성 그래프 검증 (없는 단계 참조, 순환 참조)"""
+    names = [s.name for s in stages]
+    if len(names) != len(set(names)):
+        raise ValueError("단계 이름이 중복되었습니다")
+
+    by_name = {s.name: s for s in stages}
+    for s in stages:
+        for dep in s.deps:
+            if dep not in by_name:
+                raise ValueError(f"'{s.name}' 단계가 존재하지 않는 단계 '{dep}'에 의존합니다")
+
+    # 위상 정렬로 순환 검사
+    resolved = set()
+    remaining = list(stages)
+    while remaining:
+        ready = [s for s in remaining if all(d in resolved for d in s.deps)]
+        if not ready:
+            raise ValueError(f"순환 의존성: {', '.join(s.name for s in remaining)}")
+        resolved.update(s.name for s in ready)
+        remaining = [s for s in remaining if s.name not in resolved]
+
+
+def _timed_call(func: Callable, args: list) -> tuple:
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def run_stages(stages: List[Stage], max_workers: int = 4, on_update: Callable = None) -> Dict[str, object]:
+    """단계들을 의존성 순서에 맞춰 병렬 실행
+
+    on_update(name, status, statuses, elapsed)는 호출한 스레드에서만 불리므로
+    Streamlit 위젯을 바로 갱신해도 안전합니다.
+
+    실패한 단계에 의존하는 단계는 건너뛰며, 나머지 단계가 모두 끝난 뒤
+    첫 번째 실패 예외를 다시 발생시킵니다.
+    """
+    _check_graph(stages)
+
+    statuses = {s.name: PENDING for s in stages}
+    results = {}
+    elapsed = {}
+    errors = {}
+
+    def notify(name):
+        if on_update:
+            on_update(name, statuses[name], dict(statuses), dict(elapsed))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        running = {}
+
+        while True:
+            # 실행 가능한 단계 제출 (건너뛰기는 연쇄적으로 전파될 수 있어 변화가 없을 때까지 반복)
+            changed = True
+            while changed:
+                changed = False
+                for s in stages:
+                    if statuses[s.name] != PENDING:
+                        continue
+                    dep_states = [statuses[d] for d in s.deps]
+                    if any(state in (FAILED, SKIPPED) for state in dep_states):
+                        statuses[s.name] = SKIPPED
+                        notify(s.name)
+                        changed = True
+                    elif all(state == DONE for state in dep_states):
+                        args = [results[d] for d in s.deps]
+                        running[executor.submit(_timed_call, s.func, args)] = s.name
+                        statuses[s.name] = RUNNING
+                        notify(s.name)
+                        changed = True
+
+            if not running:
+                break
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                try:
+                    results[name], elapsed[name] = future.result()
+                    statuses[name] = DONE
+                except Exception as e:
+                    errors[name] = e
+                    statuses[name] = FAILED
+                notify(name)
+
+    for s in stages:
+        if s.name in errors:
+            raise errors[s.name]
+
+    return results
@@ -1,65 +1,161 @@
 """
 일일 DM 스케줄러
 
-매일 오전 9시(KST)에 send_daily_dm.py를 자동 실행
+매일 오전 9시(KST)에 send_daily_dm을 같은 프로세스에서 실행
+DELIVERY_WINDOW_START_KST가 설정되어 있으면 그 시각부터 SEND_TIME_KST 전까지
+사용자를 샤드별로 나눠 발송
+daily_dm_config는 매 실행 전에 다시 읽음 (재시작 없이 설정 변경 반영)
 """
 
-import schedule
+import importlib
 import time
-import subprocess
-from datetime import datetime
+from datetime import datetime, timedelta
 import daily_dm_config as dm_config
+import send_daily_dm
+from delivery_planner import plan_slots
+from dm_journal import KST
+
+# 시계 변경·절전 복귀에 대비해 긴 대기는 나눠서 다시 계산 (초)
+MAX_SLEEP_SECONDS = 300
+
+
+def next_run_at(send_time_kst: str, now: datetime = None) -> datetime:
+    """다음 발송 시각 (KST, 오늘 시각이 지났으면 내일)"""
+    now = now or datetime.now(KST)
+    hour, minute = map(int, send_time_kst.split(':'))
+    run_at = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if run_at <= now:
+        run_at += timedelta(days=1)
+    return run_at
+
+
+def sleep_until(run_at: datetime):
+    """run_at(KST)까지 대기"""
+    while True:
+        remaining = (run_at - datetime.now(KST)).total_seconds()
+        if remaining <= 0:
+            return
+        time.sleep(min(remaining, MAX_SLEEP_SECONDS))
+
+
+def reload_config():
+    """daily_dm_config.py 다시 읽기
+    
+    스케줄러는 한 프로세스로 계속 돌기 때문에, 매 실행 전에 다시 읽어 USERS 추가·삭제나
+    발송 시각 변경을 재시작 없이 반영합니다. send_daily_dm도 같은 모듈 객체를 쓰므로
+    함께 반영됩니다. 파일에 오류가 있으면 알리고 이미 읽은 설정으로 계속 진행합니다.
+    """
+    try:
+        importlib.reload(dm_config)
+    except Exception as e:
+        print(f"⚠️ daily_dm_config 다시 읽기 실패 (이전 설정으로 진행): {e}", flush=True)
 
 
 def run_daily_dm():
-    """일일 DM 스크립트 실행"""
+    """일일 DM 실행 (사용자별 진행 상황은 send_daily_dm이 바로 출력)"""
     print(f"\n{'='*50}")
     print(f"⏰ 스케줄 실행: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"{'='*50}\n")
-    
+    print(f"{'='*50}\n", flush=True)
+
     try:
-        result = subprocess.run(
-            ["python3", "send_daily_dm.py"],
-            capture_output=True,
-            text=True,
-            timeout=300  # 5분 타임아웃
-        )
-        
-        print(result.stdout)
-        if result.stderr:
-            print(f"⚠️  Errors:\n{result.stderr}")
-        
+        send_daily_dm.main()
+
         print(f"\n{'='*50}")
         print(f"✅ 실행 완료: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"{'='*50}\n")
-        
-    except subprocess.TimeoutExpired:
-        print("❌ 타임아웃: 5분 초과")
+        print(f"{'='*50}\n", flush=True)
+
     except Exception as e:
-        print(f"❌ 오류 발생: {e}")
+        print(f"❌ 오류 발생: {e}", flush=True)
+
+
+def at_kst_time(day: datetime, hhmm: str) -> datetime:
+    """day(KST)와 같은 날의 HH:MM"""
+    hour, minute = map(int, hhmm.split(':'))
+    return day.replace(hour=hour, minute=minute, second=0, microsecond=0)
+
+
+def run_planned_window(window_end: datetime, window_start_kst: str):
+    """발송 구간에 샤드별로 나눠 실행 (각 샤드는 발송 전에 미리 조회)
+
+    window_start_kst는 대기를 시작할 때 읽은 값으로, 그사이 설정이 바뀌어도 이번 구간은 그대로 진행합니다.
+    """
+    window_start = at_kst_time(window_end, window_start_kst)
+    slots = plan_slots(
+        dm_config.USERS,
+        window_start,
+        window_end,
+        getattr(dm_config, 'DELIVERY_SHARDS', 15),
+        getattr(dm_config, 'PREFETCH_LEAD_SECONDS', 120)
+    )
+
+    bot_token = send_daily_dm.load_bot_token()
+    if not bot_token:
+        print("❌ SLACK_BOT_TOKEN이 설정되지 않았습니다.")
+        return
+
+    print(f"\n{'='*50}")
+    print(f"⏰ 발송 구간: {window_start:%H:%M} ~ {window_end:%H:%M} KST, 샤드 {len(slots)}개")
+    print(f"{'='*50}\n", flush=True)
+
+    # 실행 기록은 구간의 발송 날짜(KST)로 묶음
+    run = send_daily_dm.DailyDMRun(bot_token, run_date=window_end.strftime('%Y-%m-%d'))
+    # 같은 시각이면 조회 시작을 발송보다 먼저
+    events = sorted(
+        [(slot.prefetch_at, 0, slot) for slot in slots] + [(slot.send_at, 1, slot) for slot in slots],
+        key=lambda event: event[:2]
+    )
+    try:
+        for at, is_send, slot in events:
+            sleep_until(at)
+            if is_send:
+                print(f"📨 샤드 {slot.shard} 발송 ({len(slot.users)}명)", flush=True)
+                run.deliver(slot.users)
+            else:
+                run.prefetch(slot.users)
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}", flush=True)
+    finally:
+        run.close()
+
+    print(f"\n{'='*50}")
+    print(f"✅ 실행 완료: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"{'='*50}\n", flush=True)
 
 
 def main():
     """스케줄러 시작"""
-    
+
     print("🕐 일일 액션아이템 DM 스케줄러 시작")
     print(f"⏰ 발송 시간: 매일 {dm_config.SEND_TIME_KST} (한국 시간)")
     print(f"📋 설정된 사용자: {len(dm_config.USERS)}명")
     print("\n" + "="*50)
     print("스케줄러 실행 중... (종료: Ctrl+C)")
     print("="*50 + "\n")
-    
-    # 매일 9시에 실행
-    schedule.every().day.at(dm_config.SEND_TIME_KST).do(run_daily_dm)
-    
+
     # 즉시 테스트 실행 (첫 시작 시)
     print("🧪 초기 테스트 실행...")
     run_daily_dm()
-    
-    # 스케줄러 루프
+
+    # 스케줄러 루프 (다음 발송 시각까지 정확히 대기)
+    # 설정은 실행할 때마다 다시 읽으며, 발송 시각·구간 변경은 다음 날 일정부터 반영
+    run_at = next_run_at(dm_config.SEND_TIME_KST)
     while True:
-        schedule.run_pending()
-        time.sleep(60)  # 1분마다 체크
+        window_start_kst = getattr(dm_config, 'DELIVERY_WINDOW_START_KST', None)
+        if window_start_kst:
+            # 첫 샤드 조회 시작 전에 깨어나 구간 전체를 처리 (지난 슬롯은 바로 실행)
+            print(f"💤 다음 발송 구간: {run_at:%Y-%m-%d} {window_start_kst} ~ {run_at:%H:%M} KST", flush=True)
+            sleep_until(at_kst_time(run_at, window_start_kst) - timedelta(seconds=getattr(dm_config, 'PREFETCH_LEAD_SECONDS', 120)))
+            reload_config()
+            run_planned_window(run_at, window_start_kst)
+        else:
+            print(f"💤 다음 실행: {run_at.strftime('%Y-%m-%d %H:%M')} KST", flush=True)
+            sleep_until(run_at)
+            reload_config()
+            run_daily_dm()
+        
+        # 구간 발송은 run_at 전에 끝날 수 있으므로 방금 처리한 발송 시각 이후로 계산
+        # (지금 기준이면 같은 날 구간을 곧바로 다시 실행함)
+        run_at = next_run_at(dm_config.SEND_TIME_KST, now=max(datetime.now(KST), run_at))
 
 
 if __name__ == "__main__":
@@ -67,5 +163,3 @@ if __name__ == "__main__":
         main()
     except KeyboardInterrupt:
         print("\n\n👋 스케줄러 종료")
-
-
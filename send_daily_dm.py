@@ -4,24 +4,30 @@
 매일 실행되어 미완료 액션아이템을 Slack DM으로 전송
 """
 
-import requests
-import base64
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime, timedelta
-import re
-from typing import List, Dict
+import time
+from typing import Dict, Iterator, List
+import config
 import daily_dm_config as dm_config
+from http_client import default_client
+from slack_dispatch import default_dispatcher
+from dm_journal import RunJournal
+from confluence_api import ACTION_ITEMS_PROPERTY_KEY, content_property, iter_cql_search
+from action_index import ActionItemIndex
+from utils import action_items_from_property, parse_action_items
 
 
-def search_meeting_notes(username: str, token: str, space_key: str, parent_id: str = None) -> List[Dict]:
-    """Confluence에서 회의록 검색"""
+def search_meeting_notes(username: str, token: str, space_key: str, parent_id: str = None,
+                         expand: str = "version") -> Iterator[Dict]:
+    """Confluence에서 회의록 검색 (페이지 단위로 yield)
     
-    auth_string = f"{username}:{token}"
-    auth_b64 = base64.b64encode(auth_string.encode('ascii')).decode('ascii')
+    _links.next를 따라 모든 결과 페이지를 순회하며, 한 번에 한 결과 페이지 분량만
+    메모리에 올립니다. 기본으로는 본문 없이 버전 번호만 받아옵니다.
     
-    headers = {
-        "Authorization": f"Basic {auth_b64}",
-        "Content-Type": "application/json"
-    }
+    중간 결과 페이지에서 실패해도 일부 목록으로 DM을 보내지 않도록, HTTP 오류는
+    잡지 않고 호출한 쪽으로 전파합니다.
+    """
     
     # CQL 쿼리 생성
     date_limit = (datetime.now() - timedelta(days=dm_config.SEARCH_DAYS)).strftime('%Y-%m-%d')
@@ -31,67 +37,132 @@ def search_meeting_notes(username: str, token: str, space_key: str, parent_id: s
     if parent_id:
         cql += f' AND ancestor="{parent_id}"'
     
-    url = f"https://woowahanbros.atlassian.net/wiki/rest/api/content/search"
-    params = {
-        "cql": cql,
-        "limit": 100,
-        "expand": "body.storage,version,history"
-    }
+    session = default_client().confluence(username, token)
     
-    try:
-        response = requests.get(url, headers=headers, params=params, timeout=30)
-        response.raise_for_status()
-        results = response.json()
-        return results.get('results', [])
-    except Exception as e:
-        print(f"❌ 회의록 검색 실패: {e}")
-        return []
+    yield from iter_cql_search(session, cql, expand=expand, limit=100)
 
 
-def parse_action_items(page_content: str, page_url: str, page_title: str) -> List[Dict]:
-    """회의록에서 액션아이템 파싱"""
-    
+def fetch_page_body(username: str, token: str, page_id: str, timeout: float = 30) -> Dict:
+    """페이지 본문(storage)과 현재 버전 조회"""
+    
+    url = f"{config.CONFLUENCE_URL}/wiki/rest/api/content/{page_id}"
+    response = default_client().confluence(username, token).get(
+        url, params={"expand": "body.storage,version"}, timeout=timeout
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+def collect_action_items(user: Dict, index: ActionItemIndex, budget: Dict = None) -> Dict:
+    """사용자 공간의 미완료 액션아이템 수집
+    
+    목록의 버전이 색인과 같으면 색인된 결과를 쓰고, 새 페이지나 버전이 바뀐
+    페이지는 발행 시 저장한 액션아이템 property를 씁니다. property가 없거나
+    발행 후 페이지가 수정되었으면 본문을 받아 파싱합니다.
+    
+    budget["deadline"](time.monotonic() 기준, 없으면 무제한)이 지나면 페이지 사이에서
+    FutureTimeoutError로 중단해 작업 슬롯을 비웁니다. 발송이 시작될 때 정해지므로
+    수집 도중에 설정될 수 있으며, 본문 조회 요청의 timeout도 남은 시간으로 줄입니다.
+    """
+    budget = budget if budget is not None else {}
+    
+    def remaining():
+        deadline = budget.get("deadline")
+        if deadline is None:
+            return None
+        left = deadline - time.monotonic()
+        if left <= 0:
+            raise FutureTimeoutError(f"회의록 수집 시간 초과 ({user['confluence_space']})")
+        return left
+    
+    pages = search_meeting_notes(
+        user['confluence_username'],
+        user['confluence_token'],
+        user['confluence_space'],
+        user.get('confluence_parent_id'),
+        expand=f"version,metadata.properties.{ACTION_ITEMS_PROPERTY_KEY}"
+    )
+    
+    page_count = 0
+    fetched = 0
+    from_property = 0
     action_items = []
+    for page in pages:
+        remaining()
+        page_count += 1
+        items = index.get(page['id'], page['version']['number'])
+        saved = content_property(page, ACTION_ITEMS_PROPERTY_KEY) if items is None else None
+        if saved and saved.get('page_version') == page['version']['number']:
+            page_url = f"{config.CONFLUENCE_URL}/wiki{page['_links']['webui']}"
+            items = action_items_from_property(saved, page_url, page['title'])
+            index.put(page['id'], page['version']['number'], items)
+            from_property += 1
+        elif items is None:
+            left = remaining()
+            page = fetch_page_body(user['confluence_username'], user['confluence_token'], page['id'],
+                                   timeout=30 if left is None else min(30, left))
+            page_url = f"{config.CONFLUENCE_URL}/wiki{page['_links']['webui']}"
+            items = parse_action_items(page['body']['storage']['value'], page_url, page['title'])
+            # 목록 조회 후 수정되었을 수 있으므로 실제로 받은 본문의 버전으로 저장
+            index.put(page['id'], page['version']['number'], items)
+            fetched += 1
+        action_items.extend(items)
+    
+    return {
+        "pages": page_count,
+        "fetched": fetched,
+        "from_property": from_property,
+        "action_items": action_items,
+        "by_assignee": group_by_assignee(action_items)
+    }
+
+
+def assignee_key(name: str) -> str:
+    """담당자 이름 비교용 키 (앞의 @, 공백, 대소문자 무시)"""
+    return ''.join(name.lstrip('@').split()).lower()
+
+
+def group_by_assignee(action_items: List[Dict]) -> Dict[str, List[Dict]]:
+    """담당자 → 액션아이템 역색인 (한 번만 훑어서 생성)"""
     
-    # <ac:task> 태그에서 액션아이템 추출
-    task_pattern = r'<ac:task><ac:task-id>(.*?)</ac:task-id><ac:task-status>(.*?)</ac:task-status><ac:task-body><span[^>]*>(.*?)</span></ac:task-body></ac:task>'
-    
-    tasks = re.findall(task_pattern, page_content, re.DOTALL)
-    
-    for task_id, status, content in tasks:
-        # 미완료 항목만
-        if status.strip() != 'incomplete':
-            continue
-        
-        # 담당자 추출 (@이름)
-        assignee_match = re.search(r'@([^\s—]+)', content)
-        assignee = assignee_match.group(1) if assignee_match else 'TBD'
-        
-        # 마감일 추출
-        due_date = None
-        due_match = re.search(r'<time datetime="([^"]+)"', content)
-        if due_match:
-            due_date = due_match.group(1)
-        else:
-            # Due: YYYY-MM-DD 형식도 확인
-            due_text_match = re.search(r'Due:\s*(\d{4}-\d{2}-\d{2})', content)
-            if due_text_match:
-                due_date = due_text_match.group(1)
-        
-        # 작업 내용 정리 (HTML 태그 제거)
-        task_text = re.sub(r'<[^>]+>', '', content)
-        task_text = re.sub(r'—\s*@.*?—.*', '', task_text).strip()
-        
-        if task_text and due_date and due_date != 'TBD':
-            action_items.append({
-                'task': task_text,
-                'assignee': assignee,
-                'due_date': due_date,
-                'page_url': page_url,
-                'page_title': page_title
-            })
-    
-    return action_items
+    by_assignee = {}
+    for item in action_items:
+        by_assignee.setdefault(assignee_key(item['assignee']), []).append(item)
+    return by_assignee
+
+
+def user_assignee_keys(user: Dict) -> List[str]:
+    """사용자가 회의록에 @로 적히는 이름들 (assignee_names, 없으면 name)의 비교용 키"""
+    return [assignee_key(name) for name in user.get('assignee_names') or [user['name']]]
+
+
+def build_assignee_directory(users: List[Dict]) -> Dict[str, str]:
+    """담당자 이름 → Slack ID 매핑
+    
+    사용자별 assignee_names(회의록에 @로 적히는 이름들)를 모으며, 없으면 name을 씁니다.
+    같은 이름을 여러 사용자가 등록하면 먼저 등록한 사용자에게 보냅니다.
+    """
+    
+    directory = {}
+    for user in users:
+        for key in user_assignee_keys(user):
+            owner = directory.setdefault(key, user['slack_id'])
+            if owner != user['slack_id']:
+                print(f"⚠️  담당자 이름 '{key}'이(가) 여러 사용자에게 등록되어 있습니다 ({owner}, {user['slack_id']})")
+    return directory
+
+
+def source_key(user: Dict) -> tuple:
+    """같은 회의록 목록을 보는 사용자끼리 묶기 위한 키 (공간, 상위 페이지, 자격증명)
+    
+    권한에 따라 보이는 페이지가 다를 수 있으므로 자격증명이 다르면 따로 조회합니다.
+    """
+    return (
+        user['confluence_space'],
+        user.get('confluence_parent_id') or '',
+        user['confluence_username'],
+        user['confluence_token']
+    )
 
 
 def classify_by_date(action_items: List[Dict]) -> Dict[str, List[Dict]]:
@@ -162,89 +233,206 @@ def format_slack_dm(classified: Dict[str, List[Dict]], user_name: str) -> str:
     return message
 
 
-def send_slack_dm(slack_id: str, message: str, bot_token: str) -> bool:
-    """Slack DM 전송"""
-    
-    url = "https://slack.com/api/chat.postMessage"
-    headers = {
-        "Authorization": f"Bearer {bot_token}",
-        "Content-Type": "application/json"
-    }
-    
-    payload = {
-        "channel": slack_id,
-        "text": message,
-        "mrkdwn": True
-    }
+def send_slack_dm(slack_id: str, message: str, bot_token: str) -> Dict:
+    """Slack DM 전송 (Slack 응답 반환, 성공 시 ok와 메시지 ts 포함)"""
     
+    result = default_dispatcher().post_message(slack_id, message, bot_token, mrkdwn=True)
+    if not result.get('ok'):
+        print(f"❌ Slack DM 전송 실패: {result.get('error')}")
+    return result
+
+
+def process_user(user: Dict, bot_token: str, source: Future, directory: Dict[str, str],
+                 timeout: float = None, journal: RunJournal = None) -> Dict:
+    """사용자 한 명의 파이프라인 (수집 결과 대기 → 본인 담당 항목 선택 → 분류 → DM 전송)
+
+    source는 collect_action_items()의 Future로, 같은 공간을 보는 사용자끼리 공유합니다.
+    directory(담당자 이름 → Slack ID)에서 이 사용자에게 매핑된 담당자 항목만 보냅니다.
+    timeout(초)이 지나도록 수집이 끝나지 않으면 이 사용자만 건너뛰며, 시간을 넘긴 뒤에는
+    DM을 보내지 않습니다. 공유 수집 작업 자체는 DailyDMRun이 정한 마감(budget)으로 멈춥니다. journal이 있으면 단계마다 체크포인트를 남깁니다.
+    여러 사용자를 동시에 처리하므로 출력은 바로 print하지 않고 logs에 모았다가
+    main()에서 사용자별로 한 번에 출력합니다.
+    """
+    logs = [f"\n📤 처리 중: {user['name']}"]
+    result = {"name": user['name'], "logs": logs, "sent": False, "action_items": 0, "timed_out": False}
+    deadline = time.monotonic() + timeout if timeout else None
+    
+    def checkpoint(stage: str, **fields):
+        if journal is not None:
+            journal.record(user, stage, **fields)
+    
+    def remaining():
+        return None if deadline is None else max(0.0, deadline - time.monotonic())
+    
+    step = "collect"
     try:
-        response = requests.post(url, json=payload, headers=headers, timeout=10)
-        result = response.json()
-        return result.get('ok', False)
+        # 1. 회의록 검색 + 2. 액션아이템 수집 (공간별로 한 번만 실행된 결과)
+        # 검색·조회가 실패하면 여기서 예외가 나므로, no_items는 수집이 끝까지 완료된 경우에만 남음
+        collected = source.result(timeout=remaining())
+        step = "send"
+        
+        logs.append(f"  📄 {collected['pages']}개 회의록 발견 (property {collected['from_property']}개, 본문 조회 {collected['fetched']}개)")
+        
+        # 3. 본인 담당 항목만 골라 날짜별 분류
+        my_keys = [key for key in set(user_assignee_keys(user)) if directory.get(key) == user['slack_id']]
+        my_action_items = [item for key in my_keys for item in collected["by_assignee"].get(key, [])]
+        result["action_items"] = len(my_action_items)
+        logs.append(f"  ✅ 전체 {len(collected['action_items'])}개 중 담당 액션아이템 {len(my_action_items)}개")
+        
+        classified = classify_by_date(my_action_items)
+        
+        # 4. Slack DM 생성 및 전송
+        message = format_slack_dm(classified, user['name'])
+        
+        if message:
+            if remaining() == 0:
+                raise FutureTimeoutError()
+            checkpoint("sending")
+            sent = send_slack_dm(user['slack_id'], message, bot_token)
+            result["sent"] = sent.get('ok', False)
+            if result["sent"]:
+                checkpoint("sent", ts=sent.get('ts'))
+                logs.append(f"  ✅ DM 전송 완료")
+            else:
+                checkpoint("failed", error=sent.get('error'))
+                logs.append(f"  ❌ DM 전송 실패")
+        else:
+            checkpoint("no_items")
+            logs.append(f"  ℹ️  보낼 액션아이템 없음")
+    except FutureTimeoutError:
+        result["timed_out"] = True
+        checkpoint("timed_out")
+        logs.append(f"  ⏱️  시간 초과 ({timeout:g}초): DM을 보내지 않았습니다")
     except Exception as e:
-        print(f"❌ Slack DM 전송 실패: {e}")
-        return False
+        # failed는 DONE_STAGES가 아니므로 같은 날 다시 실행하면 재시도됨
+        checkpoint("failed", error=str(e), step=step)
+        if step == "collect":
+            logs.append(f"  ❌ 회의록 수집 실패: {e}")
+        else:
+            logs.append(f"  ❌ 처리 실패: {e}")
+    
+    return result
 
 
-def main():
-    """메인 실행 함수"""
-    
-    print(f"🚀 일일 액션아이템 DM 발송 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    
-    # Slack Bot Token (환경변수 또는 config에서)
+def load_bot_token() -> str:
+    """Slack Bot Token (환경변수 또는 .env에서)"""
     import os
     from dotenv import load_dotenv
     load_dotenv()
-    bot_token = os.getenv('SLACK_BOT_TOKEN')
-    
-    if not bot_token:
-        print("❌ SLACK_BOT_TOKEN이 설정되지 않았습니다.")
-        return
-    
-    for user in dm_config.USERS:
-        print(f"\n📤 처리 중: {user['name']}")
-        
-        # 1. 회의록 검색
-        pages = search_meeting_notes(
-            user['confluence_username'],
-            user['confluence_token'],
-            user['confluence_space'],
-            user.get('confluence_parent_id')
-        )
+    return os.getenv('SLACK_BOT_TOKEN')
+
+
+class DailyDMRun:
+    """일일 DM 한 회 실행 (수집과 발송을 나눠서 호출할 수 있음)
+    
+    prefetch()는 Confluence 조회만 시작해 두고 바로 반환하며, deliver()는 해당
+    사용자들의 수집 결과를 기다려 DM을 보냅니다. 같은 공간을 보는 사용자는
+    어느 쪽에서 호출되든 한 번만 조회합니다.
+    오늘 실행 기록(RunJournal)에 이미 끝난 사용자는 조회도 발송도 하지 않습니다.
+    run_date(YYYY-MM-DD)는 실행 기록을 묶는 날짜로, 생략하면 오늘(KST)입니다.
+    """
+    
+    def __init__(self, bot_token: str, users: List[Dict] = None, run_date: str = None):
+        self.bot_token = bot_token
+        self.users = users if users is not None else dm_config.USERS
+        self.user_timeout = getattr(dm_config, 'USER_TIMEOUT_SECONDS', 120)
         
-        print(f"  📄 {len(pages)}개 회의록 발견")
+        # 사용자별 파이프라인을 동시에 실행하되, 호스트별 동시 요청 수·초당 요청 수는 제한
+        client = default_client()
+        client.limit_host(config.CONFLUENCE_URL, getattr(dm_config, 'CONFLUENCE_CONCURRENCY', 4))
+        client.limit_host(config.SLACK_API_URL, getattr(dm_config, 'SLACK_CONCURRENCY', 2))
+        client.limit_rate(config.CONFLUENCE_URL, getattr(dm_config, 'CONFLUENCE_MAX_RPS', None))
         
-        # 2. 액션아이템 수집
-        all_action_items = []
-        for page in pages:
-            page_url = f"https://woowahanbros.atlassian.net/wiki{page['_links']['webui']}"
-            page_title = page['title']
-            content = page['body']['storage']['value']
-            
-            items = parse_action_items(content, page_url, page_title)
-            all_action_items.extend(items)
+        # 검색 범위를 벗어난 페이지는 색인에서 정리
+        self.index = ActionItemIndex()
+        self.index.prune(dm_config.SEARCH_DAYS + 1)
         
-        print(f"  ✅ {len(all_action_items)}개 액션아이템 발견")
+        self.directory = build_assignee_directory(self.users)
         
-        # 3. 날짜별 분류
-        classified = classify_by_date(all_action_items)
+        # 같은 날 다시 실행하면 끝난 사용자는 건너뜀
+        self.journal = RunJournal(run_date)
+        self.journal.prune(config.DM_JOURNAL_KEEP_DAYS)
+        self.finished = self.journal.finished()
+        if self.finished:
+            print(f"⏭️  오늘 이미 처리된 사용자 {len(self.finished)}명은 건너뜁니다 ({self.journal.path})")
+        self.total = sum(1 for user in self.users if user['slack_id'] not in self.finished)
         
-        # 4. Slack DM 생성 및 전송
-        message = format_slack_dm(classified, user['name'])
+        self.executor = ThreadPoolExecutor(max_workers=getattr(dm_config, 'MAX_WORKERS', 8))
+        self.sources = {}
+        self.budgets = {}    # 수집 작업별 마감 (발송을 시작할 때 정함)
+        self.results = []
+    
+    def pending(self, users: List[Dict]) -> List[Dict]:
+        """오늘 아직 끝나지 않은 사용자"""
+        return [user for user in users if user['slack_id'] not in self.finished]
+    
+    def prefetch(self, users: List[Dict]):
+        """사용자들의 회의록 수집 시작 (같은 공간·상위 페이지·자격증명은 한 번만)"""
+        for user in self.pending(users):
+            key = source_key(user)
+            if key not in self.sources:
+                self.budgets[key] = {"deadline": None}
+                self.sources[key] = self.executor.submit(collect_action_items, user, self.index, self.budgets[key])
+    
+    def deliver(self, users: List[Dict]):
+        """수집이 끝나는 대로 DM 전송 (사용자별 결과는 설정 순서대로, 앞 사용자가 끝나는 대로 바로 출력)"""
+        # 수집 작업을 먼저 모두 제출해야 process_user가 대기하는 동안 작업 슬롯이 막히지 않음
+        users = self.pending(users)
+        self.prefetch(users)
+        # 미리 시작한 수집도 발송을 시작한 때부터 user_timeout 안에 끝나야 함 (넘기면 수집을 멈춰 슬롯을 비움)
+        if self.user_timeout:
+            deadline = time.monotonic() + self.user_timeout
+            for key in {source_key(user) for user in users}:
+                budget = self.budgets[key]
+                budget["deadline"] = max(budget["deadline"] or 0, deadline)
+        futures = [
+            self.executor.submit(
+                process_user, user, self.bot_token, self.sources[source_key(user)], self.directory,
+                self.user_timeout, self.journal
+            )
+            for user in users
+        ]
+        # 제출 순서대로 기다려야 로그 순서가 실행마다 같음 (뒤 사용자가 먼저 끝나면 앞 사용자를 기다렸다가 출력)
+        for future in futures:
+            result = future.result()
+            self.results.append(result)
+            result["logs"][0] += f" [{len(self.results)}/{self.total}]"
+            print("\n".join(result["logs"]), flush=True)
+    
+    def close(self):
+        """작업 정리 후 요약 출력"""
+        self.executor.shutdown(wait=True)
         
-        if message:
-            success = send_slack_dm(user['slack_id'], message, bot_token)
-            if success:
-                print(f"  ✅ DM 전송 완료")
-            else:
-                print(f"  ❌ DM 전송 실패")
-        else:
-            print(f"  ℹ️  보낼 액션아이템 없음")
+        sent = sum(1 for r in self.results if r["sent"])
+        timed_out = sum(1 for r in self.results if r["timed_out"])
+        print(f"\n📊 {len(self.results)}명 처리, {sent}명에게 DM 전송" + (f", {timed_out}명 시간 초과" if timed_out else ""))
+        stats = default_dispatcher().stats()
+        print(f"💬 Slack 전달 {stats['delivered']}건, 재시도 {stats['retried']}회, 버림 {stats['dropped']}건")
+
+
+def main():
+    """메인 실행 함수 (모든 사용자에게 바로 발송)"""
+    
+    print(f"🚀 일일 액션아이템 DM 발송 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
+    bot_token = load_bot_token()
+    
+    if not bot_token:
+        print("❌ SLACK_BOT_TOKEN이 설정되지 않았습니다.")
+        return
+    
+    run = DailyDMRun(bot_token)
+    
+    # 같은 공간·상위 페이지·자격증명을 보는 사용자는 한 번만 조회
+    groups = {source_key(user) for user in run.users}
+    print(f"📚 회의록 조회 {len(groups)}건 (사용자 {len(run.users)}명)")
+    
+    try:
+        run.deliver(run.users)
+    finally:
+        run.close()
     print(f"\n✅ 완료: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
 
 if __name__ == "__main__":
     main()
-
-
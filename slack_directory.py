@@ -0,0 +1,175 @@
+"""Slack 채널 디렉터리
+
+conversations.list를 cursor로 끝까지 따라가며 채널 이름 → (id, is_member) 색인을 만들고
+디스크에 TTL과 함께 저장합니다. 찾는 채널이 색인에 없을 때만 목록을 다시 훑으며,
+찾는 즉시 멈추고 그때까지 본 채널을 색인에 합칩니다.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import config
+
+
+class SlackApiError(Exception):
+    """Slack Web API가 ok=false를 반환한 경우"""
+
+    def __init__(self, error: str):
+        super().__init__(error)
+        self.error = error
+
+
+class ChannelDirectory:
+    """채널 이름/ID → {id, name, is_member} 색인"""
+
+    # 전체 목록을 막 훑은 직후에는 없는 채널을 다시 찾지 않음 (초)
+    MISS_TTL_SECONDS = 60
+
+    def __init__(self, http, bot_token: str = None, path: str = None, ttl_seconds: float = None):
+        self.http = http
+        self.bot_token = bot_token or config.SLACK_BOT_TOKEN
+        self.path = Path(path or config.SLACK_CHANNEL_CACHE_PATH)
+        self.ttl = ttl_seconds if ttl_seconds is not None else config.SLACK_CHANNEL_CACHE_TTL_SECONDS
+        self._token_key = hashlib.sha256((self.bot_token or '').encode('utf-8')).hexdigest()[:16]
+        self._lock = threading.Lock()
+        self._channels = {}  # id → {id, name, is_member, checked_at}
+        self._resume_cursor = None  # 중간에 멈춘 순회를 이어갈 위치 (메모리에만 보관)
+        self._complete_at = 0.0  # 마지막으로 목록 끝까지 훑은 시각
+        self._load()
+
+    # 저장/로드
+    def _load(self):
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        # 다른 Bot Token으로 만든 색인은 사용하지 않음
+        if data.get('token_key') == self._token_key:
+            self._channels = data.get('channels', {})
+
+    def _save(self):
+        data = {"token_key": self._token_key, "channels": self._channels}
+        try:
+            tmp_path = self.path.with_suffix('.tmp')
+            tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+            tmp_path.replace(self.path)
+        except OSError as e:
+            print(f"⚠️  채널 색인 저장 실패: {e}")
+
+    # Slack API
+    def _call(self, method: str, params: dict) -> dict:
+        response = self.http.slack(self.bot_token).get(f"{config.SLACK_API_URL}/{method}", params=params)
+        result = response.json()
+        if not result.get('ok'):
+            raise SlackApiError(result.get('error', 'unknown_error'))
+        return result
+
+    def _upsert(self, channel: dict):
+        self._channels[channel['id']] = {
+            "id": channel['id'],
+            "name": channel.get('name', ''),
+            "is_member": channel.get('is_member', False),
+            "checked_at": time.time()
+        }
+
+    def _find(self, key: str) -> Optional[dict]:
+        if key in self._channels:
+            return self._channels[key]
+        for channel in self._channels.values():
+            if channel['name'] == key:
+                return channel
+        return None
+
+    def _fresh(self, channel: dict) -> bool:
+        return time.time() - channel.get('checked_at', 0) <= self.ttl
+
+    def _walk(self, stop_at: str = None) -> Optional[dict]:
+        """conversations.list 페이지를 순회하며 색인 갱신
+
+        stop_at을 찾으면 해당 페이지까지만 반영하고 멈추며, 다음 검색은 멈춘 위치의
+        cursor부터 이어서 훑습니다 (앞부분은 이미 색인에 있으므로).
+        """
+        cursor = self._resume_cursor if stop_at else None
+        resumed = bool(cursor)
+        seen = set()
+        while True:
+            params = {"types": "public_channel,private_channel", "exclude_archived": "true", "limit": 200}
+            if cursor:
+                params["cursor"] = cursor
+            try:
+                result = self._call("conversations.list", params)
+            except SlackApiError as e:
+                # 만료된 cursor면 처음부터 다시
+                if e.error == 'invalid_cursor' and resumed:
+                    cursor, resumed = None, False
+                    continue
+                raise
+            page = result.get('channels', [])
+            for channel in page:
+                self._upsert(channel)
+                seen.add(channel['id'])
+            cursor = (result.get('response_metadata') or {}).get('next_cursor')
+
+            if stop_at:
+                for channel in page:
+                    if stop_at in (channel['id'], channel.get('name')):
+                        self._resume_cursor = cursor or None
+                        self._save()
+                        return self._channels[channel['id']]
+            if not cursor:
+                break
+
+        self._resume_cursor = None
+        self._complete_at = time.time()
+        # 처음부터 끝까지 훑었으면 더 이상 보이지 않는 채널(삭제·보관)은 제거
+        if not resumed:
+            self._channels = {cid: ch for cid, ch in self._channels.items() if cid in seen}
+        self._save()
+        return self._find(stop_at) if stop_at else None
+
+    def _recheck(self, channel: dict) -> Optional[dict]:
+        """오래되었거나 Bot이 멤버가 아닌 채널은 conversations.info 한 번으로 확인"""
+        try:
+            result = self._call("conversations.info", {"channel": channel['id']})
+        except SlackApiError as e:
+            if e.error == 'channel_not_found':
+                self._channels.pop(channel['id'], None)
+                self._save()
+                return None
+            raise
+        self._upsert(result['channel'])
+        self._save()
+        return self._channels[channel['id']]
+
+    def lookup(self, channel: str) -> Optional[dict]:
+        """채널명(#포함 가능) 또는 ID로 {id, name, is_member} 조회 (없으면 None)
+
+        Slack API 오류는 SlackApiError로 전파됩니다.
+        """
+        key = channel.strip().lstrip('#')
+        with self._lock:
+            entry = self._find(key)
+            if entry is not None:
+                if self._fresh(entry) and entry['is_member']:
+                    return dict(entry)
+                entry = self._recheck(entry)
+                # 이름이 바뀐 경우 다시 찾기
+                if entry is not None and key in (entry['id'], entry['name']):
+                    return dict(entry)
+            if self._resume_cursor is None and time.time() - self._complete_at <= self.MISS_TTL_SECONDS:
+                return None
+            found = self._walk(stop_at=key)
+            return dict(found) if found else None
+
+    def resolve_id(self, channel: str) -> str:
+        """채널명을 채널 ID로 변환 (찾지 못하거나 오류가 나면 입력값을 그대로 사용)"""
+        try:
+            entry = self.lookup(channel)
+        except Exception as e:
+            print(f"⚠️  채널 ID 조회 실패: {e}")
+            entry = None
+        return entry['id'] if entry else channel.strip().lstrip('#')
@@ -0,0 +1,134 @@
+"""Slack Web API 발송 계층
+
+메서드별 토큰 버킷으로 요청 속도를 맞추고, 429(ratelimited)를 받으면 Retry-After만큼
+해당 메서드 전체를 멈췄다가 다시 보냅니다. 재시도를 기다리는 메시지 수는
+retry_queue_size로 제한하며, 자리가 없으면 기다리지 않고 버립니다(dropped).
+
+웹 UI는 st.cache_resource로 SlackDispatcher 하나를 공유하고,
+CLI와 일일 DM 스크립트는 default_dispatcher()를 사용합니다.
+"""
+
+import threading
+import time
+
+import requests
+from urllib3.exceptions import NewConnectionError
+
+import config
+import metrics
+from http_client import TokenBucket, default_client
+
+
+def _request_not_sent(error: requests.RequestException) -> bool:
+    """요청을 보내기 전에 연결 단계에서 실패했는지 (다시 보내도 중복 게시가 되지 않는 경우)
+
+    연결 끊김(RemoteDisconnected, connection aborted 등)도 ConnectionError지만,
+    Slack이 이미 받아 처리한 뒤일 수 있으므로 여기에 포함하지 않습니다.
+    """
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(error, requests.ConnectionError) and isinstance(reason, NewConnectionError)
+
+
+class SlackDispatcher:
+    """속도 제한을 지키는 Slack Web API 호출기"""
+
+    def __init__(self, http, bot_token: str = None, rate_per_second: float = None, burst: int = None,
+                 max_retries: int = None, retry_queue_size: int = None):
+        self.http = http
+        self.bot_token = bot_token or config.SLACK_BOT_TOKEN
+        self.rate = rate_per_second or config.SLACK_RATE_PER_SECOND
+        self.burst = burst or config.SLACK_RATE_BURST
+        self.max_retries = max_retries if max_retries is not None else config.SLACK_MAX_RETRIES
+        self._retry_slots = threading.BoundedSemaphore(
+            retry_queue_size if retry_queue_size is not None else config.SLACK_RETRY_QUEUE_SIZE
+        )
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self._stats = {"delivered": 0, "retried": 0, "dropped": 0}
+
+    def _bucket(self, method: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(method)
+            if bucket is None:
+                bucket = self._buckets[method] = TokenBucket(self.rate, self.burst)
+            return bucket
+
+    def _count(self, key: str, n: int = 1):
+        with self._lock:
+            self._stats[key] += n
+
+    def _attempt(self, method: str, payload: dict, bot_token: str):
+        """한 번 호출 → (결과, 재시도 전 대기 초 또는 None)"""
+        self._bucket(method).acquire()
+        try:
+            response = self.http.slack(bot_token).post(f"{config.SLACK_API_URL}/{method}", json=payload)
+        except requests.RequestException as e:
+            # 연결 자체가 실패한 경우만 재시도 (읽기 타임아웃·연결 끊김은 이미 전송되었을 수 있어 중복 방지)
+            return {"ok": False, "error": f"request_failed: {e}"}, 1.0 if _request_not_sent(e) else None
+        metrics.note(http_status=response.status_code)
+
+        if response.status_code == 429:
+            retry_after = float(response.headers.get('Retry-After') or 1)
+            self._bucket(method).pause(retry_after)
+            return {"ok": False, "error": "ratelimited"}, retry_after
+        if response.status_code >= 500:
+            return {"ok": False, "error": f"http_{response.status_code}"}, 1.0
+        try:
+            return response.json(), None
+        except ValueError:
+            return {"ok": False, "error": f"invalid_response_{response.status_code}"}, None
+
+    def call(self, method: str, payload: dict, bot_token: str = None) -> dict:
+        """Slack API 호출 (Slack 응답 JSON 반환, 실패 시 ok=False와 error)
+
+        속도 제한·일시적 오류는 max_retries번까지 다시 보냅니다.
+        재시도 대기열이 가득 차 있으면 기다리지 않고 error="retry_queue_full"로 버립니다.
+        """
+        bot_token = bot_token or self.bot_token
+        result, wait = self._attempt(method, payload, bot_token)
+        if wait is None:
+            self._count("delivered" if result.get('ok') else "dropped")
+            return result
+
+        if not self._retry_slots.acquire(blocking=False):
+            self._count("dropped")
+            return {"ok": False, "error": "retry_queue_full"}
+        try:
+            for attempt in range(self.max_retries):
+                self._count("retried")
+                metrics.note(retries=1)
+                # 429는 Retry-After가 버킷에 반영되어 acquire()에서 기다리므로 따로 쉬지 않음
+                if result.get('error') != 'ratelimited':
+                    time.sleep(wait * (2 ** attempt))
+                result, wait = self._attempt(method, payload, bot_token)
+                if wait is None:
+                    break
+        finally:
+            self._retry_slots.release()
+
+        self._count("delivered" if result.get('ok') else "dropped")
+        return result
+
+    def post_message(self, channel: str, text: str, bot_token: str = None, **fields) -> dict:
+        """chat.postMessage"""
+        return self.call("chat.postMessage", {"channel": channel, "text": text, **fields}, bot_token)
+
+    def stats(self) -> dict:
+        """전달/재시도/버림 건수 (버림에는 재시도 후에도 실패했거나 Slack이 거절한 건 포함)"""
+        with self._lock:
+            return dict(self._stats)
+
+
+_default_dispatcher = None
+_default_lock = threading.Lock()
+
+
+def default_dispatcher() -> SlackDispatcher:
+    """프로세스 전역 SlackDispatcher (Streamlit 밖에서 사용)"""
+    global _default_dispatcher
+    with _default_lock:
+        if _default_dispatcher is None:
+            _default_dispatcher = SlackDispatcher(default_client())
+        return _default_dispatcher
@@ -0,0 +1,19 @@
+"""SQLite 파일 저장소 공통 연결 (LLM 응답 캐시, 액션아이템 색인)"""
+
+import sqlite3
+from contextlib import contextmanager
+
+
+@contextmanager
+def connect(path: str):
+    """트랜잭션으로 감싼 연결을 열고 끝나면 닫기
+
+    웹 UI·CLI·스케줄러 등 여러 프로세스가 같은 파일을 공유하므로, 연결을 오래 들고 있지 않고
+    작업마다 새로 엽니다.
+    """
+    conn = sqlite3.connect(path, timeout=10)
+    try:
+        with conn:
+            yield conn
+    finally:
+        conn.close()
@@ -1,7 +1,16 @@
 """유틸리티 함수들"""
 
+import hashlib
+import html
+import io
 import re
-import uuid
+
+
+_DUE_DATE_RE = re.compile(r'Due:\s*(\d{4}-\d{2}-\d{2})')
+
+
+def _time_tag(match) -> str:
+    return f'<time datetime="{match.group(1)}"></time>'
 
 
 def convert_due_date_to_time_tag(content: str) -> str:
@@ -10,106 +19,177 @@ def convert_due_date_to_time_tag(content: str) -> str:
     예: "작업 내용 — @김철수 — Due: 2025-10-27"
     → "작업 내용 — @김철수 — <time datetime=\"2025-10-27\"></time>"
     """
-    # Due: YYYY-MM-DD 또는 Due: TBD 패턴 찾기
-    pattern = r'Due:\s*(\d{4}-\d{2}-\d{2})'
+    # Due: TBD 등 날짜가 아닌 값은 그대로 둠
+    if 'Due:' not in content:
+        return content
+    return _DUE_DATE_RE.sub(_time_tag, content)
+
+
+# 마크다운 → Storage Format 변환용 패턴 (줄 단위로 한 번만 매칭)
+_HEADING_RE = re.compile(r'(#{1,6})\s+(.*)')
+_TASK_LINE_RE = re.compile(r'\s*[-*+]\s+\[([ xX])\]\s*(.*)')
+_LIST_ITEM_RE = re.compile(r'(\s*)([-*+]|\d+[.)])\s+(.*)')
+_RULE_RE = re.compile(r'([-*_])(?:\s*\1){2,}')
+_TABLE_SEPARATOR_RE = re.compile(r'\|?(?:\s*:?-+:?\s*\|)*\s*:?-+:?\s*\|?')
+_INLINE_RE = re.compile(r'`([^`]+)`|\*\*(.+?)\*\*')
+_CODE_RE = re.compile(r'`([^`]+)`')
+
+
+def _inline_replace(match) -> str:
+    if match.group(1) is not None:
+        return f'<code>{match.group(1)}</code>'
+    return '<strong>' + _CODE_RE.sub(_inline_replace, match.group(2)) + '</strong>'
+
+
+def _inline(text: str) -> str:
+    """HTML 이스케이프 후 **굵게**, `코드` 변환"""
+    text = html.escape(text, quote=False)
+    if '`' in text or '**' in text:
+        text = _INLINE_RE.sub(_inline_replace, text)
+    return text
+
+
+def _table_row(line: str, cell_tag: str) -> str:
+    cells = line.strip().strip('|').split('|')
+    return '<tr>' + ''.join(f'<{cell_tag}>{_inline(cell.strip())}</{cell_tag}>' for cell in cells) + '</tr>'
+
+
+def _close_lists(open_lists: list, indent: int = -1) -> str:
+    """indent보다 깊이 열린 목록 닫기"""
+    closing = ''
+    while open_lists and open_lists[-1][0] > indent:
+        closing += f'</li></{open_lists.pop()[1]}>'
+    return closing
+
+
+def iter_confluence_storage(markdown_text, task_states: dict = None):
+    """마크다운을 Confluence Storage Format 조각으로 변환하며 하나씩 반환
     
-    def replace_with_time_tag(match):
-        date = match.group(1)
-        return f'<time datetime="{date}"></time>'
+    입력을 한 번만 훑는 상태 기계로, 줄마다 변환된 조각을 바로 내보내므로 아주 긴
+    회의록도 전체 결과 목록을 쌓지 않습니다. markdown_text는 문자열이나 줄 단위
+    iterable(파일 객체 등)을 받습니다.
     
-    # Due: 날짜를 <time> 태그로 변환
-    converted = re.sub(pattern, replace_with_time_tag, content)
+    - 헤더(#~######), 구분선, 문단
+    - 들여쓰기로 중첩되는 순서 없는/있는 목록 (<ul>/<ol>)
+    - 체크박스 → <ac:task-list> (Due: YYYY-MM-DD는 <time> 태그로)
+    - 표 (두 번째 줄이 구분선이면 첫 줄을 머리글로)
+    - **굵게**, `코드`, HTML 특수문자 이스케이프
     
-    return converted
-
-
-def markdown_to_confluence_storage(markdown_text: str) -> str:
-    """마크다운을 Confluence Storage Format으로 변환"""
+    task ID는 작업 내용과 담당자로 정해지므로 다시 변환해도 같습니다. task_states
+    (task ID → 상태, read_task_states 결과)가 주어지면 그 상태를 마크다운 체크 여부보다
+    우선합니다.
+    """
+    lines = io.StringIO(markdown_text) if isinstance(markdown_text, str) else markdown_text
     
-    lines = markdown_text.split('\n')
-    result = []
-    in_task_list = False
-    task_buffer = []
+    open_lists = []      # 열린 목록 [(들여쓰기, 'ul' | 'ol')]
+    in_tasks = False
+    in_table = False
+    table_head = None    # 머리글 여부를 다음 줄에서 판단할 표 첫 줄
+    seen_task_ids = {}   # 같은 작업이 여러 번 나올 때 ID 구분용
     
     for line in lines:
-        # 헤더 변환
-        if line.startswith('# '):
-            # task-list 닫기 (필요시)
-            if in_task_list and task_buffer:
-                result.append('<ac:task-list>')
-                result.extend(task_buffer)
-                result.append('</ac:task-list>')
-                task_buffer = []
-                in_task_list = False
-            result.append(f"<h1>{line[2:].strip()}</h1>")
-        elif line.startswith('## '):
-            # task-list 닫기 (필요시)
-            if in_task_list and task_buffer:
-                result.append('<ac:task-list>')
-                result.extend(task_buffer)
-                result.append('</ac:task-list>')
-                task_buffer = []
-                in_task_list = False
-            result.append(f"<h2>{line[3:].strip()}</h2>")
-        elif line.startswith('### '):
-            # task-list 닫기 (필요시)
-            if in_task_list and task_buffer:
-                result.append('<ac:task-list>')
-                result.extend(task_buffer)
-                result.append('</ac:task-list>')
-                task_buffer = []
-                in_task_list = False
-            result.append(f"<h3>{line[4:].strip()}</h3>")
+        line = line.rstrip('\r\n')
+        stripped = line.strip()
         
-        # 체크박스 변환 (가장 중요!)
-        elif line.strip().startswith('- [ ]'):
-            # 미완료 체크박스
-            content = line.strip()[5:].strip()  # "- [ ] " 제거
-            # Due: YYYY-MM-DD를 <time> 태그로 변환
-            content = convert_due_date_to_time_tag(content)
-            task_id = str(uuid.uuid4())
-            task_buffer.append(f'<ac:task><ac:task-id>{task_id}</ac:task-id><ac:task-status>incomplete</ac:task-status><ac:task-body><span class="placeholder-inline-tasks">{content}</span></ac:task-body></ac:task>')
-            in_task_list = True
+        # 표
+        if stripped.startswith('|'):
+            if in_table:
+                yield _table_row(stripped, 'td') + '\n'
+            elif table_head is not None:
+                if _TABLE_SEPARATOR_RE.fullmatch(stripped):
+                    yield '<table><tbody>' + _table_row(table_head, 'th') + '\n'
+                else:
+                    yield '<table><tbody>' + _table_row(table_head, 'td') + _table_row(stripped, 'td') + '\n'
+                table_head = None
+                in_table = True
+            else:
+                closing = _close_lists(open_lists)
+                if in_tasks:
+                    closing += '</ac:task-list>'
+                    in_tasks = False
+                if closing:
+                    yield closing + '\n'
+                table_head = stripped
+            continue
+        if table_head is not None:
+            yield '<table><tbody>' + _table_row(table_head, 'td') + '</tbody></table>\n'
+            table_head = None
+        elif in_table:
+            yield '</tbody></table>\n'
+            in_table = False
         
-        elif line.strip().startswith('- [x]') or line.strip().startswith('- [X]'):
-            # 완료된 체크박스
-            content = line.strip()[5:].strip()  # "- [x] " 제거
-            # Due: YYYY-MM-DD를 <time> 태그로 변환
-            content = convert_due_date_to_time_tag(content)
-            task_id = str(uuid.uuid4())
-            task_buffer.append(f'<ac:task><ac:task-id>{task_id}</ac:task-id><ac:task-status>complete</ac:task-status><ac:task-body><span class="placeholder-inline-tasks">{content}</span></ac:task-body></ac:task>')
-            in_task_list = True
+        # 빈 줄은 목록·task-list를 끊지 않음
+        if not stripped:
+            continue
         
-        # 일반 리스트
-        elif line.strip().startswith('- '):
-            # task-list 닫기 (필요시)
-            if in_task_list and task_buffer:
-                result.append('<ac:task-list>')
-                result.extend(task_buffer)
-                result.append('</ac:task-list>')
-                task_buffer = []
-                in_task_list = False
-            content = line.strip()[2:]
-            result.append(f'<li>{content}</li>')
+        # 목록·체크박스·헤더·구분선이 될 수 있는 줄만 정규식 검사
+        first = stripped[0]
+        maybe_item = first in '-*+' or first.isdigit()
         
-        # 일반 텍스트
-        elif line.strip():
-            # task-list 닫기 (필요시)
-            if in_task_list and task_buffer:
-                result.append('<ac:task-list>')
-                result.extend(task_buffer)
-                result.append('</ac:task-list>')
-                task_buffer = []
-                in_task_list = False
-            result.append(f'<p>{line.strip()}</p>')
-    
-    # 마지막 task-list 닫기
-    if in_task_list and task_buffer:
-        result.append('<ac:task-list>')
-        result.extend(task_buffer)
-        result.append('</ac:task-list>')
-    
-    return '\n'.join(result)
+        # 체크박스 (가장 중요!)
+        task = _TASK_LINE_RE.match(line) if first in '-*+' else None
+        if task:
+            chunk = _close_lists(open_lists)
+            if not in_tasks:
+                chunk += '<ac:task-list>'
+                in_tasks = True
+            content = convert_due_date_to_time_tag(_inline(task.group(2).strip()))
+            task_text, assignee, _ = _parse_task_body(content)
+            task_id = _unique_task_id(task_text, assignee, seen_task_ids)
+            status = 'incomplete' if task.group(1) == ' ' else 'complete'
+            if task_states:
+                status = task_states.get(task_id, status)
+            yield chunk + f'<ac:task><ac:task-id>{task_id}</ac:task-id><ac:task-status>{status}</ac:task-status><ac:task-body><span class="placeholder-inline-tasks">{content}</span></ac:task-body></ac:task>\n'
+            continue
+        chunk = ''
+        if in_tasks:
+            chunk = '</ac:task-list>'
+            in_tasks = False
+        
+        # 목록 (구분선 "- - -", "* * *"는 제외)
+        is_rule = first in '-*_' and _RULE_RE.fullmatch(stripped) is not None
+        item = _LIST_ITEM_RE.match(line) if maybe_item and not is_rule else None
+        if item:
+            indent = len(item.group(1).expandtabs(4))
+            tag = 'ol' if item.group(2)[0].isdigit() else 'ul'
+            chunk += _close_lists(open_lists, indent)
+            if open_lists and open_lists[-1][0] == indent and open_lists[-1][1] == tag:
+                chunk += '</li><li>'
+            else:
+                if open_lists and open_lists[-1][0] == indent:
+                    chunk += f'</li></{open_lists.pop()[1]}>'
+                chunk += f'<{tag}><li>'
+                open_lists.append((indent, tag))
+            # 항목 내용 뒤에 공백이 붙지 않도록 줄바꿈 없이 이어 씀
+            yield chunk + _inline(item.group(3).strip())
+            continue
+        chunk += _close_lists(open_lists)
+        
+        # 헤더, 구분선, 일반 텍스트
+        heading = _HEADING_RE.match(line) if line[0] == '#' else None
+        if heading:
+            level = len(heading.group(1))
+            yield chunk + f'<h{level}>{_inline(heading.group(2).strip())}</h{level}>\n'
+        elif is_rule:
+            yield chunk + '<hr/>\n'
+        else:
+            yield chunk + f'<p>{_inline(stripped)}</p>\n'
+    
+    # 열린 블록 닫기
+    if table_head is not None:
+        yield '<table><tbody>' + _table_row(table_head, 'td') + '</tbody></table>\n'
+    elif in_table:
+        yield '</tbody></table>\n'
+    closing = _close_lists(open_lists)
+    if in_tasks:
+        closing += '</ac:task-list>'
+    if closing:
+        yield closing + '\n'
+
+
+def markdown_to_confluence_storage(markdown_text: str, task_states: dict = None) -> str:
+    """마크다운을 Confluence Storage Format으로 변환"""
+    return ''.join(iter_confluence_storage(markdown_text, task_states)).rstrip('\n')
 
 
 def extract_action_items_count(structured_content: str) -> tuple:
@@ -118,3 +198,351 @@ def extract_action_items_count(structured_content: str) -> tuple:
     complete = len(re.findall(r'- \[x\]', structured_content, re.IGNORECASE))
     return complete, incomplete
 
+
+
+def format_action_item_line(item: dict) -> str:
+    """액션아이템 dict를 회의록 체크박스 한 줄로 변환
+
+    예: {"task": "설계 문서 작성", "assignee": "김철수", "due": "2025/10/27"}
+    → "- [ ] 설계 문서 작성 — @김철수 — Due: 2025-10-27"
+    status가 "complete"인 항목은 "- [x]"로 씁니다.
+    """
+    task = (item.get('task') or '').strip()
+    assignee = (item.get('assignee') or '').strip() or 'TBD'
+    due = (item.get('due') or '').strip().replace('/', '-') or 'TBD'
+    mark = 'x' if item.get('status') == 'complete' else ' '
+    return f"- [{mark}] {task} — @{assignee} — Due: {due}"
+
+
+def replace_markdown_section(markdown_text: str, heading: str, body: str):
+    """'# heading' 섹션의 본문을 교체 (섹션이 없으면 None 반환)
+
+    같은 레벨 이상의 다음 헤더 직전까지를 섹션 본문으로 봅니다.
+    """
+    lines = markdown_text.split('\n')
+    heading_pattern = re.compile(r'^(#{1,6})\s*' + re.escape(heading) + r'\s*$')
+
+    for start, line in enumerate(lines):
+        match = heading_pattern.match(line.strip())
+        if not match:
+            continue
+        level = len(match.group(1))
+        end = len(lines)
+        for j in range(start + 1, len(lines)):
+            next_heading = re.match(r'^(#{1,6})\s', lines[j])
+            if next_heading and len(next_heading.group(1)) <= level:
+                end = j
+                break
+        return '\n'.join(lines[:start + 1] + [body, ''] + lines[end:]).rstrip() + '\n'
+
+    return None
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 근사치 (tiktoken 없이 계산)
+
+    영문·숫자는 약 4글자당 1토큰, 한글 등 비ASCII 문자는 글자당 약 1토큰으로 봅니다.
+    """
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    return non_ascii + (len(text) - non_ascii) // 4 + 1
+
+
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?。])\s+')
+
+
+def _split_by_characters(text: str, max_tokens: int) -> list:
+    """estimate_tokens 기준 max_tokens 이하가 되도록 글자 수로 자르기"""
+    parts = []
+    start = 0
+    non_ascii = ascii_count = 0
+    for i, ch in enumerate(text):
+        if ord(ch) > 127:
+            non_ascii += 1
+        else:
+            ascii_count += 1
+        if i > start and non_ascii + ascii_count // 4 + 1 > max_tokens:
+            parts.append(text[start:i])
+            start = i
+            non_ascii, ascii_count = (1, 0) if ord(ch) > 127 else (0, 1)
+    parts.append(text[start:])
+    return parts
+
+
+def _split_long_line(line: str, max_tokens: int) -> list:
+    """한도를 넘는 한 줄(받아쓰기 원문 등)을 문장 경계에서, 문장도 크면 글자 수로 분할"""
+    parts = []
+    current = ''
+    for sentence in _SENTENCE_END_RE.split(line):
+        if estimate_tokens(sentence) > max_tokens:
+            if current:
+                parts.append(current)
+            *full, current = _split_by_characters(sentence, max_tokens)
+            parts.extend(full)
+        elif current and estimate_tokens(current + ' ' + sentence) > max_tokens:
+            parts.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        parts.append(current)
+    return parts
+
+
+def _split_large_section(section: str, max_tokens: int) -> list:
+    """한도를 넘는 섹션을 문단 → 줄 → 문장·글자 단위로 분할
+
+    섹션 첫 줄의 헤더는 따로 한 조각이 되지 않도록 첫 조각 앞에 붙입니다
+    (그만큼 조각 한도를 줄여 나눔).
+    """
+    heading = ''
+    lines = section.split('\n', 1)
+    if lines[0].startswith('#') and len(lines) > 1 and lines[1].strip():
+        heading, section = lines
+        max_tokens = max(1, max_tokens - estimate_tokens(heading))
+
+    pieces = []
+    for paragraph in re.split(r'\n\s*\n', section):
+        if estimate_tokens(paragraph) <= max_tokens:
+            pieces.append(paragraph)
+            continue
+        for line in paragraph.split('\n'):
+            if estimate_tokens(line) <= max_tokens:
+                pieces.append(line)
+            else:
+                pieces.extend(_split_long_line(line, max_tokens))
+
+    pieces = [piece for piece in pieces if piece.strip()]
+    if heading:
+        pieces[0] = f"{heading}\n{pieces[0]}"
+    return pieces
+
+
+def split_notes_into_chunks(text: str, max_tokens: int) -> list:
+    """긴 회의 내용을 섹션·문단 경계에서 max_tokens 이하의 조각으로 분할
+
+    헤더(#)로 섹션을 나누고, 섹션이 크면 빈 줄(문단), 그래도 크면 줄 단위로 나눕니다.
+    한 줄이 한도를 넘으면(줄바꿈 없는 받아쓰기 원문 등) 문장, 그래도 크면 글자 수로 자른 뒤
+    인접한 조각을 한도 안에서 다시 묶습니다.
+    """
+    # 1. 헤더 기준 섹션 분할
+    sections = []
+    current = []
+    for line in text.split('\n'):
+        if line.startswith('#') and current:
+            sections.append('\n'.join(current))
+            current = []
+        current.append(line)
+    if current:
+        sections.append('\n'.join(current))
+
+    # 2. 너무 큰 섹션은 문단 → 줄 → 문장·글자 단위로 분할
+    pieces = []
+    for section in sections:
+        if estimate_tokens(section) <= max_tokens:
+            pieces.append(section)
+        else:
+            pieces.extend(_split_large_section(section, max_tokens))
+
+    # 3. 한도 안에서 인접 조각 묶기
+    chunks = []
+    buffer = []
+    buffer_tokens = 0
+    for piece in pieces:
+        if not piece.strip():
+            continue
+        piece_tokens = estimate_tokens(piece)
+        if buffer and buffer_tokens + piece_tokens > max_tokens:
+            chunks.append('\n\n'.join(buffer))
+            buffer = []
+            buffer_tokens = 0
+        buffer.append(piece)
+        buffer_tokens += piece_tokens
+    if buffer:
+        chunks.append('\n\n'.join(buffer))
+
+    return chunks
+
+
+def next_free_title(base_title: str, existing_titles) -> str:
+    """기존 제목 목록에서 중복되지 않는 제목 계산
+
+    base_title이 사용 중이 아니면 그대로, 사용 중이면 "base_title (2)", "(3)" … 중 가장 작은 빈 번호를 사용합니다.
+    """
+    existing_titles = set(existing_titles)
+    if base_title not in existing_titles:
+        return base_title
+
+    suffix_pattern = re.compile(re.escape(base_title) + r' \((\d+)\)$')
+    used = set()
+    for title in existing_titles:
+        match = suffix_pattern.match(title)
+        if match:
+            used.add(int(match.group(1)))
+
+    counter = 2
+    while counter in used:
+        counter += 1
+    return f"{base_title} ({counter})"
+
+
+# task-id, task-uuid 등 상태·본문 이외의 <ac:task-*> 요소
+_TASK_OTHER = r'(?:<ac:task-(?!status>|body>)[\w-]+>[^<]*</ac:task-[\w-]+>\s*)*'
+# 미완료 <ac:task> 하나 (완료 항목은 상태에서 매칭이 끝나 본문을 읽지 않음)
+# - 앱이 만드는 기본 형식이면 작업/담당자/마감일을 바로 캡처:
+#   <span ...>작업 — @담당자 — <time datetime="YYYY-MM-DD"></time></span>
+# - 그 외에는 본문 전체를 캡처 (</ac:task-body> 또는 중첩된 <ac:task-list> 직전까지,
+#   중첩 task는 이어서 따로 매칭됨)
+_INCOMPLETE_TASK_RE = re.compile(
+    r'<ac:task>\s*' + _TASK_OTHER +
+    r'<ac:task-status>\s*incomplete\s*</ac:task-status>\s*' + _TASK_OTHER +
+    r'<ac:task-body>(?:'
+    r'<span[^>]*>([^<&@]*?)\s*—\s*@([^\s—<]+)\s*—\s*<time datetime="([^"]+)"\s*/?>(?:</time>)?\s*</span>\s*</ac:task-body>'
+    r'|([^<]*(?:<(?!/ac:task-body>|ac:task-list>)[^<]*)*))'
+)
+_TIME_RE = re.compile(r'<time\b[^>]*?\bdatetime="([^"]+)"')
+_TAG_RE = re.compile(r'<[^>]+>')
+_ASSIGNEE_RE = re.compile(r'@([^\s—]+)')
+_DUE_TEXT_RE = re.compile(r'Due:\s*(\d{4}-\d{2}-\d{2})')
+_TASK_META_RE = re.compile(r'—\s*@.*?—.*')
+
+
+def _parse_task_body(content: str) -> tuple:
+    """직접 편집된 task 본문에서 (작업 내용, 담당자, 마감일) 추출
+    
+    여러 태그, 굵게·링크, HTML 엔티티가 섞인 본문용
+    """
+    
+    due_match = _TIME_RE.search(content)
+    text = _TAG_RE.sub('', content)
+    if '&' in text:
+        text = html.unescape(text)
+    if not due_match:
+        due_match = _DUE_TEXT_RE.search(text)
+    due_date = due_match.group(1) if due_match else None
+    
+    assignee_match = _ASSIGNEE_RE.search(text)
+    assignee = assignee_match.group(1) if assignee_match else 'TBD'
+    
+    # 공백 정리 후 담당자·마감일 부분 제거
+    task_text = _TASK_META_RE.sub('', ' '.join(text.split())).strip()
+    return task_text, assignee, due_date
+
+
+def parse_action_items(page_content: str, page_url: str, page_title: str) -> list:
+    """회의록에서 액션아이템 파싱
+    
+    컴파일된 패턴 하나로 미완료 <ac:task>만 한 번에 훑으며, 완료된 항목은 상태만 보고 건너뜁니다.
+    본문이 <span> 하나가 아니거나 굵게·링크 등 다른 태그가 섞여 있어도 처리하고,
+    본문 안에 중첩된 task-list가 있으면 중첩 task도 각각 읽습니다.
+    """
+    
+    action_items = []
+    
+    for task_text, assignee, due_date, content in _INCOMPLETE_TASK_RE.findall(page_content):
+        if due_date:
+            task_text = ' '.join(task_text.split())
+        else:
+            task_text, assignee, due_date = _parse_task_body(content)
+        
+        if task_text and due_date and due_date != 'TBD':
+            action_items.append({
+                'task': task_text,
+                'assignee': assignee,
+                'due_date': due_date,
+                'page_url': page_url,
+                'page_title': page_title
+            })
+    
+    return action_items
+
+
+def make_task_id(task_text: str, assignee: str) -> str:
+    """작업 내용과 담당자로 만든 고정 task ID (마감일이 바뀌어도 같음)"""
+    return hashlib.sha256(f"{task_text}\x1f{assignee}".encode('utf-8')).hexdigest()[:16]
+
+
+def _unique_task_id(task_text: str, assignee: str, seen: dict) -> str:
+    # 한 페이지에 같은 작업이 또 나오면 등장 순서대로 -2, -3 …을 붙임
+    base = make_task_id(task_text, assignee)
+    seen[base] = seen.get(base, 0) + 1
+    return base if seen[base] == 1 else f"{base}-{seen[base]}"
+
+
+# 상태와 관계없이 모든 <ac:task>의 상태와 본문
+_TASK_RE = re.compile(
+    r'<ac:task>\s*' + _TASK_OTHER +
+    r'<ac:task-status>\s*(\w+)\s*</ac:task-status>\s*' + _TASK_OTHER +
+    r'<ac:task-body>(.*?)</ac:task-body>',
+    re.DOTALL
+)
+
+
+def read_tasks(page_content: str) -> list:
+    """페이지 본문의 모든 task (완료 포함)
+    
+    ID는 저장된 task-id 대신 본문에서 다시 계산하므로, Confluence가 저장하면서
+    task-id를 바꿔도 새로 변환한 본문의 task와 맞출 수 있습니다.
+    
+    반환: [{"id", "text", "assignee", "due", "status"}, ...] (due는 없으면 None)
+    """
+    seen = {}
+    tasks = []
+    for status, content in _TASK_RE.findall(page_content):
+        task_text, assignee, due_date = _parse_task_body(content)
+        tasks.append({
+            "id": _unique_task_id(task_text, assignee, seen),
+            "text": task_text,
+            "assignee": assignee,
+            "due": due_date,
+            "status": status
+        })
+    return tasks
+
+
+def read_task_states(page_content: str) -> dict:
+    """페이지 본문의 task 상태 (task ID → 'complete' | 'incomplete')"""
+    return {task['id']: task['status'] for task in read_tasks(page_content)}
+
+
+def build_action_items_property(page_content: str, page_version: int) -> dict:
+    """페이지 content property로 저장할 액션아이템 요약
+    
+    page_version은 이 목록을 만든 본문의 버전입니다. 이후 페이지에서 체크박스를
+    바꾸면 버전이 올라가므로, 읽는 쪽은 버전이 다르면 본문을 다시 파싱합니다.
+    """
+    return {"page_version": page_version, "tasks": read_tasks(page_content)}
+
+
+def action_items_from_property(value: dict, page_url: str, page_title: str) -> list:
+    """content property에서 액션아이템 추출 (parse_action_items와 같은 형식)"""
+    action_items = []
+    for task in value.get('tasks', []):
+        due_date = task.get('due')
+        if task.get('status') != 'incomplete' or not task.get('text') or not due_date or due_date == 'TBD':
+            continue
+        action_items.append({
+            'task': task['text'],
+            'assignee': task.get('assignee') or 'TBD',
+            'due_date': due_date,
+            'page_url': page_url,
+            'page_title': page_title
+        })
+    return action_items
+
+
+_BETWEEN_TAGS_RE = re.compile(r'>\s+<')
+_EMPTY_ELEMENT_RE = re.compile(r'<([\w:-]+)([^<>]*?)\s*(?:/>|></\1>)')
+# Confluence가 저장하면서 바꾸거나 붙이는 task 메타데이터 (task-id, task-uuid 등; status·body 제외)
+_TASK_METADATA_RE = re.compile(r'<ac:task-(?!status>|body>)([\w-]+)>[^<]*</ac:task-\1>')
+_LOCAL_ID_RE = re.compile(r'\s+ac:local-id="[^"]*"')
+
+
+def normalize_storage(value: str) -> str:
+    """본문 비교용 정규화
+    
+    태그 사이 공백, <x></x>와 <x /> 표기 차이, Confluence가 붙이는 task 메타데이터
+    (task-id·task-uuid 등)와 ac:local-id 속성을 무시합니다.
+    """
+    value = _BETWEEN_TAGS_RE.sub('><', value.strip())
+    value = _LOCAL_ID_RE.sub('', _TASK_METADATA_RE.sub('', value))
+    return _EMPTY_ELEMENT_RE.sub(r'<\1\2 />', value)